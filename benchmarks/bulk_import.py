@@ -0,0 +1,192 @@
+"""Throughput of the ``import_events`` bulk importer.
+
+Writes pipeline-format ``events_to_import`` / ``news_to_import`` CSVs with
+``--rows`` rows each (10% of them repeated, as after a re-run export) and
+times:
+
+* ``parse``: streaming both CSVs into Mongo documents, in process.
+* with ``--mongodb-uri``, ``upsert``: one ``replace_one(upsert=True)`` per
+  document into indexed collections (``--upsert-rows`` of them, as the rate is
+  all that matters), and ``bulk``: the importer's unordered ``insert_many``
+  batches into empty collections followed by the index build.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.bulk_import --rows 1000000 \
+        --mongodb-uri mongodb://localhost:27017 --output bench_bulk_import.json
+"""
+
+import argparse
+import os
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+import pandas as pd
+from pymongo import MongoClient
+
+from benchmarks.harness import build_report, run_stage, write_report
+
+
+def _write_csvs(tmp: str, rows: int):
+    start = datetime(2024, 1, 1)
+    ids = [f"news-{i}" for i in range(rows)]
+    # re-exported rows: same news and event ids
+    repeated = rows // 10
+    picks = list(range(rows - repeated)) + list(range(repeated))
+    dates = [(start + timedelta(minutes=i)).isoformat() + ".000Z" for i in picks]
+    tickers = [f"T{i % 100:03d}" for i in picks]
+    titles = [f"Headline {i}" for i in picks]
+    urls = [f"https://finance.yahoo.com/news/{i}.html" for i in picks]
+    feelings = [i % 11 for i in picks]
+    event_ids = [str(uuid.uuid4()) for _ in range(rows)]
+
+    news_path = os.path.join(tmp, "news.csv")
+    pd.DataFrame(
+        {
+            "_id": [ids[i] for i in picks],
+            "date": dates,
+            "ticker": tickers,
+            "title": titles,
+            "url": urls,
+            "feeling": feelings,
+        }
+    ).to_csv(news_path, index=False)
+
+    events_path = os.path.join(tmp, "events.csv")
+    pd.DataFrame(
+        {
+            "event_id": [event_ids[i] for i in picks],
+            "occurred_at": "2025-05-03T00:00:00.000Z",
+            "aggregate_id": tickers,
+            "version": [i // 100 for i in picks],
+            "type": "ASSET_FEELING_DETECTED",
+            "url": urls,
+            "news_id": [ids[i] for i in picks],
+            "title": titles,
+            "date": dates,
+            "feeling": feelings,
+        }
+    ).to_csv(events_path, index=False)
+    return events_path, news_path
+
+
+def _sources(events_path: str, news_path: str):
+    from stock_model.importer import (
+        EVENT_COLUMNS,
+        NEWS_COLUMNS,
+        event_documents,
+        news_documents,
+    )
+
+    return [
+        ("events", events_path, EVENT_COLUMNS, event_documents),
+        ("news", news_path, NEWS_COLUMNS, news_documents),
+    ]
+
+
+def _setup_parse(events_path: str, news_path: str, batch_size: int):
+    from stock_model.importer import read_documents
+
+    def work():
+        for _, path, columns, to_documents in _sources(events_path, news_path):
+            for _ in read_documents(path, columns, to_documents, batch_size):
+                pass
+
+    return work, 2 * len(pd.read_csv(news_path, usecols=["_id"]))
+
+
+def _setup_upsert(uri: str, db_name: str, events_path: str, news_path: str, n: int):
+    from stock_api.infrastructure.repositories.mongo_event_store_repository import (
+        MongoEventStoreRepository,
+    )
+    from stock_api.infrastructure.repositories.mongo_news_read_model_repository import (
+        MongoNewsReadModelRepository,
+    )
+    from stock_model.importer import read_documents
+
+    client = MongoClient(uri)
+    client.drop_database(db_name)
+    MongoEventStoreRepository(uri, db_name).ensure_indexes()
+    MongoNewsReadModelRepository(uri, db_name).ensure_indexes()
+    db = client[db_name]
+    sources = [
+        (db[name], next(read_documents(path, columns, to_documents, n)))
+        for name, path, columns, to_documents in _sources(events_path, news_path)
+    ]
+
+    def work():
+        for coll, docs in sources:
+            for doc in docs:
+                coll.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+
+    return work, sum(len(docs) for _, docs in sources)
+
+
+def _setup_bulk(
+    uri: str, db_name: str, events_path: str, news_path: str, batch_size: int
+):
+    from stock_api.infrastructure.repositories.mongo_event_store_repository import (
+        MongoEventStoreRepository,
+    )
+    from stock_api.infrastructure.repositories.mongo_news_read_model_repository import (
+        MongoNewsReadModelRepository,
+    )
+    from stock_model.importer import bulk_insert, read_documents
+
+    client = MongoClient(uri)
+    client.drop_database(db_name)
+    db = client[db_name]
+
+    def work():
+        for name, path, columns, to_documents in _sources(events_path, news_path):
+            bulk_insert(
+                db[name], read_documents(path, columns, to_documents, batch_size)
+            )
+        MongoEventStoreRepository(uri, db_name).ensure_indexes()
+        MongoNewsReadModelRepository(uri, db_name).ensure_indexes()
+
+    return work, 2 * len(pd.read_csv(news_path, usecols=["_id"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk importer benchmark")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--upsert-rows", type=int, default=20_000)
+    parser.add_argument("--mongodb-uri", default=None)
+    parser.add_argument("--mongodb-db", default="market_feeling_import_bench")
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        events_path, news_path = _write_csvs(tmp, args.rows)
+        stages = {
+            "parse": run_stage(_setup_parse, events_path, news_path, args.batch_size)
+        }
+        if args.mongodb_uri:
+            stages["upsert"] = run_stage(
+                _setup_upsert,
+                args.mongodb_uri,
+                args.mongodb_db,
+                events_path,
+                news_path,
+                args.upsert_rows,
+            )
+            stages["bulk"] = run_stage(
+                _setup_bulk,
+                args.mongodb_uri,
+                args.mongodb_db,
+                events_path,
+                news_path,
+                args.batch_size,
+            )
+            MongoClient(args.mongodb_uri).drop_database(args.mongodb_db)
+
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "mongodb_uri")}
+    params["backend"] = "mongodb" if args.mongodb_uri else "in-process"
+    write_report(build_report("bulk_import", params, stages), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Aggregate load cost with and without snapshots at a long stream.
+
+For one ticker with ``--events`` ``ASSET_FEELING_DETECTED`` events, times
+``--loads`` aggregate loads:
+
+* ``fold_full`` / ``fold_snapshot``: building the PredictionAggregate in
+  process from the whole stream vs from a snapshot plus the events after it
+  (``--interval`` / 2 on average).
+* with ``--mongodb-uri``, ``mongo_full`` / ``mongo_snapshot``: the same through
+  ``MongoEventStoreRepository.find_by_id`` on a scratch database, including
+  the reads.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.event_store_snapshots \
+        --events 100000 --output bench_snapshots.json
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from benchmarks.harness import build_report, run_stage, write_report
+
+TICKER = "BENCH"
+
+
+def _events(n_events: int) -> List:
+    from stock_api.domain.events import DomainEvent
+
+    start = datetime(2024, 1, 1)
+    return [
+        DomainEvent(
+            event_id=f"event-{i}",
+            occurred_at=start + timedelta(minutes=i),
+            aggregate_id=TICKER,
+            version=i,
+            type="ASSET_FEELING_DETECTED",
+            payload={
+                "url": f"https://finance.yahoo.com/news/{i}.html",
+                "news_id": f"news-{i}",
+                "title": f"Headline {i}",
+                "date": start + timedelta(minutes=i),
+                "feeling": i % 11,
+            },
+        )
+        for i in range(n_events)
+    ]
+
+
+def _setup_fold_full(n_events: int, loads: int):
+    from stock_api.domain.prediction_aggregate import PredictionAggregate
+
+    events = _events(n_events)
+
+    def work():
+        for _ in range(loads):
+            PredictionAggregate.from_events(events)
+
+    return work, loads
+
+
+def _setup_fold_snapshot(n_events: int, interval: int, loads: int):
+    from stock_api.domain.prediction_aggregate import PredictionAggregate
+
+    events = _events(n_events)
+    # the latest snapshot sits on the last interval boundary
+    version = (n_events - interval // 2) // interval * interval
+    snapshot = PredictionAggregate.from_events(events[:version]).snapshot(TICKER)
+    tail = events[version:]
+
+    def work():
+        for _ in range(loads):
+            PredictionAggregate.from_snapshot(snapshot, tail)
+
+    return work, loads
+
+
+def _seed_mongo(uri: str, db_name: str, n_events: int, interval: int) -> None:
+    from pymongo import MongoClient
+
+    from stock_api.domain.prediction_aggregate import PredictionAggregate
+    from stock_api.infrastructure.repositories.mongo_event_store_repository import (
+        MongoEventStoreRepository,
+    )
+
+    client = MongoClient(uri)
+    client.drop_database(db_name)
+    repository = MongoEventStoreRepository(uri, db_name, snapshot_interval=interval)
+    repository.ensure_indexes()
+
+    events = _events(n_events)
+    now = datetime.now(timezone.utc)
+    client[db_name]["events"].insert_many(
+        [
+            {
+                "event_id": e.event_id,
+                "occurred_at": now,
+                "aggregate_id": e.aggregate_id,
+                "version": e.version,
+                "type": e.type,
+                "payload": e.payload,
+            }
+            for e in events
+        ]
+    )
+    version = (n_events - interval // 2) // interval * interval
+    snapshot = PredictionAggregate.from_events(events[:version]).snapshot(TICKER)
+    repository._save_snapshot(snapshot)
+
+
+def _setup_mongo(uri: str, db_name: str, interval: int, loads: int):
+    from stock_api.infrastructure.repositories.mongo_event_store_repository import (
+        MongoEventStoreRepository,
+    )
+
+    repository = MongoEventStoreRepository(uri, db_name, snapshot_interval=interval)
+
+    def work():
+        for _ in range(loads):
+            repository.find_by_id(TICKER)
+
+    return work, loads
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event store snapshot benchmark")
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--interval", type=int, default=100)
+    parser.add_argument("--loads", type=int, default=20)
+    parser.add_argument("--mongodb-uri", default=None)
+    parser.add_argument("--mongodb-db", default="market_feeling_snapshot_bench")
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    stages = {
+        "fold_full": run_stage(_setup_fold_full, args.events, args.loads),
+        "fold_snapshot": run_stage(
+            _setup_fold_snapshot, args.events, args.interval, args.loads
+        ),
+    }
+    if args.mongodb_uri:
+        _seed_mongo(args.mongodb_uri, args.mongodb_db, args.events, args.interval)
+        stages["mongo_full"] = run_stage(
+            _setup_mongo, args.mongodb_uri, args.mongodb_db, 0, args.loads
+        )
+        stages["mongo_snapshot"] = run_stage(
+            _setup_mongo, args.mongodb_uri, args.mongodb_db, args.interval, args.loads
+        )
+
+    for stage in stages.values():
+        stage["ms_per_load"] = round(stage["wall_s"] / args.loads * 1000, 3)
+
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "mongodb_uri")}
+    params["backend"] = "mongodb" if args.mongodb_uri else "in-process"
+    write_report(build_report("event_store_snapshots", params, stages), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_measured(setup: Callable[..., tuple], args: tuple) -> dict:
+    work, rows = setup(*args)
+    start = time.perf_counter()
+    work()
+    wall = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "wall_s": round(wall, 6),
+        "rows_per_s": round(rows / wall, 2) if wall > 0 else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 2),
+    }
+
+
+def run_stage(setup: Callable[..., tuple], *args) -> dict:
+    """Run a stage in a fresh process and return its timing and memory figures.
+
+    *setup* must be a module-level callable returning ``(work, rows)``: the
+    zero-argument callable to time and the number of rows it processes. Only
+    ``work`` is timed, while the peak RSS covers the whole process (inputs
+    included). Running each stage in its own process keeps the peak RSS of one
+    stage from leaking into the next.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(_run_measured, setup, args).result()
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(benchmark: str, params: dict, stages: dict[str, Any]) -> dict:
+    return {
+        "benchmark": benchmark,
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "stages": stages,
+    }
+
+
+def write_report(report: dict, output: Optional[str]) -> None:
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w") as fh:
+            fh.write(text + "\n")
+    print(text)
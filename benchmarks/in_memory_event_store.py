@@ -0,0 +1,131 @@
+"""Backfill and reload throughput of the in-memory event store.
+
+Replays ``--events`` news over ``--tickers`` tickers the way
+RegisterNewsCommandHandler does (load the aggregate, register the news, save)
+and times:
+
+* ``flat``: the previous store, one list filtered on every load.
+* ``indexed``: per-aggregate streams with cached folded state.
+* ``indexed_persisted``: the same, appending every event to a JSONL file.
+* ``reload``: starting a store from that JSONL file.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.in_memory_event_store \
+        --events 50000 --tickers 50 --output bench_event_store.json
+"""
+
+import argparse
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from benchmarks.harness import build_report, run_stage, write_report
+
+
+class _FlatEventStore:
+    """The previous InMemoryEventStoreRepository, kept as the baseline."""
+
+    def __init__(self):
+        self._events = []
+
+    def save(self, prediction):
+        self._events.extend(prediction.get_uncommitted_events())
+
+    def find_by_id(self, ticker):
+        from stock_api.domain.prediction_aggregate import PredictionAggregate
+
+        stream = [e for e in self._events if e.aggregate_id == ticker]
+        if not stream:
+            return PredictionAggregate.empty()
+        return PredictionAggregate.from_events(stream)
+
+
+def _news(n_events: int, n_tickers: int):
+    from stock_api.domain.news import News
+
+    start = datetime(2024, 1, 1)
+    return [
+        News(
+            f"news-{i}",
+            f"T{i % n_tickers:03d}",
+            start + timedelta(minutes=i),
+            f"Headline {i}",
+            f"https://finance.yahoo.com/news/{i}.html",
+        )
+        for i in range(n_events)
+    ]
+
+
+def _backfill(store, news) -> None:
+    for i, item in enumerate(news):
+        prediction = store.find_by_id(item.ticker)
+        prediction.register_latest_news(item, i % 11)
+        store.save(prediction)
+
+
+def _setup_backfill(kind: str, n_events: int, n_tickers: int, path: str = None):
+    from stock_api.infrastructure.repositories.in_memory_event_store_repository import (
+        InMemoryEventStoreRepository,
+    )
+
+    news = _news(n_events, n_tickers)
+    if kind == "flat":
+        store = _FlatEventStore()
+    else:
+        store = InMemoryEventStoreRepository(path)
+
+    def work():
+        _backfill(store, news)
+        if path:
+            store.close()
+
+    return work, n_events
+
+
+def _setup_reload(path: str, n_events: int):
+    from stock_api.infrastructure.repositories.in_memory_event_store_repository import (
+        InMemoryEventStoreRepository,
+    )
+
+    def work():
+        InMemoryEventStoreRepository(path).close()
+
+    return work, n_events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-memory event store benchmark")
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument(
+        "--stages", default="flat,indexed,indexed_persisted,reload", help="Subset"
+    )
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    wanted = args.stages.split(",")
+    stages = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.jsonl")
+        for kind in ("flat", "indexed"):
+            if kind in wanted:
+                stages[kind] = run_stage(
+                    _setup_backfill, kind, args.events, args.tickers
+                )
+        if "indexed_persisted" in wanted or "reload" in wanted:
+            persisted = run_stage(
+                _setup_backfill, "indexed", args.events, args.tickers, path
+            )
+            if "indexed_persisted" in wanted:
+                stages["indexed_persisted"] = persisted
+        if "reload" in wanted:
+            stages["reload"] = run_stage(_setup_reload, path, args.events)
+            stages["reload"]["file_mb"] = round(os.path.getsize(path) / 2**20, 2)
+
+    params = {k: v for k, v in vars(args).items() if k != "output"}
+    write_report(build_report("in_memory_event_store", params, stages), args.output)
+
+
+if __name__ == "__main__":
+    main()
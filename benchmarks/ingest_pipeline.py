@@ -0,0 +1,379 @@
+"""End-to-end ingest throughput of the news subscriber, split by stage.
+
+Feeds ``--messages`` synthetic NEW_LATEST_NEWS messages to
+``PubSubNewsEventSubscriber._callback`` from ``--workers`` threads (the
+subscriber's scoring pool) and reports messages/sec plus p50/p95/p99 latency
+of every stage:
+
+* ``decode``: JSON parsing and mapping to a command (the callback time not
+  spent in the command handler).
+* ``company_lookup``, ``read_model_check``, ``event_store`` (stream load and
+  append), ``publish`` and ``read_model_save``: the command handler's calls
+  to its collaborators.
+* ``scrape``, ``textblob``, ``finbert``, ``spacy`` and ``booster``: the full
+  scoring tier of JoblibPredictionModel.
+
+``unattributed`` is the end-to-end time not covered by any stage (feature
+scaling, logging, locks). Articles are served by a local stub server
+(``--article-latency-ms`` per page), repositories are in memory and events
+are published through InMemoryMessageBus. The model is ``--model-path`` or,
+by default, a booster trained on synthetic features; the analyzers are the
+real ones. The first ``--warmup`` messages are left out of the figures.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.ingest_pipeline --messages 500 \
+        --workers 4 --output bench_ingest.json
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+import numpy as np
+
+from benchmarks.harness import build_report, write_report
+
+STAGES = (
+    "decode",
+    "company_lookup",
+    "read_model_check",
+    "scrape",
+    "textblob",
+    "finbert",
+    "spacy",
+    "booster",
+    "event_store",
+    "publish",
+    "read_model_save",
+)
+
+
+class _StageTimer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.current()[stage] = self.current().get(stage, 0.0) + seconds
+        with self._lock:
+            self.samples[stage].append(seconds)
+
+    def current(self) -> Dict[str, float]:
+        """Time per stage of the message being handled on this thread."""
+        if not hasattr(self._local, "stages"):
+            self._local.stages = {}
+        return self._local.stages
+
+    def start_message(self) -> None:
+        self._local.stages = {}
+
+    def clear(self) -> None:
+        with self._lock:
+            self.samples.clear()
+
+
+class _Timed:
+    """Proxy recording the time spent in *methods* (name -> stage)."""
+
+    def __init__(self, target, timer: _StageTimer, methods: Dict[str, str]):
+        self._target = target
+        self._timer = timer
+        self._methods = methods
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        stage = self._methods.get(name)
+        if stage is None:
+            return attr
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                self._timer.record(stage, time.perf_counter() - start)
+
+        return timed
+
+
+class _Message:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.acked = None
+
+    def ack(self) -> None:
+        self.acked = True
+
+    def nack(self) -> None:
+        self.acked = False
+
+
+def _article_html(i: int, words: int) -> bytes:
+    from stock_model.synthetic import TEXT_POOL
+
+    sentences = []
+    while sum(len(s.split()) for s in sentences) < words:
+        sentences.append(TEXT_POOL[(i + len(sentences)) % 8])
+    paragraphs = "".join(
+        f"<p>{' '.join(sentences[k:k + 3])}</p>" for k in range(0, len(sentences), 3)
+    )
+    return (
+        f"<html><head><title>Headline {i}</title></head><body>"
+        f"<article><h1>Headline {i}</h1>{paragraphs}</article></body></html>"
+    ).encode("utf-8")
+
+
+def _start_article_server(words: int, latency: float) -> ThreadingHTTPServer:
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if latency > 0:
+                time.sleep(latency)
+            name = os.path.basename(self.path).split(".")[0]
+            body = _article_html(int(name) if name.isdigit() else 0, words)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _build_model(workdir: str, rows: int, trees: int, seed: int) -> str:
+    import lightgbm as lgb
+    from sklearn.preprocessing import StandardScaler
+
+    from libs.feature_builder import batch_transform
+    from libs.model_artefact import save_artefact
+    from stock_model.synthetic import make_news
+
+    X = batch_transform(make_news(rows, seed=seed))
+    y = (X["textblob_polarity"] * 5 + 5).round()
+    scaler = StandardScaler().fit(X)
+    booster = lgb.train(
+        {"objective": "regression_l1", "verbosity": -1, "seed": seed},
+        lgb.Dataset(scaler.transform(X), y),
+        num_boost_round=trees,
+    )
+    return save_artefact(
+        os.path.join(workdir, "stock_model"), booster, scaler, X.columns.tolist()
+    )
+
+
+def _messages(n: int, offset: int, tickers: List[str], base_url: str) -> List[bytes]:
+    now = datetime.now(timezone.utc)
+    messages = []
+    for i in range(offset, offset + n):
+        messages.append(
+            json.dumps(
+                {
+                    "eventId": f"event-{i}",
+                    "occurredAt": now.isoformat(),
+                    "aggregateId": f"news-{i}",
+                    "version": 1,
+                    "type": "NEW_LATEST_NEWS",
+                    "payload": {
+                        "ticker": tickers[i % len(tickers)],
+                        "date": (now - timedelta(minutes=i)).isoformat(),
+                        "title": f"Headline {i}",
+                        "url": f"{base_url}/news/{i}.html",
+                    },
+                }
+            ).encode("utf-8")
+        )
+    return messages
+
+
+def _percentiles(seconds: List[float], wall: float) -> dict:
+    if not seconds:
+        return {"calls": 0}
+    ms = np.array(seconds) * 1000
+    return {
+        "calls": len(seconds),
+        "total_s": round(float(ms.sum()) / 1000, 4),
+        # time summed over the workers, so shares add up across stages
+        "share": round(float(ms.sum()) / 1000 / wall, 4) if wall > 0 else None,
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+    }
+
+
+def _instrument(timer: _StageTimer, model, args: argparse.Namespace):
+    from stock_api.application.news.register_news_command_handler import (
+        RegisterNewsCommandHandler,
+    )
+    from stock_api.infrastructure.bus.in_memory_message_bus import InMemoryMessageBus
+    from stock_api.infrastructure.listeners.news.pubsub_news_event_subscriber import (
+        PubSubNewsEventSubscriber,
+    )
+    from stock_api.infrastructure.publishers.pubsub_event_publisher import (
+        PubSubEventPublisher,
+    )
+    from stock_api.infrastructure.repositories.in_memory_company_repository import (
+        InMemoryCompanyRepository,
+    )
+    from stock_api.infrastructure.repositories.in_memory_event_store_repository import (
+        InMemoryEventStoreRepository,
+    )
+    from stock_api.infrastructure.repositories.in_memory_news_read_model_repository import (
+        InMemoryNewsReadModelRepository,
+    )
+
+    model._scraper = _Timed(model._scraper, timer, {"scrape": "scrape"})
+    model._tb = _Timed(model._tb, timer, {"analyze": "textblob"})
+    model._fb = _Timed(model._fb, timer, {"analyze": "finbert"})
+    model._sp = _Timed(model._sp, timer, {"compute_similarity": "spacy"})
+    model._booster = _Timed(model._booster, timer, {"predict": "booster"})
+
+    bus = InMemoryMessageBus(latency=args.bus_latency_ms / 1000)
+    bus.create_subscription("bench", "news", topic="news")
+    bus.create_subscription("bench", "market-feeling", topic="market-feeling")
+    handler = RegisterNewsCommandHandler(
+        _Timed(
+            InMemoryCompanyRepository(), timer, {"find_by_ticker": "company_lookup"}
+        ),
+        model,
+        _Timed(
+            InMemoryEventStoreRepository(),
+            timer,
+            {"find_by_id": "event_store", "save": "event_store"},
+        ),
+        _Timed(
+            InMemoryNewsReadModelRepository(seed=False),
+            timer,
+            {"get": "read_model_check", "save": "read_model_save"},
+        ),
+        _Timed(
+            PubSubEventPublisher(
+                "bench", "market-feeling", client=bus.publisher_client()
+            ),
+            timer,
+            {"publish": "publish"},
+        ),
+    )
+    timed_handler = _Timed(handler, timer, {"handle": "handle"})
+    subscriber = PubSubNewsEventSubscriber(
+        timed_handler,
+        "bench",
+        "news",
+        workers=args.workers,
+        client=bus.subscriber_client(),
+    )
+    return subscriber, bus
+
+
+def _drive(subscriber, timer: _StageTimer, messages: List[bytes], workers: int):
+    latencies: List[float] = []
+    acked = [0]
+    lock = threading.Lock()
+
+    def one(data: bytes) -> None:
+        message = _Message(data)
+        timer.start_message()
+        start = time.perf_counter()
+        subscriber._callback(message)
+        elapsed = time.perf_counter() - start
+        # callback time not spent in the handler
+        timer.record("decode", elapsed - timer.current().get("handle", 0.0))
+        with lock:
+            latencies.append(elapsed)
+            acked[0] += bool(message.acked)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(one, messages))
+    return time.perf_counter() - start, latencies, acked[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end news ingest benchmark")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--article-latency-ms", type=float, default=0.0)
+    parser.add_argument("--bus-latency-ms", type=float, default=0.0)
+    parser.add_argument("--model-path", default=None)
+    parser.add_argument("--trees", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    from stock_api.infrastructure.joblib_prediction_model import (
+        JoblibPredictionModel,
+    )
+
+    model_path = args.model_path or _build_model(
+        tempfile.mkdtemp(prefix="bench_ingest_"), 20_000, args.trees, args.seed
+    )
+    model = JoblibPredictionModel(model_path)
+    server = _start_article_server(args.words, args.article_latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    timer = _StageTimer()
+    subscriber, bus = _instrument(timer, model, args)
+    tickers = ["AAPL", "MSFT", "AMZN", "GOOGL", "NVDA", "TSLA", "NFLX", "ADBE"]
+
+    warmup_published = 0
+    if args.warmup:
+        _drive(
+            subscriber,
+            timer,
+            _messages(args.warmup, args.messages, tickers, base_url),
+            args.workers,
+        )
+        timer.clear()
+        warmup_published = bus.stats("bench", "market-feeling").published
+
+    wall, latencies, acked = _drive(
+        subscriber, timer, _messages(args.messages, 0, tickers, base_url), args.workers
+    )
+    server.shutdown()
+
+    samples = timer.samples
+    busy = args.workers * wall
+    stages = {stage: _percentiles(samples.get(stage, []), busy) for stage in STAGES}
+    attributed = sum(stage.get("total_s", 0.0) for stage in stages.values())
+    end_to_end = _percentiles(latencies, busy)
+    unattributed = end_to_end.get("total_s", 0.0) - attributed
+    stages["unattributed"] = {
+        "total_s": round(unattributed, 4),
+        "share": round(unattributed / busy, 4) if busy > 0 else None,
+    }
+    published = bus.stats("bench", "market-feeling").published - warmup_published
+
+    report_stages = {
+        "end_to_end": {
+            "messages": len(latencies),
+            "acked": acked,
+            "events_published": published,
+            "wall_s": round(wall, 4),
+            "messages_per_s": round(len(latencies) / wall, 2) if wall > 0 else None,
+            **end_to_end,
+        },
+        **stages,
+    }
+    params = {k: v for k, v in vars(args).items() if k != "output"}
+    params["model_path"] = args.model_path or "synthetic"
+    write_report(build_report("ingest_pipeline", params, report_stages), args.output)
+
+
+if __name__ == "__main__":
+    main()
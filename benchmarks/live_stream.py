@@ -0,0 +1,221 @@
+"""Load test for the live feeling SSE stream.
+
+Starts the API on uvicorn in a child process, opens ``--connections`` SSE
+subscriptions (each to one of ``--assets`` assets) and reports the server's
+memory per idle connection. The server then publishes ``--events`` feelings
+at ``--rate`` per second from a worker thread, as the Pub/Sub callbacks do,
+and the report gives the delivery latency percentiles. ``--slow-clients`` of
+the connections read only once per ``--slow-read-s`` to show the bounded
+buffers dropping for them without holding up anybody else.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.live_stream --connections 2000 \
+        --output bench_live_stream.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+from datetime import datetime, timezone
+
+import httpx
+import numpy as np
+import uvicorn
+from anyio import CapacityLimiter
+from fastapi import FastAPI
+
+from benchmarks.harness import build_report, write_report
+from benchmarks.news_api_load import _wait_until_up
+from stock_api.application.news.live_feeling_hub import LiveFeeling, LiveFeelingHub
+from stock_api.domain.company import Company
+from stock_api.infrastructure.repositories.async_company_directory import (
+    AsyncCompanyDirectory,
+)
+from stock_api.infrastructure.repositories.company_directory import CompanyDirectory
+from stock_api.infrastructure.repositories.in_memory_company_repository import (
+    InMemoryCompanyRepository,
+)
+from stock_api.infrastructure.repositories.threaded_async_company_repository import (
+    ThreadedAsyncCompanyRepository,
+)
+from stock_api.presentation.live_feeling_controller import LiveFeelingController
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as fh:
+        for line in fh:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def _asset_id(i: int) -> str:
+    return f"asset-{i:03d}"
+
+
+def _serve(args: argparse.Namespace, port: int) -> None:
+    companies = InMemoryCompanyRepository()
+    for i in range(args.assets):
+        companies.save(Company(id=_asset_id(i), ticker=f"T{i:03d}", name=f"Co {i}"))
+    directory = CompanyDirectory(companies)
+    directory.load()
+
+    hub = LiveFeelingHub(buffer_size=args.buffer_size)
+    async_companies = AsyncCompanyDirectory(
+        directory, ThreadedAsyncCompanyRepository(directory, CapacityLimiter(4))
+    )
+
+    app = FastAPI()
+    app.include_router(LiveFeelingController(hub, async_companies, 15.0).router)
+
+    def publish(events: int, rate: float):
+        for i in range(events):
+            hub.publish(
+                LiveFeeling(
+                    asset_id=_asset_id(i % args.assets),
+                    news_id=f"news-{i}",
+                    title=f"Headline {i}",
+                    url=f"https://finance.yahoo.com/news/{i}.html",
+                    date=datetime.now(timezone.utc),
+                    feeling=i % 11,
+                )
+            )
+            time.sleep(1 / rate)
+
+    @app.get("/bench/stats")
+    async def stats():
+        s = hub.stats()
+        return {
+            "rss_mb": _rss_mb(),
+            "subscribers": s.subscribers,
+            "published": s.published,
+            "buffered": s.buffered,
+            "dropped": s.dropped,
+        }
+
+    @app.post("/bench/publish")
+    async def start_publishing(events: int, rate: float):
+        threading.Thread(target=publish, args=(events, rate), daemon=True).start()
+        return {"started": True}
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+async def _client(client, url, asset_id, slow_read_s, subscribed, latencies, counts):
+    async with client.stream("GET", url, params={"assetIds": asset_id}) as resp:
+        async for line in resp.aiter_lines():
+            if line.startswith(": subscribed"):
+                subscribed.release()
+            elif line.startswith("data: ") and '"feeling"' in line:
+                counts["received"] += 1
+                if not slow_read_s:
+                    # slow readers delay their own items on purpose
+                    sent = datetime.fromisoformat(json.loads(line[6:])["date"])
+                    latencies.append(
+                        (datetime.now(timezone.utc) - sent).total_seconds()
+                    )
+            elif line.startswith("event: lagged"):
+                counts["lagged"] += 1
+            if slow_read_s:
+                await asyncio.sleep(slow_read_s)
+
+
+async def _run(args: argparse.Namespace, base: str) -> dict:
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=args.connections + 10), timeout=None
+    ) as client:
+        idle_before = (await client.get(f"{base}/bench/stats")).json()
+
+        subscribed = asyncio.Semaphore(0)
+        latencies: list = []
+        counts = {"received": 0, "lagged": 0}
+        tasks = []
+        for i in range(args.connections):
+            slow = args.slow_read_s if i < args.slow_clients else 0.0
+            tasks.append(
+                asyncio.create_task(
+                    _client(
+                        client,
+                        f"{base}/news/stream",
+                        _asset_id(i % args.assets),
+                        slow,
+                        subscribed,
+                        latencies,
+                        counts,
+                    )
+                )
+            )
+        for _ in range(args.connections):
+            await subscribed.acquire()
+        idle_after = (await client.get(f"{base}/bench/stats")).json()
+
+        await client.post(
+            f"{base}/bench/publish", params={"events": args.events, "rate": args.rate}
+        )
+        await asyncio.sleep(args.events / args.rate + args.drain_s)
+        final = (await client.get(f"{base}/bench/stats")).json()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    ms = np.array(latencies) * 1000 if latencies else np.array([float("nan")])
+    connections = max(idle_after["subscribers"], 1)
+    return {
+        "idle": {
+            "subscribers": idle_after["subscribers"],
+            "server_rss_mb_before": round(idle_before["rss_mb"], 2),
+            "server_rss_mb_after": round(idle_after["rss_mb"], 2),
+            "server_kb_per_connection": round(
+                (idle_after["rss_mb"] - idle_before["rss_mb"]) * 1024 / connections, 2
+            ),
+        },
+        "delivery": {
+            "published": final["published"],
+            "buffered_by_hub": final["buffered"],
+            "dropped_by_hub": final["dropped"],
+            "received_by_clients": counts["received"],
+            "lagged_notices": counts["lagged"],
+            # latency percentiles cover the normal (not slow) clients
+            "p50_ms": round(float(np.percentile(ms, 50)), 3),
+            "p95_ms": round(float(np.percentile(ms, 95)), 3),
+            "p99_ms": round(float(np.percentile(ms, 99)), 3),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Live feeling SSE load test")
+    parser.add_argument("--connections", type=int, default=2000)
+    parser.add_argument("--assets", type=int, default=100)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=100.0)
+    parser.add_argument("--buffer-size", type=int, default=100)
+    parser.add_argument("--slow-clients", type=int, default=20)
+    parser.add_argument("--slow-read-s", type=float, default=1.0)
+    parser.add_argument("--drain-s", type=float, default=3.0)
+    parser.add_argument("--port", type=int, default=8785)
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    server = ctx.Process(target=_serve, args=(args, args.port), daemon=True)
+    server.start()
+    try:
+        base = f"http://127.0.0.1:{args.port}"
+        _wait_until_up(f"{base}/bench/stats")
+        results = asyncio.run(_run(args, base))
+    finally:
+        server.terminate()
+        server.join()
+
+    params = {k: v for k, v in vars(args).items() if k != "output"}
+    write_report(build_report("live_stream", params, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
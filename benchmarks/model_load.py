@@ -0,0 +1,86 @@
+"""Benchmark model loading: legacy joblib pickle vs native artefact directory.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.model_load --trees 1500 \
+        --output bench_model_load.json
+"""
+
+import argparse
+import os
+import tempfile
+
+import joblib
+import lightgbm as lgb
+from sklearn.preprocessing import StandardScaler
+
+from benchmarks.harness import build_report, run_stage, write_report
+
+
+def _build_model(workdir: str, rows: int, trees: int, seed: int) -> tuple[str, str]:
+    from libs.feature_builder import batch_transform
+    from libs.model_artefact import save_artefact
+    from stock_model.synthetic import make_news
+
+    X = batch_transform(make_news(rows, seed=seed))
+    y = (X["textblob_polarity"] * 5 + 5).round()
+    scaler = StandardScaler().fit(X)
+    booster = lgb.train(
+        {"objective": "regression_l1", "verbosity": -1, "seed": seed},
+        lgb.Dataset(scaler.transform(X), y),
+        num_boost_round=trees,
+    )
+
+    joblib_path = os.path.join(workdir, "stock_model.joblib")
+    joblib.dump(
+        {"model": booster, "scaler": scaler, "columns": X.columns.tolist()},
+        joblib_path,
+    )
+    native_dir = save_artefact(
+        os.path.join(workdir, "stock_model"), booster, scaler, X.columns.tolist()
+    )
+    return joblib_path, native_dir
+
+
+def _setup_load(path: str, repeats: int):
+    from libs.model_artefact import load_model
+
+    def work():
+        for _ in range(repeats):
+            load_model(path)
+
+    return work, repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model load-time benchmark")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--trees", type=int, default=1500)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_model_load_")
+    joblib_path, native_dir = _build_model(workdir, args.rows, args.trees, args.seed)
+
+    results = {
+        "joblib": run_stage(_setup_load, joblib_path, args.repeats),
+        "native": run_stage(_setup_load, native_dir, args.repeats),
+    }
+    results["joblib"]["size_bytes"] = os.path.getsize(joblib_path)
+    results["native"]["size_bytes"] = sum(
+        os.path.getsize(os.path.join(native_dir, f)) for f in os.listdir(native_dir)
+    )
+
+    params = {
+        "rows": args.rows,
+        "trees": args.trees,
+        "repeats": args.repeats,
+        "seed": args.seed,
+    }
+    write_report(build_report("model_load", params, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Check that every repository query is index-backed on a real mongod.
+
+Provisions the indexes through the repositories' ``ensure_indexes``, seeds a
+scratch database, runs ``explain()`` on each query the repositories issue and
+exits with status 1 if any winning plan contains a COLLSCAN.
+
+Usage (from the repository root, with a local mongod running):
+
+    PYTHONPATH=packages python -m benchmarks.mongo_explain \
+        --mongodb-uri mongodb://localhost:27017
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+from pymongo import MongoClient
+
+from benchmarks.harness import build_report, write_report
+from libs.dates import to_utc_datetime
+from stock_api.application.news.news_page_cursor import NewsPageCursor
+from stock_api.infrastructure.repositories.mongo_company_repository import (
+    MongoCompanyRepository,
+)
+from stock_api.infrastructure.repositories.mongo_event_store_repository import (
+    MongoEventStoreRepository,
+)
+from stock_api.infrastructure.repositories.mongo_news_read_model_repository import (
+    MongoNewsReadModelRepository,
+)
+
+
+def _stages(plan) -> Iterator[str]:
+    """Every ``stage`` name in an explain plan tree (classic or SBE)."""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for value in plan.values():
+            yield from _stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _stages(item)
+
+
+def _winning_plans(explain) -> Iterator[dict]:
+    """Every ``winningPlan`` in an explain output, including those nested in
+    aggregation stages such as ``$unionWith``."""
+    if isinstance(explain, dict):
+        for key, value in explain.items():
+            if key == "winningPlan":
+                yield value
+            else:
+                yield from _winning_plans(value)
+    elif isinstance(explain, list):
+        for item in explain:
+            yield from _winning_plans(item)
+
+
+def _seed(client: MongoClient, db_name: str, rows: int) -> None:
+    db = client[db_name]
+    now = datetime.now(timezone.utc)
+    tickers = [f"T{i:03d}" for i in range(20)]
+
+    db["companies"].insert_many(
+        [{"_id": f"asset-{t}", "ticker": t, "name": f"Company {t}"} for t in tickers]
+    )
+    db["news"].insert_many(
+        [
+            {
+                "_id": f"news-{i}",
+                "ticker": tickers[i % len(tickers)],
+                "date": now - timedelta(minutes=i),
+                "title": f"Title {i}",
+                "url": f"https://example.com/{i}",
+                "feeling": i % 11,
+            }
+            for i in range(rows)
+        ]
+    )
+    db["events"].insert_many(
+        [
+            {
+                "event_id": f"event-{i}",
+                "occurred_at": now,
+                "aggregate_id": tickers[i % len(tickers)],
+                "version": i // len(tickers),
+                "type": "ASSET_FEELING_DETECTED",
+                "payload": {},
+            }
+            for i in range(rows)
+        ]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="COLLSCAN check for Mongo queries")
+    parser.add_argument("--mongodb-uri", default="mongodb://localhost:27017")
+    parser.add_argument("--mongodb-db", default="market_feeling_explain")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch db")
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    client = MongoClient(args.mongodb_uri)
+    client.drop_database(args.mongodb_db)
+
+    news = MongoNewsReadModelRepository(args.mongodb_uri, args.mongodb_db)
+    events = MongoEventStoreRepository(args.mongodb_uri, args.mongodb_db)
+    companies = MongoCompanyRepository(args.mongodb_uri, args.mongodb_db)
+    for repository in (news, events, companies):
+        repository.ensure_indexes()
+    _seed(client, args.mongodb_db, args.rows)
+
+    now = datetime.now(timezone.utc)
+    cursors = {
+        "news.get": news._coll.find({"_id": "news-1"}),
+        "news.get_latest_news_for_ticker": news._latest_cursor("T001", 50),
+        "news.get_by_date_range": news._date_range_cursor(
+            "T001", now - timedelta(days=1), now
+        ),
+        "news.get_page": news._page_cursor(
+            "T001",
+            now - timedelta(days=1),
+            now,
+            100,
+            NewsPageCursor(to_utc_datetime(now - timedelta(minutes=10)), "news-10"),
+        ),
+        "events.find_by_id": events._stream_cursor("T001"),
+        "companies.find_by_ticker": companies._coll.find({"ticker": "T001"}),
+        "companies.find_by_asset_id": companies._coll.find({"_id": "asset-T001"}),
+    }
+
+    explains = {name: cursor.explain() for name, cursor in cursors.items()}
+    explains["news.get_latest_news_for_tickers"] = client[args.mongodb_db].command(
+        "explain",
+        {
+            "aggregate": "news",
+            "pipeline": news._latest_pipeline(["T001", "T002", "T003"], 20),
+            "cursor": {},
+        },
+    )
+
+    results = {}
+    for name, explain in explains.items():
+        stages = sorted(set(_stages(list(_winning_plans(explain)))))
+        results[name] = {"stages": stages, "collscan": "COLLSCAN" in stages}
+
+    if not args.keep:
+        client.drop_database(args.mongodb_db)
+
+    params = {"rows": args.rows, "mongodb_db": args.mongodb_db}
+    write_report(build_report("mongo_explain", params, results), args.output)
+
+    failed = [name for name, r in results.items() if r["collscan"]]
+    if failed:
+        print(f"COLLSCAN in: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
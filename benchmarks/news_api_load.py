@@ -0,0 +1,247 @@
+"""Load test for GET /news under concurrency.
+
+Starts the news API on uvicorn in a child process and fires concurrent requests,
+reporting requests/sec and latency percentiles. Two read paths are compared:
+
+* ``threaded``: the production wiring, blocking lookups run in worker threads.
+* ``blocking``: lookups run inline on the event loop (the previous behaviour).
+
+By default the in-memory repositories are used, each call sleeping
+``--latency-ms`` to stand in for a Mongo round trip. Pass ``--mongodb-uri``
+to run against a local mongod instead.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.news_api_load --concurrency 32 \
+        --requests 5000 --output bench_news_api.json
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from typing import List, Optional
+
+import httpx
+import numpy as np
+import uvicorn
+from anyio import CapacityLimiter
+from fastapi import FastAPI
+
+from benchmarks.harness import build_report, write_report
+from stock_api.application.news.async_news_read_model_repository import (
+    AsyncNewsReadModelRepository,
+)
+from stock_api.application.news.get_news_query_handler import GetNewsQueryHandler
+from stock_api.domain.async_company_repository import AsyncCompanyRepository
+from stock_api.infrastructure.http_exception_handler import HttpExceptionHandler
+from stock_api.infrastructure.repositories.in_memory_company_repository import (
+    InMemoryCompanyRepository,
+)
+from stock_api.infrastructure.repositories.in_memory_news_read_model_repository import (
+    InMemoryNewsReadModelRepository,
+)
+from stock_api.infrastructure.repositories.threaded_async_company_repository import (
+    ThreadedAsyncCompanyRepository,
+)
+from stock_api.infrastructure.repositories.threaded_async_news_read_model_repository import (
+    ThreadedAsyncNewsReadModelRepository,
+)
+from stock_api.presentation.get_news_controller import GetNewsController
+
+
+class _SlowProxy:
+    """Wraps a repository and blocks for *latency* seconds on every call."""
+
+    def __init__(self, target, latency: float):
+        self._target = target
+        self._latency = latency
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+
+        def call(*args, **kwargs):
+            time.sleep(self._latency)
+            return attr(*args, **kwargs)
+
+        return call
+
+
+class _InlineCompanyRepository(AsyncCompanyRepository):
+    def __init__(self, repository):
+        self._repository = repository
+
+    async def exists(self, id):
+        return self._repository.exists(id)
+
+    async def get_all(self):
+        return self._repository.get_all()
+
+    async def find_by_ticker(self, ticker):
+        return self._repository.find_by_ticker(ticker)
+
+    async def find_by_asset_id(self, asset_id):
+        return self._repository.find_by_asset_id(asset_id)
+
+    async def find_by_asset_ids(self, asset_ids):
+        return self._repository.find_by_asset_ids(asset_ids)
+
+
+class _InlineNewsReadModelRepository(AsyncNewsReadModelRepository):
+    def __init__(self, repository):
+        self._repository = repository
+
+    async def get(self, news_id):
+        return self._repository.get(news_id)
+
+    async def get_by_date_range(self, ticker, start_date, end_date):
+        return self._repository.get_by_date_range(ticker, start_date, end_date)
+
+    async def get_latest_news_for_ticker(self, ticker, limit):
+        return self._repository.get_latest_news_for_ticker(ticker, limit)
+
+    async def get_latest_news_for_tickers(self, tickers, limit):
+        return self._repository.get_latest_news_for_tickers(tickers, limit)
+
+    async def get_page(self, ticker, start, end, limit, after=None):
+        return self._repository.get_page(ticker, start, end, limit, after)
+
+
+def _repositories(mongodb_uri: Optional[str], db_name: str, latency: float):
+    if mongodb_uri:
+        from stock_api.infrastructure.repositories.mongo_company_repository import (
+            MongoCompanyRepository,
+        )
+        from stock_api.infrastructure.repositories.mongo_news_read_model_repository import (
+            MongoNewsReadModelRepository,
+        )
+
+        return (
+            MongoNewsReadModelRepository(mongodb_uri, db_name),
+            MongoCompanyRepository(mongodb_uri, db_name),
+        )
+
+    return (
+        _SlowProxy(InMemoryNewsReadModelRepository(), latency),
+        _SlowProxy(InMemoryCompanyRepository(), latency),
+    )
+
+
+def _build_app(mode: str, read_model, company_repo, read_concurrency: int) -> FastAPI:
+    if mode == "threaded":
+        limiter = CapacityLimiter(read_concurrency)
+        handler = GetNewsQueryHandler(
+            ThreadedAsyncNewsReadModelRepository(read_model, limiter),
+            ThreadedAsyncCompanyRepository(company_repo, limiter),
+        )
+    else:
+        handler = GetNewsQueryHandler(
+            _InlineNewsReadModelRepository(read_model),
+            _InlineCompanyRepository(company_repo),
+        )
+
+    app = FastAPI()
+    HttpExceptionHandler(app)
+    app.include_router(GetNewsController(handler).router)
+    return app
+
+
+async def _drive(url: str, params: dict, concurrency: int, total: int) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=concurrency), timeout=60
+    ) as client:
+
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                start = time.perf_counter()
+                resp = await client.get(url, params=params)
+                latencies.append(time.perf_counter() - start)
+                if resp.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+    return {
+        "requests": total,
+        "errors": errors,
+        "wall_s": round(wall, 4),
+        "requests_per_s": round(total / wall, 2),
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+        "max_ms": round(float(ms.max()), 3),
+    }
+
+
+def _serve(mode: str, args: argparse.Namespace, port: int) -> None:
+    read_model, company_repo = _repositories(
+        args.mongodb_uri, args.mongodb_db, args.latency_ms / 1000
+    )
+    app = _build_app(mode, read_model, company_repo, args.read_concurrency)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _wait_until_up(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server at {url} did not start")
+
+
+def _run_mode(mode: str, args: argparse.Namespace, port: int) -> dict:
+    # The server gets its own process so the load generator does not compete
+    # with it for the GIL.
+    ctx = multiprocessing.get_context("spawn")
+    server = ctx.Process(target=_serve, args=(mode, args, port), daemon=True)
+    server.start()
+
+    try:
+        params = {"assetId": args.asset_id, "limit": args.limit}
+        url = f"http://127.0.0.1:{port}/news"
+        _wait_until_up(url)
+        asyncio.run(_drive(url, params, args.concurrency, args.warmup))
+        return asyncio.run(_drive(url, params, args.concurrency, args.requests))
+    finally:
+        server.terminate()
+        server.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GET /news load test")
+    parser.add_argument("--modes", default="blocking,threaded")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=10.0)
+    parser.add_argument("--read-concurrency", type=int, default=40)
+    parser.add_argument("--asset-id", default="AAPL")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--mongodb-uri", default=None)
+    parser.add_argument("--mongodb-db", default="market_feeling")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    results = {}
+    for i, mode in enumerate(args.modes.split(",")):
+        results[mode] = _run_mode(mode, args, args.port + i)
+
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "mongodb_uri")}
+    params["backend"] = "mongodb" if args.mongodb_uri else "in-memory"
+    write_report(build_report("news_api_load", params, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Batch news endpoint vs one GET /news call per asset.
+
+Starts the API on uvicorn in a child process with ``--assets`` companies, each
+with news, and loads a "dashboard" of every asset ``--dashboards`` times:
+
+* ``single``: one ``GET /news`` per asset, ``--concurrency`` in flight at once.
+* ``batch``: one ``GET /news/batch`` for all assets.
+
+The in-memory repositories sleep ``--latency-ms`` per call to stand in for a
+Mongo round trip, and the query cache is off so every load reads the
+repositories. Pass ``--mongodb-uri`` to seed and use a local mongod instead.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.news_batch --assets 100 \
+        --output bench_news_batch.json
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+import httpx
+import numpy as np
+import uvicorn
+from anyio import CapacityLimiter
+from fastapi import FastAPI
+
+from benchmarks.harness import build_report, write_report
+from benchmarks.news_api_load import _SlowProxy, _wait_until_up
+from stock_api.application.news.get_news_batch_query_handler import (
+    GetNewsBatchQueryHandler,
+)
+from stock_api.application.news.get_news_query_handler import GetNewsQueryHandler
+from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.domain.company import Company
+from stock_api.infrastructure.http_exception_handler import HttpExceptionHandler
+from stock_api.infrastructure.repositories.in_memory_company_repository import (
+    InMemoryCompanyRepository,
+)
+from stock_api.infrastructure.repositories.in_memory_news_read_model_repository import (
+    InMemoryNewsReadModelRepository,
+)
+from stock_api.infrastructure.repositories.threaded_async_company_repository import (
+    ThreadedAsyncCompanyRepository,
+)
+from stock_api.infrastructure.repositories.threaded_async_news_read_model_repository import (
+    ThreadedAsyncNewsReadModelRepository,
+)
+from stock_api.presentation.get_news_batch_controller import GetNewsBatchController
+from stock_api.presentation.get_news_controller import GetNewsController
+
+
+def _asset_ids(n_assets: int) -> List[str]:
+    return [f"asset-{i:03d}" for i in range(n_assets)]
+
+
+def _repositories(args: argparse.Namespace):
+    if args.mongodb_uri:
+        from stock_api.infrastructure.repositories.mongo_company_repository import (
+            MongoCompanyRepository,
+        )
+        from stock_api.infrastructure.repositories.mongo_news_read_model_repository import (
+            MongoNewsReadModelRepository,
+        )
+
+        read_model = MongoNewsReadModelRepository(args.mongodb_uri, args.mongodb_db)
+        company_repo = MongoCompanyRepository(args.mongodb_uri, args.mongodb_db)
+        read_model.ensure_indexes()
+        company_repo.ensure_indexes()
+    else:
+        read_model = InMemoryNewsReadModelRepository(seed=False)
+        company_repo = InMemoryCompanyRepository()
+
+    now = datetime.utcnow()
+    for i, asset_id in enumerate(_asset_ids(args.assets)):
+        ticker = f"T{i:03d}"
+        company_repo.save(Company(id=asset_id, ticker=ticker, name=f"Company {i}"))
+        for j in range(args.news_per_asset):
+            read_model.save(
+                LatestNews(
+                    id=f"{ticker}-{j}",
+                    ticker=ticker,
+                    date=now - timedelta(hours=j),
+                    title=f"{ticker} headline {j}",
+                    url=f"https://finance.yahoo.com/news/{ticker}-{j}.html",
+                    feeling=j % 11,
+                )
+            )
+
+    if args.mongodb_uri:
+        return read_model, company_repo
+    latency = args.latency_ms / 1000
+    return _SlowProxy(read_model, latency), _SlowProxy(company_repo, latency)
+
+
+def _serve(args: argparse.Namespace, port: int) -> None:
+    read_model, company_repo = _repositories(args)
+    limiter = CapacityLimiter(args.read_concurrency)
+    async_read_model = ThreadedAsyncNewsReadModelRepository(read_model, limiter)
+    async_company_repo = ThreadedAsyncCompanyRepository(company_repo, limiter)
+
+    app = FastAPI()
+    HttpExceptionHandler(app)
+    app.include_router(
+        GetNewsController(
+            GetNewsQueryHandler(async_read_model, async_company_repo)
+        ).router
+    )
+    app.include_router(
+        GetNewsBatchController(
+            GetNewsBatchQueryHandler(async_read_model, async_company_repo)
+        ).router
+    )
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+async def _single(client, base: str, asset_ids: List[str], args) -> None:
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(asset_id: str):
+        async with semaphore:
+            resp = await client.get(
+                f"{base}/news", params={"assetId": asset_id, "limit": args.limit}
+            )
+            resp.raise_for_status()
+
+    await asyncio.gather(*(one(a) for a in asset_ids))
+
+
+async def _batch(client, base: str, asset_ids: List[str], args) -> None:
+    resp = await client.get(
+        f"{base}/news/batch",
+        params={"assetIds": ",".join(asset_ids), "limit": args.limit},
+    )
+    resp.raise_for_status()
+
+
+async def _measure(mode: str, base: str, args) -> dict:
+    load = _single if mode == "single" else _batch
+    asset_ids = _asset_ids(args.assets)
+    latencies = []
+
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=args.concurrency), timeout=120
+    ) as client:
+        await load(client, base, asset_ids, args)  # warm-up
+        for _ in range(args.dashboards):
+            start = time.perf_counter()
+            await load(client, base, asset_ids, args)
+            latencies.append(time.perf_counter() - start)
+
+    ms = np.array(latencies) * 1000
+    return {
+        "dashboards": args.dashboards,
+        "http_requests_per_dashboard": len(asset_ids) if mode == "single" else 1,
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "max_ms": round(float(ms.max()), 3),
+        "dashboards_per_s": round(len(ms) / (ms.sum() / 1000), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch vs single /news benchmark")
+    parser.add_argument("--assets", type=int, default=100)
+    parser.add_argument("--news-per-asset", type=int, default=60)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--dashboards", type=int, default=30)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--read-concurrency", type=int, default=40)
+    parser.add_argument("--mongodb-uri", default=None)
+    parser.add_argument("--mongodb-db", default="market_feeling_batch_bench")
+    parser.add_argument("--port", type=int, default=8775)
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    server = ctx.Process(target=_serve, args=(args, args.port), daemon=True)
+    server.start()
+    try:
+        base = f"http://127.0.0.1:{args.port}"
+        _wait_until_up(f"{base}/news")
+        results = {
+            mode: asyncio.run(_measure(mode, base, args))
+            for mode in ("single", "batch")
+        }
+    finally:
+        server.terminate()
+        server.join()
+
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "mongodb_uri")}
+    params["backend"] = "mongodb" if args.mongodb_uri else "in-memory"
+    write_report(build_report("news_batch", params, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Scoring work saved by coalescing duplicate news.
+
+Registers ``--news`` news through RegisterNewsCommandHandler, each delivered
+``--duplicates`` times at once from ``--threads`` threads (redeliveries and
+duplicate scrapes), and every ``--same-url-every``-th one under a new id for
+an URL already seen. The model is a stand-in that sleeps ``--score-ms`` per
+call. Reports wall time and model calls with and without SingleFlight.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.news_dedup --news 200 --duplicates 4 \
+        --output bench_news_dedup.json
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from benchmarks.harness import build_report, write_report
+
+
+class _SlowModel:
+    def __init__(self, latency: float):
+        self._latency = latency
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def get_prediction_from_url(self, url: str, company_name: str):
+        from stock_api.domain.raw_feeling import RawFeeling
+
+        with self._lock:
+            self.calls += 1
+        time.sleep(self._latency)
+        return RawFeeling(len(url) % 11)
+
+
+class _NullPublisher:
+    def publish(self, events, asset_id):
+        pass
+
+
+def _commands(n_news: int, duplicates: int, same_url_every: int):
+    from stock_api.application.news.register_news_command_handler import (
+        RegisterNewsCommand,
+    )
+
+    start = datetime(2024, 1, 1)
+    commands = []
+    for i in range(n_news):
+        url_id = i - 1 if same_url_every and i % same_url_every == 0 and i else i
+        command = RegisterNewsCommand(
+            id=f"news-{i}",
+            ticker="AAPL",
+            date=start + timedelta(minutes=i),
+            title=f"Headline {i}",
+            url=f"https://finance.yahoo.com/news/{url_id}.html",
+        )
+        commands.extend([command] * duplicates)
+    return commands
+
+
+def _run(coalesce: bool, args: argparse.Namespace) -> dict:
+    from stock_api.application.news.register_news_command_handler import (
+        RegisterNewsCommandHandler,
+    )
+    from stock_api.application.news.single_flight import SingleFlight
+    from stock_api.infrastructure.repositories.in_memory_company_repository import (
+        InMemoryCompanyRepository,
+    )
+    from stock_api.infrastructure.repositories.in_memory_event_store_repository import (
+        InMemoryEventStoreRepository,
+    )
+    from stock_api.infrastructure.repositories.in_memory_news_read_model_repository import (
+        InMemoryNewsReadModelRepository,
+    )
+
+    model = _SlowModel(args.score_ms / 1000)
+    event_store = InMemoryEventStoreRepository()
+    handler = RegisterNewsCommandHandler(
+        InMemoryCompanyRepository(),
+        model,
+        event_store,
+        InMemoryNewsReadModelRepository(seed=False),
+        _NullPublisher(),
+        single_flight=SingleFlight() if coalesce else None,
+    )
+    commands = _commands(args.news, args.duplicates, args.same_url_every)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(handler.handle, commands))
+    wall = time.perf_counter() - start
+
+    return {
+        "deliveries": len(commands),
+        "model_calls": model.calls,
+        "events": event_store.find_by_id("AAPL").version,
+        "wall_s": round(wall, 4),
+        "deliveries_per_s": round(len(commands) / wall, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Duplicate news coalescing")
+    parser.add_argument("--news", type=int, default=200)
+    parser.add_argument("--duplicates", type=int, default=4)
+    parser.add_argument("--same-url-every", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--score-ms", type=float, default=50.0)
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    stages = {
+        "plain": _run(False, args),
+        "single_flight": _run(True, args),
+    }
+
+    params = {k: v for k, v in vars(args).items() if k != "output"}
+    write_report(build_report("news_dedup", params, stages), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Benchmark the in-memory news read model on a large backfill.
+
+Writes a synthetic ``news_to_import_*.csv`` in the pipeline's format, then
+times in separate processes: the CSV bulk load, one-by-one ``save`` calls,
+top-k and one-day range queries on the bisect indexes, and the same top-k
+query done the previous way (scan every item and sort the matches).
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.news_read_model --rows 1000000 \
+        --output bench_news_read_model.json
+"""
+
+import argparse
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.harness import build_report, run_stage, write_report
+
+START = datetime(2024, 1, 1)
+
+
+def _tickers(n_tickers: int) -> list[str]:
+    return [f"T{i:04d}" for i in range(n_tickers)]
+
+
+def write_csv(path: str, n_rows: int, n_tickers: int, n_days: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    seconds = rng.integers(0, n_days * 86400, size=n_rows)
+    dates = pd.Timestamp(START) + pd.to_timedelta(seconds, unit="s")
+    ids = [f"{i:032x}" for i in range(n_rows)]
+    pd.DataFrame(
+        {
+            "_id": ids,
+            "date": dates.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "ticker": np.array(_tickers(n_tickers))[rng.integers(0, n_tickers, n_rows)],
+            "title": [f"Shares move after analyst note {i}" for i in range(n_rows)],
+            "url": [f"https://finance.yahoo.com/news/note-{i}.html" for i in ids],
+            "feeling": rng.integers(0, 11, n_rows),
+        }
+    ).to_csv(path, index=False)
+
+
+def _loaded(path: str):
+    from stock_api.infrastructure.repositories.in_memory_news_read_model_repository import (
+        InMemoryNewsReadModelRepository,
+    )
+
+    repository = InMemoryNewsReadModelRepository(seed=False)
+    repository.load_csv(path)
+    return repository
+
+
+def _setup_load_csv(path: str, n_rows: int):
+    from stock_api.infrastructure.repositories.in_memory_news_read_model_repository import (
+        InMemoryNewsReadModelRepository,
+    )
+
+    def work():
+        InMemoryNewsReadModelRepository(seed=False).load_csv(path)
+
+    return work, n_rows
+
+
+def _setup_save(path: str, n_rows: int):
+    from stock_api.infrastructure.repositories.in_memory_news_read_model_repository import (
+        InMemoryNewsReadModelRepository,
+    )
+
+    items = list(_loaded(path)._storage.values())
+    repository = InMemoryNewsReadModelRepository(seed=False)
+
+    def work():
+        for news in items:
+            repository.save(news)
+
+    return work, n_rows
+
+
+def _setup_latest(path: str, n_tickers: int, queries: int, limit: int):
+    repository = _loaded(path)
+    tickers = _tickers(n_tickers)
+
+    def work():
+        for i in range(queries):
+            repository.get_latest_news_for_ticker(tickers[i % n_tickers], limit)
+
+    return work, queries
+
+
+def _setup_range(path: str, n_tickers: int, n_days: int, queries: int):
+    repository = _loaded(path)
+    tickers = _tickers(n_tickers)
+
+    def work():
+        for i in range(queries):
+            day = (START + timedelta(days=i % n_days)).date()
+            repository.get_by_date_range(tickers[i % n_tickers], day, day)
+
+    return work, queries
+
+
+def _setup_scan_latest(path: str, n_tickers: int, queries: int, limit: int):
+    storage = _loaded(path)._storage
+    tickers = _tickers(n_tickers)
+
+    def work():
+        for i in range(queries):
+            ticker = tickers[i % n_tickers]
+            matches = [news for news in storage.values() if news.ticker == ticker]
+            matches.sort(key=lambda n: n.date, reverse=True)
+            matches[:limit]
+
+    return work, queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-memory news read model benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--scan-queries", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "news_to_import_merged.csv")
+        write_csv(path, args.rows, args.tickers, args.days, args.seed)
+
+        stages = {
+            "load_csv": run_stage(_setup_load_csv, path, args.rows),
+            "save": run_stage(_setup_save, path, args.rows),
+            "latest": run_stage(
+                _setup_latest, path, args.tickers, args.queries, args.limit
+            ),
+            "range_one_day": run_stage(
+                _setup_range, path, args.tickers, args.days, args.queries
+            ),
+            "scan_latest": run_stage(
+                _setup_scan_latest, path, args.tickers, args.scan_queries, args.limit
+            ),
+        }
+
+    params = {k: v for k, v in vars(args).items() if k != "output"}
+    write_report(build_report("news_read_model", params, stages), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Serialization cost of one GET /news response.
+
+Times the per-response work after the repository returns, for ``--items``
+news rows, over ``--responses`` responses:
+
+* ``pydantic``: the previous path. Full Mongo documents become ``LatestNews``,
+  then ``NewsItem``, then ``NewsItemDTO``, which FastAPI validates against
+  ``response_model`` and encodes with ``jsonable_encoder`` and ``json``.
+* ``fast``: projected documents become ``LatestNews`` and ``NewsItem``, which
+  are turned into plain rows and encoded by ``FastJSONResponse`` (orjson).
+* ``fast_stdlib_json``: the same path with the stdlib ``json`` fallback used
+  when orjson is not installed.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.news_serialization --output bench_news_json.json
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from benchmarks.harness import build_report, run_stage, write_report
+from stock_api.application.news.get_news_query_handler import NewsItem
+from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.presentation import fast_json_response
+from stock_api.presentation.get_news_controller import NewsItemDTO, news_item_row
+
+PROJECTED = ("_id", "ticker", "date", "title", "url", "feeling")
+
+
+def _documents(n_items: int) -> List[dict]:
+    now = datetime(2025, 1, 1, 12)
+    return [
+        {
+            "_id": f"9b2c6a40-4f1e-5b8a-9c7d-{i:012d}",
+            "ticker": "AAPL",
+            "date": now - timedelta(minutes=17 * i),
+            "title": f"Apple shares move after analyst note number {i}",
+            "url": f"https://finance.yahoo.com/news/apple-shares-analyst-{i}.html",
+            "feeling": i % 11,
+            # fields a full document carries but the API never returns
+            "text": "Lorem ipsum dolor sit amet. " * 40,
+            "source": "gdelt",
+            "scraped_at": now,
+        }
+        for i in range(n_items)
+    ]
+
+
+def _latest_news(docs: List[dict]) -> List[LatestNews]:
+    return [
+        LatestNews(
+            id=doc["_id"],
+            ticker=doc["ticker"],
+            date=doc["date"],
+            title=doc["title"],
+            url=doc["url"],
+            feeling=doc["feeling"],
+        )
+        for doc in docs
+    ]
+
+
+def _news_items(latest: List[LatestNews]) -> List[NewsItem]:
+    return [
+        NewsItem(title=n.title, date=n.date, url=n.url, asset_id="AAPL") for n in latest
+    ]
+
+
+def _setup_pydantic(n_items: int, n_responses: int):
+    docs = _documents(n_items)
+    field = create_response_field(name="news", type_=List[NewsItemDTO])
+
+    async def respond_all():
+        for _ in range(n_responses):
+            items = _news_items(_latest_news(docs))
+            dtos = [
+                NewsItemDTO(
+                    title=item.title,
+                    date=item.date,
+                    url=item.url,
+                    assetId=item.asset_id,
+                )
+                for item in items
+            ]
+            content = await serialize_response(field=field, response_content=dtos)
+            JSONResponse(content).body
+
+    def work():
+        asyncio.run(respond_all())
+
+    return work, n_items * n_responses
+
+
+def _setup_fast(n_items: int, n_responses: int, use_orjson: bool = True):
+    if not use_orjson:
+        fast_json_response.orjson = None
+    docs = [{k: doc[k] for k in PROJECTED} for doc in _documents(n_items)]
+
+    def work():
+        for _ in range(n_responses):
+            items = _news_items(_latest_news(docs))
+            fast_json_response.FastJSONResponse(
+                [news_item_row(item) for item in items]
+            ).body
+
+    return work, n_items * n_responses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GET /news serialization benchmark")
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--responses", type=int, default=5000)
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    stages = {
+        "pydantic": run_stage(_setup_pydantic, args.items, args.responses),
+        "fast": run_stage(_setup_fast, args.items, args.responses),
+        "fast_stdlib_json": run_stage(_setup_fast, args.items, args.responses, False),
+    }
+    for stage in stages.values():
+        stage["us_per_response"] = round(stage["wall_s"] / args.responses * 1e6, 2)
+
+    base = stages["pydantic"]["us_per_response"]
+    for stage in stages.values():
+        stage["speedup"] = round(base / stage["us_per_response"], 2)
+
+    params = {
+        "items": args.items,
+        "responses": args.responses,
+        "orjson": fast_json_response.orjson is not None,
+    }
+    write_report(build_report("news_serialization", params, stages), args.output)
+
+
+if __name__ == "__main__":
+    main()
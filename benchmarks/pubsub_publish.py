@@ -0,0 +1,227 @@
+"""Publish throughput of PubSubEventPublisher.
+
+Publishes ``--events`` ASSET_FEELING_DETECTED events over ``--tickers``
+tickers and reports messages/sec for:
+
+* ``sequential``: the previous behaviour, one publish and ``result()`` per
+  event (over the first ``--sequential-events`` only, as it is slow).
+* ``concurrent``: ``--callers`` threads each publishing one event per call,
+  as concurrent news handlers do.
+* ``backfill``: a single ``publish`` call with every event.
+
+By default the broker is an in-process fake that sends a batch when it holds
+``--max-messages`` messages or is ``--max-latency-ms`` old, and acknowledges
+it after ``--round-trip-ms``. It records the delivery order, so the
+single-caller modes also check that every ticker's events arrived in version
+order. With ``PUBSUB_EMULATOR_HOST`` set and ``--project`` / ``--topic``
+given, the real client publishes to the emulator instead.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.pubsub_publish --events 20000 \
+        --output bench_pubsub_publish.json
+"""
+
+import argparse
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent import futures
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from benchmarks.harness import build_report, write_report
+
+
+class _FakePublisherClient:
+    """Batches like ``PublisherClient`` and acknowledges after a round trip."""
+
+    def __init__(self, max_messages: int, max_latency: float, round_trip: float):
+        self._max_messages = max_messages
+        self._max_latency = max_latency
+        self._round_trip = round_trip
+        self._lock = threading.Lock()
+        self._batch: List[tuple] = []
+        self._timer: Optional[threading.Timer] = None
+        self._sender = futures.ThreadPoolExecutor(max_workers=8)
+        self.delivered: Dict[str, List[bytes]] = defaultdict(list)
+
+    def topic_path(self, project_id: str, topic: str) -> str:
+        return f"projects/{project_id}/topics/{topic}"
+
+    def publish(self, topic: str, data: bytes, ordering_key: str = "", **attrs):
+        future = futures.Future()
+        with self._lock:
+            self._batch.append((ordering_key, data, future))
+            if len(self._batch) >= self._max_messages:
+                self._send()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._max_latency, self._on_timer)
+                self._timer.start()
+        return future
+
+    def resume_publish(self, topic: str, ordering_key: str) -> None:
+        pass
+
+    def close(self) -> None:
+        self._sender.shutdown()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            if self._batch:
+                self._send()
+
+    def _send(self) -> None:
+        # called with the lock held; batches of a key are sent in order
+        batch, self._batch = self._batch, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for key, data, _ in batch:
+            self.delivered[key].append(data)
+        self._sender.submit(self._acknowledge, batch)
+
+    def _acknowledge(self, batch: List[tuple]) -> None:
+        time.sleep(self._round_trip)
+        for _, _, future in batch:
+            future.set_result("message-id")
+
+
+def _events(n_events: int, n_tickers: int):
+    from stock_api.domain.events import DomainEvent
+
+    now = datetime.now(timezone.utc)
+    return [
+        DomainEvent(
+            event_id=f"event-{i}",
+            occurred_at=now,
+            aggregate_id=f"T{i % n_tickers:03d}",
+            version=i // n_tickers,
+            type="ASSET_FEELING_DETECTED",
+            payload={
+                "url": f"https://finance.yahoo.com/news/{i}.html",
+                "news_id": f"news-{i}",
+                "title": f"Headline {i}",
+                "date": now - timedelta(minutes=i),
+                "feeling": i % 11,
+            },
+        )
+        for i in range(n_events)
+    ]
+
+
+def _ordered(client) -> Optional[bool]:
+    import json
+
+    if not isinstance(client, _FakePublisherClient):
+        return None
+    return all(
+        versions == sorted(versions)
+        for versions in (
+            [json.loads(data)["version"] for data in messages]
+            for messages in client.delivered.values()
+        )
+    )
+
+
+def _run(mode: str, args: argparse.Namespace) -> dict:
+    from stock_api.infrastructure.publishers.pubsub_event_publisher import (
+        PubSubEventPublisher,
+        event_message,
+    )
+
+    client = None
+    if not os.environ.get("PUBSUB_EMULATOR_HOST"):
+        client = _FakePublisherClient(
+            args.max_messages, args.max_latency_ms / 1000, args.round_trip_ms / 1000
+        )
+    publisher = PubSubEventPublisher(
+        args.project,
+        args.topic,
+        max_messages=args.max_messages,
+        max_latency=args.max_latency_ms / 1000,
+        client=client,
+    )
+    events = _events(args.events, args.tickers)
+    if mode == "sequential":
+        events = events[: args.sequential_events]
+
+    start = time.perf_counter()
+    if mode == "sequential":
+        for event in events:
+            publisher._publisher.publish(
+                publisher._topic_path,
+                event_message(event, event.aggregate_id),
+                ordering_key=event.aggregate_id,
+            ).result()
+    elif mode == "concurrent":
+        with futures.ThreadPoolExecutor(max_workers=args.callers) as pool:
+            list(pool.map(lambda e: publisher.publish([e], e.aggregate_id), events))
+    else:
+        publisher.publish(events, "BACKFILL")
+    wall = time.perf_counter() - start
+
+    result = {
+        "messages": len(events),
+        "wall_s": round(wall, 4),
+        "messages_per_s": round(len(events) / wall, 2),
+        # concurrent callers may publish a ticker's events in any order
+        "ordered_per_ticker": (
+            None if mode == "concurrent" else _ordered(publisher._publisher)
+        ),
+    }
+    if client is not None:
+        client.close()
+    return result
+
+
+def _serialization(n_events: int) -> dict:
+    from stock_api.infrastructure.publishers import pubsub_event_publisher as module
+
+    events = _events(n_events, 1)
+    results = {}
+    for name, encoder in (("json", None), ("orjson", module.orjson)):
+        if name == "orjson" and encoder is None:
+            continue
+        saved, module.orjson = module.orjson, encoder
+        try:
+            start = time.perf_counter()
+            for event in events:
+                module.event_message(event, "ASSET")
+            results[f"{name}_us_per_event"] = round(
+                (time.perf_counter() - start) / n_events * 1e6, 3
+            )
+        finally:
+            module.orjson = saved
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pub/Sub publish benchmark")
+    parser.add_argument("--modes", default="sequential,concurrent,backfill")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--sequential-events", type=int, default=200)
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--callers", type=int, default=32)
+    parser.add_argument("--max-messages", type=int, default=100)
+    parser.add_argument("--max-latency-ms", type=float, default=10.0)
+    parser.add_argument("--round-trip-ms", type=float, default=20.0)
+    parser.add_argument("--project", default="bench-project")
+    parser.add_argument("--topic", default="bench-topic")
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    stages = {mode: _run(mode, args) for mode in args.modes.split(",")}
+    stages["serialization"] = _serialization(args.events)
+
+    params = {k: v for k, v in vars(args).items() if k != "output"}
+    params["backend"] = (
+        "emulator" if os.environ.get("PUBSUB_EMULATOR_HOST") else "in-process fake"
+    )
+    write_report(build_report("pubsub_publish", params, stages), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Throughput of the news read-model rebuild, in events/sec.
+
+Times:
+
+* ``project``: mapping ``--events`` event documents to read-model upserts,
+  in process.
+* with ``--mongodb-uri``, ``rebuild``: the whole
+  ``rebuild_news_read_model`` run against a scratch database seeded with
+  ``--events`` events over ``--tickers`` tickers (index build and swap
+  included). Exits with status 1 if it stays under ``--target-events-per-s``.
+
+Usage (from the repository root, with a local mongod running):
+
+    PYTHONPATH=packages python -m benchmarks.read_model_rebuild --events 1000000 \
+        --mongodb-uri mongodb://localhost:27017 --output bench_rebuild.json
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+from pymongo import MongoClient
+
+from benchmarks.harness import build_report, run_stage, write_report
+
+
+def _event_documents(n_events: int, n_tickers: int):
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "event_id": f"event-{i}",
+            "occurred_at": start,
+            "aggregate_id": f"T{i % n_tickers:03d}",
+            "version": i // n_tickers,
+            "type": "ASSET_FEELING_DETECTED",
+            "payload": {
+                "url": f"https://finance.yahoo.com/news/{i}.html",
+                "news_id": f"news-{i}",
+                "title": f"Headline {i}",
+                "date": start + timedelta(minutes=i),
+                "feeling": i % 11,
+            },
+        }
+        for i in range(n_events)
+    ]
+
+
+def _setup_project(n_events: int, n_tickers: int):
+    from stock_api.infrastructure.migrations.rebuild_news_read_model import project
+
+    docs = _event_documents(n_events, n_tickers)
+
+    def work():
+        project(docs)
+
+    return work, n_events
+
+
+def _seed(uri: str, db_name: str, n_events: int, n_tickers: int) -> None:
+    from stock_api.infrastructure.repositories.mongo_event_store_repository import (
+        MongoEventStoreRepository,
+    )
+
+    client = MongoClient(uri)
+    client.drop_database(db_name)
+    MongoEventStoreRepository(uri, db_name).ensure_indexes()
+    events = client[db_name]["events"]
+    docs = _event_documents(n_events, n_tickers)
+    for i in range(0, len(docs), 50_000):
+        events.insert_many(docs[i : i + 50_000], ordered=False)
+
+
+def _setup_rebuild(uri: str, db_name: str, n_events: int, batch_size: int):
+    from stock_api.infrastructure.migrations.rebuild_news_read_model import rebuild
+
+    def work():
+        rebuild(uri, db_name, batch_size, restart=True)
+
+    return work, n_events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read-model rebuild benchmark")
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--target-events-per-s", type=float, default=25_000)
+    parser.add_argument("--mongodb-uri", default=None)
+    parser.add_argument("--mongodb-db", default="market_feeling_rebuild_bench")
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    stages = {"project": run_stage(_setup_project, args.events, args.tickers)}
+    if args.mongodb_uri:
+        _seed(args.mongodb_uri, args.mongodb_db, args.events, args.tickers)
+        stages["rebuild"] = run_stage(
+            _setup_rebuild,
+            args.mongodb_uri,
+            args.mongodb_db,
+            args.events,
+            args.batch_size,
+        )
+        stages["rebuild"]["meets_target"] = (
+            stages["rebuild"]["rows_per_s"] >= args.target_events_per_s
+        )
+        MongoClient(args.mongodb_uri).drop_database(args.mongodb_db)
+
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "mongodb_uri")}
+    params["backend"] = "mongodb" if args.mongodb_uri else "in-process"
+    write_report(build_report("read_model_rebuild", params, stages), args.output)
+
+    if not stages.get("rebuild", {}).get("meets_target", True):
+        print(f"Rebuild below {args.target_events_per_s:.0f} events/s", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
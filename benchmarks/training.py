@@ -0,0 +1,90 @@
+"""Benchmark the training path on synthetic data.
+
+Usage (from the repository root):
+
+    PYTHONPATH=packages python -m benchmarks.training --rows 100000 \
+        --output bench_training.json
+"""
+
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+
+from benchmarks.harness import build_report, run_stage, write_report
+
+
+def _setup_batch_transform(news_csv: str):
+    from libs.feature_builder import batch_transform
+
+    df = pd.read_csv(news_csv)
+    return (lambda: batch_transform(df)), len(df)
+
+
+def _setup_engineer(news_csv: str, prices_csv: str, output_csv: str):
+    from stock_model.feature_engineer import engineer
+
+    with open(news_csv) as fh:
+        rows = sum(1 for _ in fh) - 1
+    return (lambda: engineer(news_csv, prices_csv, output_csv)), rows
+
+
+def _setup_train(data_csv: str, model_path: str, n_trials: int):
+    from stock_model.trainer import train
+
+    with open(data_csv) as fh:
+        rows = sum(1 for _ in fh) - 1
+    return (lambda: train(data_csv, model_path, n_trials=n_trials)), rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Training path benchmark")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--days", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--trials", type=int, default=1)
+    parser.add_argument(
+        "--stages",
+        default="batch_transform,engineer,train",
+        help="Comma-separated stages to run",
+    )
+    parser.add_argument("--workdir", default=None)
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    from stock_model.synthetic import write_dataset
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="bench_training_")
+    news_csv, prices_csv = write_dataset(
+        workdir, args.rows, args.tickers, args.days, args.seed
+    )
+    training_csv = os.path.join(workdir, "final_training_data.csv")
+    model_path = os.path.join(workdir, "stock_model")
+
+    stages = args.stages.split(",")
+    results = {}
+    if "batch_transform" in stages:
+        results["batch_transform"] = run_stage(_setup_batch_transform, news_csv)
+    if "engineer" in stages or "train" in stages:
+        results["engineer"] = run_stage(
+            _setup_engineer, news_csv, prices_csv, training_csv
+        )
+    if "train" in stages:
+        results["train"] = run_stage(
+            _setup_train, training_csv, model_path, args.trials
+        )
+
+    params = {
+        "rows": args.rows,
+        "tickers": args.tickers,
+        "days": args.days,
+        "seed": args.seed,
+        "trials": args.trials,
+    }
+    write_report(build_report("training", params, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
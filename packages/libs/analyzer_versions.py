@@ -0,0 +1,26 @@
+from importlib import metadata
+from typing import Dict
+
+FINBERT_MODEL = "yiyanghkust/finbert-tone"
+SPACY_MODEL = "en_core_web_md"
+
+
+def _package_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def analyzer_versions() -> Dict[str, str]:
+    """Version tag of every analyzer feeding the feature row.
+
+    A tag changes whenever the package or model behind an analyzer changes, so
+    stored outputs and trained models can be matched against the runtime.
+    """
+    return {
+        "textblob": f"textblob-{_package_version('textblob')}",
+        "finbert": f"{FINBERT_MODEL}@transformers-{_package_version('transformers')}",
+        "spacy": f"{SPACY_MODEL}-{_package_version('en-core-web-md')}"
+        f"@spacy-{_package_version('spacy')}",
+    }
@@ -0,0 +1,40 @@
+from datetime import date, datetime, time, timezone
+from typing import Union
+
+DateLike = Union[str, date, datetime]
+
+
+def to_utc_datetime(value: DateLike) -> datetime:
+    """Canonical stored form of a date: naive UTC ``datetime`` in milliseconds.
+
+    This is what BSON datetimes hold and what pymongo returns, so values stored
+    and queried through it compare as the same type and hit the date indexes.
+    Strings must be ISO-8601; naive values are taken as UTC.
+    """
+    if isinstance(value, str):
+        value = value.strip()
+        # fromisoformat only accepts a trailing "Z" from Python 3.11
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    # pandas Timestamps are datetime subclasses; keep a plain datetime
+    return datetime(
+        value.year,
+        value.month,
+        value.day,
+        value.hour,
+        value.minute,
+        value.second,
+        value.microsecond // 1000 * 1000,
+    )
+
+
+def to_iso_utc(value: DateLike) -> str:
+    """Canonical text form of a date for CSV exports, e.g. ``2024-05-01T13:45:00.000Z``."""
+    return to_utc_datetime(value).isoformat(timespec="milliseconds") + "Z"
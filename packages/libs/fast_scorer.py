@@ -0,0 +1,40 @@
+from typing import List
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+
+def make_vectorizer() -> HashingVectorizer:
+    """Stateless hashed word 1-2 gram features shared by training and serving."""
+    return HashingVectorizer(
+        ngram_range=(1, 2),
+        n_features=2**20,
+        alternate_sign=False,
+        norm="l2",
+        lowercase=True,
+    )
+
+
+def to_feeling(raw: np.ndarray) -> np.ndarray:
+    """Round and clamp raw scores to the 0-10 feeling scale (as ``RawFeeling``)."""
+    return np.clip(np.rint(raw), 0, 10).astype(int)
+
+
+class FastFeelingScorer:
+    """Cheap text-only student of the full TextBlob + FinBERT + spaCy model.
+
+    The artefact is a joblib dict with a fitted linear ``model`` predicting
+    the full model's raw score from ``make_vectorizer`` features.
+    """
+
+    def __init__(self, model_path: str):
+        artefact = joblib.load(model_path)
+        self._model = artefact["model"]
+        self._vectorizer = make_vectorizer()
+
+    def predict(self, texts: List[str]) -> np.ndarray:
+        return self._model.predict(self._vectorizer.transform(texts))
+
+    def predict_one(self, text: str) -> float:
+        return float(self.predict([text])[0])
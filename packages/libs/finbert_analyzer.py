@@ -1,5 +1,7 @@
 from transformers import pipeline
 
+from libs.analyzer_versions import FINBERT_MODEL
+
 
 # FINBERT:
 #   finbert_label:
@@ -11,8 +13,8 @@ class FinBertAnalyzer:
     def __init__(self):
         self.pipe = pipeline(
             "sentiment-analysis",
-            model="yiyanghkust/finbert-tone",
-            tokenizer="yiyanghkust/finbert-tone",
+            model=FINBERT_MODEL,
+            tokenizer=FINBERT_MODEL,
             framework="pt",
             padding=True,
             truncation=True,
@@ -25,3 +27,20 @@ class FinBertAnalyzer:
             return {"finbert_label": r["label"], "finbert_score": r["score"]}
         except Exception as e:
             return {"finbert_label": None, "finbert_score": None}
+
+    def analyze_probabilities(self, text: str) -> dict:
+        """Like :meth:`analyze`, plus the probability of every class."""
+        try:
+            scores = self.pipe(text, top_k=None)
+            # Some transformers versions nest the scores for a single input
+            if scores and isinstance(scores[0], list):
+                scores = scores[0]
+            best = max(scores, key=lambda r: r["score"])
+            probs = {f"finbert_prob_{r['label'].lower()}": r["score"] for r in scores}
+            return {
+                "finbert_label": best["label"],
+                "finbert_score": best["score"],
+                **probs,
+            }
+        except Exception as e:
+            return {"finbert_label": None, "finbert_score": None}
@@ -0,0 +1,265 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import joblib
+import lightgbm as lgb
+import numpy as np
+
+from libs.analyzer_versions import analyzer_versions
+
+# Directory layout of the native artefact format:
+#   manifest.json  feature columns, analyzer versions, file checksums
+#   model.txt      LightGBM native model
+#   scaler.npz     uncompressed StandardScaler mean_/scale_ arrays, plus
+#                  var_/n_samples_seen_ so refreshes can partial_fit it
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+MODEL_FILE = "model.txt"
+SCALER_FILE = "scaler.npz"
+
+
+class ArtefactError(ValueError):
+    """Raised when an artefact is malformed or fails its integrity checks."""
+
+    pass
+
+
+@dataclass
+class ArrayScaler:
+    """Drop-in for a fitted ``StandardScaler`` built from its raw arrays."""
+
+    mean: np.ndarray
+    scale: np.ndarray
+    var: Optional[np.ndarray] = None
+    n_samples_seen: Optional[int] = None
+
+    def transform(self, X) -> np.ndarray:
+        return (np.asarray(X, dtype=np.float64) - self.mean) / self.scale
+
+    def to_standard_scaler(self, columns: Optional[List[str]] = None):
+        """A fitted ``StandardScaler`` with these statistics (over *columns*),
+        for ``partial_fit``; needs the variance and sample count."""
+        from sklearn.preprocessing import StandardScaler
+
+        if self.var is None or self.n_samples_seen is None:
+            raise ArtefactError("Scaler was saved without its sample statistics")
+        scaler = StandardScaler()
+        scaler.mean_ = self.mean.copy()
+        scaler.scale_ = self.scale.copy()
+        scaler.var_ = self.var.copy()
+        scaler.n_samples_seen_ = np.asarray(self.n_samples_seen, dtype=np.int64)
+        scaler.n_features_in_ = len(self.mean)
+        if columns is not None:
+            scaler.feature_names_in_ = np.asarray(columns, dtype=object)
+        return scaler
+
+
+def _scaler_arrays(scaler) -> Dict[str, np.ndarray]:
+    if isinstance(scaler, ArrayScaler):
+        arrays = {"mean": scaler.mean, "scale": scaler.scale}
+        if scaler.var is not None and scaler.n_samples_seen is not None:
+            arrays["var"] = scaler.var
+            arrays["n_samples_seen"] = scaler.n_samples_seen
+    else:
+        arrays = {"mean": scaler.mean_, "scale": scaler.scale_}
+        if getattr(scaler, "var_", None) is not None:
+            arrays["var"] = scaler.var_
+            arrays["n_samples_seen"] = scaler.n_samples_seen_
+    return {
+        name: np.asarray(
+            value, dtype=np.int64 if name == "n_samples_seen" else np.float64
+        )
+        for name, value in arrays.items()
+    }
+
+
+def _sample_count(arrays) -> Optional[int]:
+    if "n_samples_seen" not in arrays:
+        return None
+    count = arrays["n_samples_seen"]
+    # per feature when the scaler was fitted on data with NaNs
+    return int(count) if count.ndim == 0 else count
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_artefact_dir(path: str) -> bool:
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, MANIFEST_FILE))
+
+
+def save_artefact(
+    out_dir: str,
+    booster: lgb.Booster,
+    scaler,
+    columns: List[str],
+    versions: Optional[Dict[str, str]] = None,
+) -> str:
+    """Write *booster*, *scaler* (a ``StandardScaler`` or ``ArrayScaler``)
+    and *columns* in the native artefact format.
+
+    The files are written to a sibling temporary directory that then replaces
+    *out_dir*, so a reader never sees a mix of old and new files.
+    """
+    out_dir = out_dir.rstrip(os.sep)
+    parent = os.path.dirname(os.path.abspath(out_dir))
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=f".{os.path.basename(out_dir)}.", dir=parent)
+    try:
+        os.chmod(tmp_dir, 0o755)
+        _write_artefact(tmp_dir, booster, scaler, columns, versions)
+        _replace_dir(tmp_dir, out_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return out_dir
+
+
+def _replace_dir(src: str, dst: str) -> None:
+    if not os.path.exists(dst):
+        os.replace(src, dst)
+        return
+    # rename() cannot replace a non-empty directory: move the old one aside
+    # first; dst is missing only between the two renames
+    old = tempfile.mkdtemp(
+        prefix=f".{os.path.basename(dst)}.old.",
+        dir=os.path.dirname(os.path.abspath(dst)),
+    )
+    os.rmdir(old)
+    os.replace(dst, old)
+    os.replace(src, dst)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def _write_artefact(
+    out_dir: str,
+    booster: lgb.Booster,
+    scaler,
+    columns: List[str],
+    versions: Optional[Dict[str, str]],
+) -> None:
+    model_path = os.path.join(out_dir, MODEL_FILE)
+    scaler_path = os.path.join(out_dir, SCALER_FILE)
+    booster.save_model(model_path)
+    np.savez(scaler_path, **_scaler_arrays(scaler))
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "feature_columns": list(columns),
+        "analyzer_versions": versions or analyzer_versions(),
+        "files": {
+            MODEL_FILE: _sha256(model_path),
+            SCALER_FILE: _sha256(scaler_path),
+        },
+    }
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w") as fh:
+        json.dump(manifest, fh, indent=2)
+
+
+def load_artefact(
+    path: str, verify: bool = True
+) -> Tuple[lgb.Booster, ArrayScaler, List[str], dict]:
+    """Load a native artefact directory.
+
+    Returns ``(booster, scaler, columns, manifest)``. With *verify* the file
+    checksums are compared against the manifest before anything is parsed.
+    """
+    with open(os.path.join(path, MANIFEST_FILE)) as fh:
+        manifest = json.load(fh)
+
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ArtefactError(
+            f"Unsupported artefact format {manifest.get('format_version')!r} "
+            f"(expected {FORMAT_VERSION})"
+        )
+
+    if verify:
+        for name, expected in manifest["files"].items():
+            actual = _sha256(os.path.join(path, name))
+            if actual != expected:
+                raise ArtefactError(f"Checksum mismatch for {name} in {path}")
+
+    columns = manifest["feature_columns"]
+    booster = lgb.Booster(model_file=os.path.join(path, MODEL_FILE))
+    with np.load(os.path.join(path, SCALER_FILE), allow_pickle=False) as arrays:
+        scaler = ArrayScaler(
+            mean=arrays["mean"],
+            scale=arrays["scale"],
+            var=arrays["var"] if "var" in arrays else None,
+            n_samples_seen=_sample_count(arrays),
+        )
+
+    if booster.num_feature() != len(columns) or scaler.mean.shape != (len(columns),):
+        raise ArtefactError(
+            f"Artefact {path} is inconsistent: {len(columns)} columns, "
+            f"{booster.num_feature()} model features, "
+            f"{scaler.mean.shape[0]} scaler features"
+        )
+
+    return booster, scaler, columns, manifest
+
+
+def load_model(path: str) -> Tuple[object, object, List[str], Optional[dict]]:
+    """Load either a native artefact directory or a legacy joblib pickle.
+
+    Returns ``(booster, scaler, columns, manifest)``; *manifest* is ``None``
+    for joblib files. When *path* is missing but ``<path>.joblib`` exists
+    (images built before models were saved as directories), the pickle is
+    converted to *path* first, or loaded as is if that cannot be written.
+    """
+    if is_artefact_dir(path):
+        return load_artefact(path)
+
+    legacy = f"{path.rstrip(os.sep)}.joblib"
+    if not os.path.exists(path) and os.path.exists(legacy):
+        try:
+            return load_artefact(convert_joblib(legacy, path))
+        except OSError:
+            path = legacy  # read-only model directory
+
+    artefact = joblib.load(path)
+    return artefact["model"], artefact["scaler"], artefact["columns"], None
+
+
+def stale_analyzers(manifest: dict) -> Dict[str, Tuple[Optional[str], str]]:
+    """Analyzers whose runtime version differs from the one the model saw.
+
+    A version recorded as ``None`` (unknown, as for converted pickles) is
+    always reported.
+    """
+    current = analyzer_versions()
+    trained = manifest.get("analyzer_versions", {})
+    return {
+        name: (trained.get(name), version)
+        for name, version in current.items()
+        if trained.get(name) != version
+    }
+
+
+def convert_joblib(
+    joblib_path: str, out_dir: str, versions: Optional[Dict[str, str]] = None
+) -> str:
+    """Convert a legacy joblib artefact into the native directory format.
+
+    Pickles do not record the analyzers they were trained with: pass them as
+    *versions* if known, otherwise they are written as unknown (``None``) so
+    the staleness check flags them rather than trusting the runtime ones.
+    """
+    artefact = joblib.load(joblib_path)
+    if versions is None:
+        versions = {name: None for name in analyzer_versions()}
+    return save_artefact(
+        out_dir, artefact["model"], artefact["scaler"], artefact["columns"], versions
+    )
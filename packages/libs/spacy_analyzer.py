@@ -1,6 +1,8 @@
 import warnings
 import spacy
 
+from libs.analyzer_versions import SPACY_MODEL
+
 
 # Suppress spaCy W008 warnings about empty vectors
 warnings.filterwarnings(
@@ -13,7 +15,7 @@ warnings.filterwarnings(
 #       Ranges from 0.0 (no similarity) to 1.0 (highly similar).
 #       Measures how similar the article text is to the company name based on spaCy embeddings.
 class SpacySimilarityAnalyzer:
-    def __init__(self, model: str = "en_core_web_md"):
+    def __init__(self, model: str = SPACY_MODEL):
         try:
             self.nlp = spacy.load(model)
         except Exception as e:
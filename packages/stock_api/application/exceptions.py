@@ -25,3 +25,9 @@ class BadRequestException(ApplicationException):
     """Raised when the request is invalid."""
 
     pass
+
+
+class InFlightTimeoutException(ApplicationException):
+    """Raised when a coalesced call did not finish in time for its waiters."""
+
+    pass
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict, Optional, List
+
+from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.application.news.news_page_cursor import NewsPageCursor
+
+
+class AsyncNewsReadModelRepository(ABC):
+    @abstractmethod
+    async def get(self, news_id: str) -> Optional[LatestNews]:
+        pass
+
+    @abstractmethod
+    async def get_by_date_range(
+        self, ticker: str, start_date: date, end_date: date
+    ) -> List[LatestNews]:
+        pass
+
+    @abstractmethod
+    async def get_latest_news_for_ticker(
+        self, ticker: str, limit: int
+    ) -> List[LatestNews]:
+        pass
+
+    @abstractmethod
+    async def get_latest_news_for_tickers(
+        self, tickers: List[str], limit: int
+    ) -> Dict[str, List[LatestNews]]:
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self,
+        ticker: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: int,
+        after: Optional[NewsPageCursor] = None,
+    ) -> List[LatestNews]:
+        pass
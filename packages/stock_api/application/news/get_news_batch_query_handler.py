@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from stock_api.application.news.async_news_read_model_repository import (
+    AsyncNewsReadModelRepository,
+)
+from stock_api.application.news.get_news_query_handler import NewsItem
+from stock_api.application.news.news_query_cache import NewsQueryCache
+from stock_api.domain.async_company_repository import AsyncCompanyRepository
+
+# Most assets a single batch query may ask for
+MAX_BATCH_ASSETS = 100
+
+
+@dataclass
+class GetNewsBatchQuery:
+    asset_ids: List[str]
+    limit: int
+
+
+@dataclass
+class NewsBatch:
+    items: Dict[str, List[NewsItem]]  # by asset id, in request order
+    not_found: List[str]
+
+
+class GetNewsBatchQueryHandler:
+    """Latest news of many assets with one company lookup and one news read.
+
+    Shares the ``NewsQueryCache`` entries of ``GetNewsQueryHandler`` (same key
+    for an asset and limit), so only the assets missing from the cache are
+    read, and what is read is cached for both endpoints.
+    """
+
+    def __init__(
+        self,
+        read_model: AsyncNewsReadModelRepository,
+        company_repository: AsyncCompanyRepository,
+        cache: Optional[NewsQueryCache] = None,
+    ):
+        self.__read_model = read_model
+        self.__company_repository = company_repository
+        self.__cache = cache
+
+    async def handle(self, query: GetNewsBatchQuery) -> NewsBatch:
+        asset_ids = list(dict.fromkeys(query.asset_ids))
+        limit = max(1, min(query.limit, 50))
+
+        items: Dict[str, List[NewsItem]] = {}
+        pending = []
+        for asset_id in asset_ids:
+            cached = (
+                self.__cache.get(self.__key(asset_id, query)) if self.__cache else None
+            )
+            if cached is not None:
+                items[asset_id] = list(cached)
+            else:
+                pending.append(asset_id)
+
+        companies = (
+            await self.__company_repository.find_by_asset_ids(pending)
+            if pending
+            else {}
+        )
+        not_found = [asset_id for asset_id in pending if asset_id not in companies]
+
+        if companies:
+            by_ticker = {c.ticker: c.id for c in companies.values()}
+            generations = {
+                ticker: self.__cache.generation(ticker) if self.__cache else 0
+                for ticker in by_ticker
+            }
+            latest = await self.__read_model.get_latest_news_for_tickers(
+                list(by_ticker), limit
+            )
+            for ticker, asset_id in by_ticker.items():
+                news_items = [
+                    NewsItem(
+                        title=news.title,
+                        date=news.date,
+                        url=news.url,
+                        asset_id=asset_id,
+                    )
+                    for news in latest.get(ticker, [])
+                ]
+                if self.__cache is not None:
+                    self.__cache.put(
+                        self.__key(asset_id, query),
+                        ticker,
+                        news_items,
+                        generations[ticker],
+                    )
+                items[asset_id] = news_items
+
+        return NewsBatch(
+            items={a: items[a] for a in asset_ids if a in items},
+            not_found=not_found,
+        )
+
+    @staticmethod
+    def __key(asset_id: str, query: GetNewsBatchQuery) -> tuple:
+        # the GetNewsQueryHandler key of a latest-news query for asset_id
+        return (asset_id, query.limit, None, None)
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from stock_api.application.exceptions import NotFoundException
+from stock_api.application.news.async_news_read_model_repository import (
+    AsyncNewsReadModelRepository,
+)
+from stock_api.application.news.get_news_query_handler import (
+    MAX_PAGE_SIZE,
+    NewsItem,
+    day_bounds,
+)
+from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.application.news.news_page_cursor import NewsPageCursor
+from stock_api.domain.async_company_repository import AsyncCompanyRepository
+
+
+@dataclass
+class GetNewsHistoryQuery:
+    asset_id: str
+    limit: int
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    cursor: Optional[str] = None
+
+
+@dataclass
+class NewsHistoryPage:
+    items: List[NewsItem]
+    next_cursor: Optional[str]
+
+
+class GetNewsHistoryQueryHandler:
+    """Newest-first news history, read in keyset pages of ``(date, id)``.
+
+    ``handle`` returns one page and the cursor of the next one; ``stream``
+    walks every page of the range for bulk export, holding a single page in
+    memory at a time.
+    """
+
+    def __init__(
+        self,
+        read_model: AsyncNewsReadModelRepository,
+        company_repository: AsyncCompanyRepository,
+        export_batch_size: int = MAX_PAGE_SIZE,
+    ):
+        self.__read_model = read_model
+        self.__company_repository = company_repository
+        self.__export_batch_size = export_batch_size
+
+    async def handle(self, query: GetNewsHistoryQuery) -> NewsHistoryPage:
+        ticker = await self.__ticker(query.asset_id)
+        after = NewsPageCursor.decode(query.cursor) if query.cursor else None
+        limit = max(1, min(query.limit, MAX_PAGE_SIZE))
+
+        start, end = day_bounds(query.start_date, query.end_date)
+        page = await self.__read_model.get_page(ticker, start, end, limit, after)
+
+        next_cursor = None
+        if len(page) == limit:
+            next_cursor = NewsPageCursor.after(page[-1]).encode()
+
+        return NewsHistoryPage(
+            items=[self.__to_item(news, query.asset_id) for news in page],
+            next_cursor=next_cursor,
+        )
+
+    async def stream(self, query: GetNewsHistoryQuery) -> AsyncIterator[NewsItem]:
+        """Resolve the company now (so a bad assetId fails before any output)
+        and return an iterator over every item of the range."""
+        ticker = await self.__ticker(query.asset_id)
+        after = NewsPageCursor.decode(query.cursor) if query.cursor else None
+        start, end = day_bounds(query.start_date, query.end_date)
+
+        async def items() -> AsyncIterator[NewsItem]:
+            cursor = after
+            while True:
+                page = await self.__read_model.get_page(
+                    ticker, start, end, self.__export_batch_size, cursor
+                )
+                for news in page:
+                    yield self.__to_item(news, query.asset_id)
+                if len(page) < self.__export_batch_size:
+                    return
+                cursor = NewsPageCursor.after(page[-1])
+
+        return items()
+
+    async def __ticker(self, asset_id: str) -> str:
+        company = await self.__company_repository.find_by_asset_id(asset_id)
+        if company is None:
+            raise NotFoundException(f"Company with assetId '{asset_id}' not found")
+        return company.ticker
+
+    @staticmethod
+    def __to_item(news: LatestNews, asset_id: str) -> NewsItem:
+        return NewsItem(
+            title=news.title,
+            date=news.date,
+            url=news.url,
+            asset_id=asset_id,
+        )
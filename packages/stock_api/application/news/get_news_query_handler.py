@@ -1,13 +1,27 @@
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, time
+from typing import List, Optional, Tuple
 
 from stock_api.application.exceptions import NotFoundException
-from stock_api.application.news.latest_news_dto import LatestNews
-from stock_api.application.news.news_read_model_repository import (
-    NewsReadModelRepository,
+from stock_api.application.news.async_news_read_model_repository import (
+    AsyncNewsReadModelRepository,
 )
-from stock_api.domain.company_repository import CompanyRepository
+from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.application.news.news_query_cache import NewsQueryCache
+from stock_api.domain.async_company_repository import AsyncCompanyRepository
+
+
+# Largest page a date-range query reads from the repository in one go
+MAX_PAGE_SIZE = 500
+
+
+def day_bounds(
+    start_date: Optional[datetime], end_date: Optional[datetime]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Widen the filter to whole days, both ends inclusive; None stays open."""
+    start = datetime.combine(start_date.date(), time.min) if start_date else None
+    end = datetime.combine(end_date.date(), time.max) if end_date else None
+    return start, end
 
 
 @dataclass
@@ -28,13 +42,23 @@ class NewsItem:
 
 class GetNewsQueryHandler:
     def __init__(
-        self, read_model: NewsReadModelRepository, company_repository: CompanyRepository
+        self,
+        read_model: AsyncNewsReadModelRepository,
+        company_repository: AsyncCompanyRepository,
+        cache: Optional[NewsQueryCache] = None,
     ):
         self.__read_model = read_model
         self.__company_repository = company_repository
+        self.__cache = cache
 
-    def handle(self, query: GetNewsQuery) -> List[NewsItem]:
-        company = self.__company_repository.find_by_asset_id(query.asset_id)
+    async def handle(self, query: GetNewsQuery) -> List[NewsItem]:
+        key = (query.asset_id, query.limit, query.start_date, query.end_date)
+        if self.__cache is not None:
+            cached = self.__cache.get(key)
+            if cached is not None:
+                return list(cached)
+
+        company = await self.__company_repository.find_by_asset_id(query.asset_id)
         if company is None:
             raise NotFoundException(
                 f"Company with assetId '{query.asset_id}' not found"
@@ -42,24 +66,32 @@ class GetNewsQueryHandler:
 
         ticker: str = company.ticker
 
+        # Taken before reading so that news saved meanwhile voids this result
+        generation = self.__cache.generation(ticker) if self.__cache else 0
+
+        news_items = await self.__fetch(query, ticker)
+
+        if self.__cache is not None:
+            self.__cache.put(key, ticker, news_items, generation)
+        return list(news_items)
+
+    async def __fetch(self, query: GetNewsQuery, ticker: str) -> List[NewsItem]:
         latest_news: List[LatestNews]
         if query.start_date is not None or query.end_date is not None:
-            latest_news: List[LatestNews] = self.__read_model.get_by_date_range(
-                ticker=ticker,
-                start_date=query.start_date.date(),
-                end_date=query.end_date.date(),
+            # Sorted and limited by the repository: no unbounded range read
+            start, end = day_bounds(query.start_date, query.end_date)
+            latest_news = await self.__read_model.get_page(
+                ticker, start, end, max(1, min(query.limit, MAX_PAGE_SIZE))
             )
         else:
             limit = max(1, min(query.limit, 50))
-            latest_news: List[LatestNews] = (
-                self.__read_model.get_latest_news_for_ticker(ticker, limit)
+            latest_news = await self.__read_model.get_latest_news_for_ticker(
+                ticker, limit
             )
 
         if not latest_news:
             return []
 
-        latest_news.sort(key=lambda n: n.date, reverse=True)
-
         return [
             NewsItem(
                 title=item.title,
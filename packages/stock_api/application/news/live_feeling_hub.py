@@ -0,0 +1,139 @@
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+
+@dataclass
+class LiveFeeling:
+    asset_id: str
+    news_id: str
+    title: str
+    url: str
+    date: datetime
+    feeling: int
+
+
+@dataclass
+class LiveHubStats:
+    subscribers: int
+    published: int
+    buffered: int
+    dropped: int
+
+
+class LiveSubscription:
+    """One client's view of the hub: a bounded buffer of pending items.
+
+    When the client falls behind by more than ``buffer_size`` items the
+    oldest are dropped and counted, so a slow consumer costs a fixed amount
+    of memory and never holds up the others.
+    """
+
+    def __init__(self, asset_ids: Set[str], buffer_size: int):
+        self.asset_ids = asset_ids
+        self._buffer: Deque[LiveFeeling] = deque(maxlen=buffer_size)
+        self._ready = asyncio.Event()
+        self._dropped = 0
+
+    def _push(self, item: LiveFeeling) -> bool:
+        """Buffer *item*; False when that pushed out an undelivered one."""
+        dropped = len(self._buffer) == self._buffer.maxlen
+        if dropped:
+            self._dropped += 1
+        self._buffer.append(item)
+        self._ready.set()
+        return not dropped
+
+    async def next_batch(self, timeout: float) -> Tuple[List[LiveFeeling], int]:
+        """Wait up to *timeout* seconds and drain the buffer.
+
+        Returns the pending items and how many were dropped since the last
+        call; both are empty/zero on timeout.
+        """
+        if not self._buffer:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return [], 0
+
+        items = list(self._buffer)
+        self._buffer.clear()
+        self._ready.clear()
+        dropped, self._dropped = self._dropped, 0
+        return items, dropped
+
+
+class LiveFeelingHub:
+    """Fans newly registered feelings out to live subscribers by asset id.
+
+    ``publish`` may be called from any thread (the Pub/Sub callbacks run in
+    worker threads); delivery is scheduled onto the event loop the
+    subscribers live on, with one callback per item whatever the number of
+    subscribers. An idle subscriber is just a buffer and an ``asyncio.Event``.
+    The counters behind ``stats`` are updated under a lock, as ``publish``
+    runs on those worker threads.
+    """
+
+    def __init__(self, buffer_size: int = 100):
+        self._buffer_size = buffer_size
+        self._subscribers: Dict[str, Set[LiveSubscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._count = 0
+        self._published = 0
+        self._buffered = 0
+        self._dropped = 0
+
+    def subscribe(self, asset_ids: Iterable[str]) -> LiveSubscription:
+        """Register a subscriber; must be called on the event loop."""
+        self._loop = asyncio.get_running_loop()
+        subscription = LiveSubscription(set(asset_ids), self._buffer_size)
+        for asset_id in subscription.asset_ids:
+            self._subscribers.setdefault(asset_id, set()).add(subscription)
+        with self._lock:
+            self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: LiveSubscription) -> None:
+        for asset_id in subscription.asset_ids:
+            subscribers = self._subscribers.get(asset_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[asset_id]
+        with self._lock:
+            self._count -= 1
+
+    def publish(self, item: LiveFeeling) -> None:
+        with self._lock:
+            self._published += 1
+        loop = self._loop
+        if loop is None or item.asset_id not in self._subscribers:
+            return
+        try:
+            loop.call_soon_threadsafe(self._fan_out, item)
+        except RuntimeError:
+            # the loop is closed: the server is shutting down
+            pass
+
+    def stats(self) -> LiveHubStats:
+        with self._lock:
+            return LiveHubStats(
+                subscribers=self._count,
+                published=self._published,
+                buffered=self._buffered,
+                dropped=self._dropped,
+            )
+
+    def _fan_out(self, item: LiveFeeling) -> None:
+        buffered = dropped = 0
+        for subscription in self._subscribers.get(item.asset_id, ()):
+            buffered += 1
+            if not subscription._push(item):
+                dropped += 1
+        with self._lock:
+            self._buffered += buffered
+            self._dropped += dropped
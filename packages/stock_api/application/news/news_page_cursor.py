@@ -0,0 +1,38 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from libs.dates import to_utc_datetime
+from stock_api.application.exceptions import BadRequestException
+from stock_api.application.news.latest_news_dto import LatestNews
+
+
+@dataclass(frozen=True)
+class NewsPageCursor:
+    """Keyset position in a newest-first news listing.
+
+    Pages are ordered by ``(date, id)`` descending; a cursor holds the key of
+    the last item returned, and the next page starts strictly after it.
+    """
+
+    date: datetime
+    id: str
+
+    @staticmethod
+    def after(news: LatestNews) -> "NewsPageCursor":
+        return NewsPageCursor(date=to_utc_datetime(news.date), id=news.id)
+
+    def encode(self) -> str:
+        raw = json.dumps({"d": self.date.isoformat(), "i": self.id})
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(token: str) -> "NewsPageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(padded))
+            return NewsPageCursor(date=to_utc_datetime(raw["d"]), id=str(raw["i"]))
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise BadRequestException("Invalid cursor")
@@ -0,0 +1,101 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class NewsQueryCache:
+    """Thread-safe TTL + LRU cache for news query results.
+
+    Entries are tagged with the ticker they were read for, so a ticker's
+    entries can be dropped as soon as new news is saved for it. Each ticker
+    also has a generation counter: a result read before an invalidation is
+    not stored afterwards, so a slow query cannot re-insert stale data.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 1024):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (expires_at, ticker, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, Any]]" = OrderedDict()
+        self._keys_by_ticker: Dict[str, Set[Hashable]] = {}
+        self._generations: Dict[str, int] = {}
+        self._stats = CacheStats()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            expires_at, ticker, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key, ticker)
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def generation(self, ticker: str) -> int:
+        with self._lock:
+            return self._generations.get(ticker, 0)
+
+    def put(self, key: Hashable, ticker: str, value: Any, generation: int) -> None:
+        """Store *value* unless *ticker* was invalidated since *generation*."""
+        with self._lock:
+            if self._generations.get(ticker, 0) != generation:
+                return
+
+            if key in self._entries:
+                self._remove(key, self._entries[key][1])
+            self._entries[key] = (time.monotonic() + self._ttl, ticker, value)
+            self._keys_by_ticker.setdefault(ticker, set()).add(key)
+
+            while len(self._entries) > self._max_entries:
+                old_key, (_, old_ticker, _) = next(iter(self._entries.items()))
+                self._remove(old_key, old_ticker)
+                self._stats.evictions += 1
+
+    def invalidate_ticker(self, ticker: str) -> None:
+        with self._lock:
+            self._generations[ticker] = self._generations.get(ticker, 0) + 1
+            for key in self._keys_by_ticker.pop(ticker, set()):
+                self._entries.pop(key, None)
+            self._stats.invalidations += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                size=len(self._entries),
+            )
+
+    def _remove(self, key: Hashable, ticker: str) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_ticker.get(ticker)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_ticker[ticker]
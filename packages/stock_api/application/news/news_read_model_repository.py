@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Dict, Optional, List
 
 from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.application.news.news_page_cursor import NewsPageCursor
 
 
 class NewsReadModelRepository(ABC):
@@ -23,3 +24,23 @@ class NewsReadModelRepository(ABC):
     @abstractmethod
     def get_latest_news_for_ticker(self, ticker: str, limit: int) -> List[LatestNews]:
         pass
+
+    @abstractmethod
+    def get_latest_news_for_tickers(
+        self, tickers: List[str], limit: int
+    ) -> Dict[str, List[LatestNews]]:
+        """Newest *limit* items of every ticker, keyed by ticker."""
+        pass
+
+    @abstractmethod
+    def get_page(
+        self,
+        ticker: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: int,
+        after: Optional[NewsPageCursor] = None,
+    ) -> List[LatestNews]:
+        """Up to *limit* items in ``[start, end]``, newest first by (date, id),
+        strictly after the *after* cursor when given."""
+        pass
@@ -1,10 +1,18 @@
 import datetime
+import random
+import time
 from dataclasses import dataclass
+from typing import Optional
 
 from stock_api.application.exceptions import NotFoundException
 from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.application.news.live_feeling_hub import LiveFeeling, LiveFeelingHub
+from stock_api.application.news.news_query_cache import NewsQueryCache
+from stock_api.application.news.single_flight import SingleFlight
 from stock_api.domain.company_repository import CompanyRepository
+from stock_api.domain.exceptions import ConcurrencyException
 from stock_api.domain.news import News
+from stock_api.domain.prediction_aggregate import PredictionAggregate
 from stock_api.domain.prediction_model import PredictionModel
 from stock_api.domain.event_store_repository import EventStoreRepository
 from stock_api.application.news.news_read_model_repository import (
@@ -34,14 +42,30 @@ class RegisterNewsCommandHandler:
         event_store: EventStoreRepository,
         read_model: NewsReadModelRepository,
         event_publisher: DomainEventPublisher,
+        query_cache: Optional[NewsQueryCache] = None,
+        live_hub: Optional[LiveFeelingHub] = None,
+        max_append_retries: int = 5,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.__company_repository = company_repository
         self.__model = model
         self.__event_store = event_store
         self.__read_model = read_model
         self.__event_publisher = event_publisher
+        self.__query_cache = query_cache
+        self.__live_hub = live_hub
+        self.__max_append_retries = max_append_retries
+        self.__single_flight = single_flight
+
+    def handle(self, command: RegisterNewsCommand) -> Optional[LatestNews]:
+        if self.__single_flight is None:
+            return self.__register(command)
+        # concurrent duplicates and quick redeliveries share one registration
+        return self.__single_flight.do(
+            ("news", command.id), lambda: self.__register(command)
+        )
 
-    def handle(self, command: RegisterNewsCommand):
+    def __register(self, command: RegisterNewsCommand) -> Optional[LatestNews]:
         logger.info("GetLatestNews for ticker='%s'", command.ticker)
 
         # Validate company exists
@@ -61,22 +85,14 @@ class RegisterNewsCommandHandler:
             return existing
 
         # Get a feeling for the latest news
-        raw_feeling: RawFeeling = self.__model.get_prediction_from_url(
-            news.url, company.name
-        )
-
-        # Get the last prediction for this ticker, if exists
-        prediction = self.__event_store.find_by_id(command.ticker)
-
-        # Register the latest news in the prediction aggregate
-        prediction.register_latest_news(news, raw_feeling.value)
+        raw_feeling = self.__score(news.url, company.name)
 
-        # Save the events into the write-side event store
+        # Append to the ticker's stream, reloading it on version conflicts
+        prediction = self.__append(news, raw_feeling.value)
+        if prediction is None:
+            return None
         events = prediction.get_uncommitted_events()
 
-        # Persist events into the event store
-        self.__event_store.save(prediction)
-
         # Publish events to notify subscribers
         self.__event_publisher.publish(events, company.id)
 
@@ -97,4 +113,58 @@ class RegisterNewsCommandHandler:
         # Update read-model
         self.__read_model.save(latest_news)
 
+        # Drop cached query results for this ticker
+        if self.__query_cache is not None:
+            self.__query_cache.invalidate_ticker(news.ticker)
+
+        # Push the new feeling to live subscribers of this asset
+        if self.__live_hub is not None:
+            self.__live_hub.publish(
+                LiveFeeling(
+                    asset_id=company.id,
+                    news_id=latest_news.id,
+                    title=latest_news.title,
+                    url=latest_news.url,
+                    date=latest_news.date,
+                    feeling=latest_news.feeling,
+                )
+            )
+
         logger.info("Completed GetLatestNews for %s", command.ticker)
+        return latest_news
+
+    def __score(self, url: str, company_name: str) -> RawFeeling:
+        """Feeling of the article at *url*; the same article under another
+        news id is scraped and scored once."""
+        if self.__single_flight is None:
+            return self.__model.get_prediction_from_url(url, company_name)
+        return self.__single_flight.do(
+            ("url", url, company_name),
+            lambda: self.__model.get_prediction_from_url(url, company_name),
+        )
+
+    def __append(self, news: News, feeling: int) -> Optional[PredictionAggregate]:
+        """Register *news* on a freshly loaded aggregate and save it.
+
+        Saves are expected-version appends: when a concurrent handler took the
+        version first, the stream is reloaded and the news registered again
+        on top of it. Returns None if a concurrent handler already registered
+        this very news (a redelivered message), even if other news were
+        appended after it.
+        """
+        for attempt in range(self.__max_append_retries + 1):
+            if attempt and self.__event_store.has_news(news.ticker, news.id):
+                logger.info("News %s already registered concurrently", news.id)
+                return None
+            prediction = self.__event_store.find_by_id(news.ticker)
+
+            prediction.register_latest_news(news, feeling)
+            try:
+                self.__event_store.save(prediction)
+                return prediction
+            except ConcurrencyException as e:
+                if attempt == self.__max_append_retries:
+                    raise
+                logger.info("%s, retrying (%d)", e, attempt + 1)
+                # jittered backoff so the contenders do not collide again
+                time.sleep(random.uniform(0, 0.01 * 2**attempt))
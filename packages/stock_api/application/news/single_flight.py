@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from stock_api.application.exceptions import InFlightTimeoutException
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one computation.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait for it and get the same result, or the same exception. The
+    outcome is then kept for a short while, results for ``ttl_seconds`` and
+    errors for ``error_ttl_seconds``, so a duplicate that arrives just after
+    (a Pub/Sub redelivery) does not repeat the work either.
+
+    Waiters give up after ``wait_timeout_seconds`` with an
+    InFlightTimeoutException, so a hung first call does not also hold every
+    duplicate's worker; the message is nacked and redelivered later.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        error_ttl_seconds: float = 10.0,
+        max_entries: int = 10_000,
+        wait_timeout_seconds: float = 60.0,
+    ):
+        self._ttl = ttl_seconds
+        self._error_ttl = error_ttl_seconds
+        self._max_entries = max_entries
+        self._wait_timeout = wait_timeout_seconds
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        # key -> (expires_at, call)
+        self._done: "OrderedDict[Hashable, Tuple[float, _Call]]" = OrderedDict()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._recent(key) or self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if leader:
+            self._run(key, call, fn)
+        elif not call.done.wait(self._wait_timeout):
+            raise InFlightTimeoutException(
+                f"{key!r} still in flight after {self._wait_timeout:g}s"
+            )
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _recent(self, key: Hashable) -> Optional[_Call]:
+        entry = self._done.get(key)
+        if entry is None:
+            return None
+        expires_at, call = entry
+        if expires_at < time.monotonic():
+            del self._done[key]
+            return None
+        return call
+
+    def _run(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> None:
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+
+        ttl = self._ttl if call.error is None else self._error_ttl
+        with self._lock:
+            del self._calls[key]
+            if ttl > 0:
+                self._done[key] = (time.monotonic() + ttl, call)
+                self._done.move_to_end(key)
+                while len(self._done) > self._max_entries:
+                    self._done.popitem(last=False)
+        call.done.set()
@@ -31,6 +31,21 @@ class Settings(BaseSettings):
         env="PORT",
     )
 
+    # Prediction model: joblib file or native artefact directory
+    MODEL_PATH: str = Field(
+        _toml.get("app", {}).get("model_path", "models/stock_model"),
+        env="MODEL_PATH",
+    )
+    # Scoring tier: "full" (all analyzers) or "fast" (distilled text scorer)
+    SCORING_TIER: str = Field(
+        _toml.get("app", {}).get("scoring_tier", "full"),
+        env="SCORING_TIER",
+    )
+    FAST_MODEL_PATH: Optional[str] = Field(
+        _toml.get("app", {}).get("fast_model_path", None),
+        env="FAST_MODEL_PATH",
+    )
+
     # MongoDB Atlas (secret—only required in production)
     MONGODB_URI: Optional[SecretStr] = Field(
         _toml.get("app", {}).get("mongodb_uri", None),
@@ -40,6 +55,65 @@ class Settings(BaseSettings):
         _toml.get("app", {}).get("mongodb_db", "market_feeling"),
         env="MONGODB_DB",
     )
+    # Max concurrent blocking read-model/company lookups off the event loop
+    MONGODB_READ_CONCURRENCY: int = Field(
+        _toml.get("app", {}).get("mongodb_read_concurrency", 40),
+        env="MONGODB_READ_CONCURRENCY",
+    )
+
+    # In-process cache for GET /news results
+    NEWS_CACHE_TTL_SECONDS: float = Field(
+        _toml.get("app", {}).get("news_cache_ttl_seconds", 30.0),
+        env="NEWS_CACHE_TTL_SECONDS",
+    )
+    NEWS_CACHE_MAX_ENTRIES: int = Field(
+        _toml.get("app", {}).get("news_cache_max_entries", 1024),
+        env="NEWS_CACHE_MAX_ENTRIES",
+    )
+    COMPANY_DIRECTORY_REFRESH_SECONDS: float = Field(
+        _toml.get("app", {}).get("company_directory_refresh_seconds", 300.0),
+        env="COMPANY_DIRECTORY_REFRESH_SECONDS",
+    )
+    EVENT_SNAPSHOT_INTERVAL: int = Field(
+        _toml.get("app", {}).get("event_snapshot_interval", 100),
+        env="EVENT_SNAPSHOT_INTERVAL",
+    )
+    EVENT_APPEND_MAX_RETRIES: int = Field(
+        _toml.get("app", {}).get("event_append_max_retries", 5),
+        env="EVENT_APPEND_MAX_RETRIES",
+    )
+    # how long a registered (or failed) news / scored URL is remembered to
+    # absorb duplicates and redeliveries
+    NEWS_DEDUP_TTL_SECONDS: float = Field(
+        _toml.get("app", {}).get("news_dedup_ttl_seconds", 300.0),
+        env="NEWS_DEDUP_TTL_SECONDS",
+    )
+    NEWS_DEDUP_ERROR_TTL_SECONDS: float = Field(
+        _toml.get("app", {}).get("news_dedup_error_ttl_seconds", 10.0),
+        env="NEWS_DEDUP_ERROR_TTL_SECONDS",
+    )
+    NEWS_DEDUP_WAIT_TIMEOUT_SECONDS: float = Field(
+        _toml.get("app", {}).get("news_dedup_wait_timeout_seconds", 60.0),
+        env="NEWS_DEDUP_WAIT_TIMEOUT_SECONDS",
+    )
+    LIVE_STREAM_BUFFER_SIZE: int = Field(
+        _toml.get("app", {}).get("live_stream_buffer_size", 100),
+        env="LIVE_STREAM_BUFFER_SIZE",
+    )
+    LIVE_STREAM_HEARTBEAT_SECONDS: float = Field(
+        _toml.get("app", {}).get("live_stream_heartbeat_seconds", 15.0),
+        env="LIVE_STREAM_HEARTBEAT_SECONDS",
+    )
+    # testing only: news CSV (pipeline format) loaded into the in-memory read model
+    NEWS_IMPORT_CSV: Optional[str] = Field(
+        _toml.get("app", {}).get("news_import_csv"),
+        env="NEWS_IMPORT_CSV",
+    )
+    # testing only: JSONL log the in-memory event store appends to and reloads
+    EVENT_STORE_FILE: Optional[str] = Field(
+        _toml.get("app", {}).get("event_store_file"),
+        env="EVENT_STORE_FILE",
+    )
 
     # Google Pub/Sub
     GCP_PROJECT: str = Field(
@@ -58,6 +132,68 @@ class Settings(BaseSettings):
         _toml.get("app", {}).get("pubsub_subscription_news_scraper", ""),
         env="PUBSUB_SUBSCRIPTION_NEWS_SCRAPER",
     )
+    # publisher batching: a batch is sent at whichever limit is hit first
+    PUBSUB_BATCH_MAX_MESSAGES: int = Field(
+        _toml.get("app", {}).get("pubsub_batch_max_messages", 100),
+        env="PUBSUB_BATCH_MAX_MESSAGES",
+    )
+    PUBSUB_BATCH_MAX_BYTES: int = Field(
+        _toml.get("app", {}).get("pubsub_batch_max_bytes", 1_000_000),
+        env="PUBSUB_BATCH_MAX_BYTES",
+    )
+    PUBSUB_BATCH_MAX_LATENCY_SECONDS: float = Field(
+        _toml.get("app", {}).get("pubsub_batch_max_latency_seconds", 0.01),
+        env="PUBSUB_BATCH_MAX_LATENCY_SECONDS",
+    )
+    PUBSUB_PUBLISH_MAX_IN_FLIGHT: int = Field(
+        _toml.get("app", {}).get("pubsub_publish_max_in_flight", 1000),
+        env="PUBSUB_PUBLISH_MAX_IN_FLIGHT",
+    )
+    # news subscriber: scoring threads and how many messages may be leased
+    NEWS_SUBSCRIBER_WORKERS: int = Field(
+        _toml.get("app", {}).get("news_subscriber_workers", 4),
+        env="NEWS_SUBSCRIBER_WORKERS",
+    )
+    NEWS_SUBSCRIBER_MAX_MESSAGES: int = Field(
+        _toml.get("app", {}).get("news_subscriber_max_messages", 8),
+        env="NEWS_SUBSCRIBER_MAX_MESSAGES",
+    )
+    NEWS_SUBSCRIBER_MAX_BYTES: int = Field(
+        _toml.get("app", {}).get("news_subscriber_max_bytes", 10 * 1024 * 1024),
+        env="NEWS_SUBSCRIBER_MAX_BYTES",
+    )
+    NEWS_SUBSCRIBER_MAX_LEASE_SECONDS: int = Field(
+        _toml.get("app", {}).get("news_subscriber_max_lease_seconds", 600),
+        env="NEWS_SUBSCRIBER_MAX_LEASE_SECONDS",
+    )
+    NEWS_SUBSCRIBER_MIN_LEASE_EXTENSION_SECONDS: int = Field(
+        _toml.get("app", {}).get("news_subscriber_min_lease_extension_seconds", 60),
+        env="NEWS_SUBSCRIBER_MIN_LEASE_EXTENSION_SECONDS",
+    )
+    # "pubsub", or "in-memory" to run the subscribers and publisher on an
+    # in-process bus (offline load testing, any ENVIRONMENT)
+    MESSAGE_BUS: str = Field(
+        _toml.get("app", {}).get("message_bus", "pubsub"),
+        env="MESSAGE_BUS",
+    )
+    MESSAGE_BUS_LATENCY_SECONDS: float = Field(
+        _toml.get("app", {}).get("message_bus_latency_seconds", 0.0),
+        env="MESSAGE_BUS_LATENCY_SECONDS",
+    )
+    # in-memory bus only: recorded NEW_LATEST_NEWS messages (JSONL) replayed
+    # into the news subscription on startup
+    NEWS_REPLAY_FILE: Optional[str] = Field(
+        _toml.get("app", {}).get("news_replay_file"),
+        env="NEWS_REPLAY_FILE",
+    )
+    NEWS_REPLAY_RATE: float = Field(
+        _toml.get("app", {}).get("news_replay_rate", 10.0),
+        env="NEWS_REPLAY_RATE",
+    )
+    NEWS_REPLAY_REPEAT: int = Field(
+        _toml.get("app", {}).get("news_replay_repeat", 1),
+        env="NEWS_REPLAY_REPEAT",
+    )
 
     class Config:
         # load a .env file for local testing
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from stock_api.domain.company import Company
+
+
+class AsyncCompanyRepository(ABC):
+    @abstractmethod
+    async def exists(self, id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> dict[str, Company]:
+        pass
+
+    @abstractmethod
+    async def find_by_ticker(self, ticker: str) -> Optional[Company]:
+        pass
+
+    @abstractmethod
+    async def find_by_asset_id(self, asset_id: str) -> Optional[Company]:
+        pass
+
+    @abstractmethod
+    async def find_by_asset_ids(self, asset_ids: List[str]) -> Dict[str, Company]:
+        pass
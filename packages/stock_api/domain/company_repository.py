@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 
 from stock_api.domain.company import Company
 
@@ -21,6 +21,11 @@ class CompanyRepository(ABC):
     def find_by_asset_id(self, asset_id: str) -> Optional[Company]:
         pass
 
+    @abstractmethod
+    def find_by_asset_ids(self, asset_ids: List[str]) -> Dict[str, Company]:
+        """Companies found among *asset_ids*, keyed by asset id."""
+        pass
+
     @abstractmethod
     def save(self, company: Company):
         pass
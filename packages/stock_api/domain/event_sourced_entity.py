@@ -5,13 +5,15 @@ from stock_api.domain.events import DomainEvent
 
 class EventSourcedEntity:
 
-    def __init__(self, stream: List[DomainEvent]):
+    def __init__(self, stream: List[DomainEvent], version: int = 0):
+        """Replay *stream* on top of a state that already folds *version*
+        events (a snapshot); with the default 0 the stream is the history."""
         self._uncommitted_events: List[DomainEvent] = []
-        self._version = 0
+        self._version = version
         if stream:
             for e in stream:
                 self.when(e)
-            self._version = len(stream)
+            self._version = version + len(stream)
 
     @abstractmethod
     def when(self, event: DomainEvent):
@@ -20,6 +22,18 @@ class EventSourcedEntity:
     def apply(self, event: DomainEvent):
         self._uncommitted_events.append(event)
         self.when(event)
+        self._version += 1
+
+    @property
+    def expected_version(self) -> int:
+        """Stream version this entity was loaded at: where its uncommitted
+        events must be appended."""
+        return self._version - len(self._uncommitted_events)
+
+    @property
+    def version(self) -> int:
+        """Number of events folded into the current state."""
+        return self._version
 
     def get_uncommitted_events(self) -> List[DomainEvent]:
         return list(self._uncommitted_events)
@@ -5,8 +5,15 @@ from stock_api.domain.prediction_aggregate import PredictionAggregate
 class EventStoreRepository(ABC):
     @abstractmethod
     def save(self, prediction: PredictionAggregate):
+        """Append the uncommitted events at the version the aggregate was
+        loaded at; raises ConcurrencyException if that version is taken."""
         pass
 
     @abstractmethod
     def find_by_id(self, ticker: str) -> PredictionAggregate:
         pass
+
+    @abstractmethod
+    def has_news(self, ticker: str, news_id: str) -> bool:
+        """Whether any event of the *ticker* stream registered *news_id*."""
+        pass
@@ -0,0 +1,9 @@
+class ConcurrencyException(Exception):
+    """Raised when events are appended at a version another writer already took."""
+
+    def __init__(self, aggregate_id: str, expected_version: int):
+        super().__init__(
+            f"Stream '{aggregate_id}' moved past version {expected_version}"
+        )
+        self.aggregate_id = aggregate_id
+        self.expected_version = expected_version
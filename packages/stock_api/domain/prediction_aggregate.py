@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from stock_api.domain.event_sourced_entity import EventSourcedEntity
 from stock_api.domain.events import (
@@ -6,13 +6,22 @@ from stock_api.domain.events import (
     make_asset_feeling_detected_event,
 )
 from stock_api.domain.news import News
+from stock_api.domain.prediction_snapshot import PredictionSnapshot
 from stock_api.domain.prediction_state import PredictionState
 
 
 class PredictionAggregate(EventSourcedEntity):
-    def __init__(self, stream: List[DomainEvent]):
-        self.__state = PredictionState().empty()
-        super().__init__(stream)
+    def __init__(
+        self,
+        stream: List[DomainEvent],
+        snapshot: Optional[PredictionSnapshot] = None,
+    ):
+        if snapshot is None:
+            self.__state = PredictionState().empty()
+            super().__init__(stream)
+        else:
+            self.__state = snapshot.state
+            super().__init__(stream, snapshot.version)
 
     @staticmethod
     def empty() -> "PredictionAggregate":
@@ -22,6 +31,16 @@ class PredictionAggregate(EventSourcedEntity):
     def from_events(stream: List[DomainEvent]) -> "PredictionAggregate":
         return PredictionAggregate(stream)
 
+    @staticmethod
+    def from_snapshot(
+        snapshot: PredictionSnapshot, stream: List[DomainEvent]
+    ) -> "PredictionAggregate":
+        """Aggregate from a snapshot plus the events recorded after it."""
+        return PredictionAggregate(stream, snapshot)
+
+    def snapshot(self, aggregate_id: str) -> PredictionSnapshot:
+        return PredictionSnapshot(aggregate_id, self._version, self.__state)
+
     def register_latest_news(self, news: News, feeling: int):
         self.apply(
             make_asset_feeling_detected_event(
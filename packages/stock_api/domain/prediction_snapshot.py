@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from stock_api.domain.prediction_state import PredictionState
+
+
+@dataclass
+class PredictionSnapshot:
+    """State of a PredictionAggregate after its first *version* events."""
+
+    aggregate_id: str
+    version: int
+    state: PredictionState
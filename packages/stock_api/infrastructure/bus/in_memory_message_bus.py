@@ -0,0 +1,280 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent import futures
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from stock_api.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _topic_path(project_id: str, topic: str) -> str:
+    return f"projects/{project_id}/topics/{topic}"
+
+
+def _subscription_path(project_id: str, subscription: str) -> str:
+    return f"projects/{project_id}/subscriptions/{subscription}"
+
+
+@dataclass
+class MessageBusStats:
+    published: int
+    delivered: int
+    acked: int
+    nacked: int
+    redelivered: int
+    backlog: int
+    outstanding: int
+
+
+class InMemoryMessage:
+    """The part of a Pub/Sub ``Message`` the subscribers use."""
+
+    def __init__(
+        self,
+        subscription: "_Subscription",
+        message_id: str,
+        data: bytes,
+        attributes: Dict[str, str],
+        ordering_key: str,
+        publish_time: float,
+    ):
+        self._subscription = subscription
+        self.message_id = message_id
+        self.data = data
+        self.attributes = attributes
+        self.ordering_key = ordering_key
+        self.publish_time = publish_time
+        self.delivery_attempt = 0
+
+    def ack(self) -> None:
+        self._subscription.settle(self, acked=True)
+
+    def nack(self) -> None:
+        self._subscription.settle(self, acked=False)
+
+
+class _Subscription:
+    def __init__(self, bus: "InMemoryMessageBus"):
+        self._bus = bus
+        self._ready = threading.Condition()
+        # heap of (visible_at, seq, message); seq keeps publish order on ties
+        self._queue: List[tuple] = []
+        self._seq = itertools.count()
+        self._outstanding: Dict[str, InMemoryMessage] = {}
+        self.delivered = 0
+        self.acked = 0
+        self.nacked = 0
+        self.redelivered = 0
+
+    def put(self, message: InMemoryMessage, delay: float) -> None:
+        with self._ready:
+            self._push(message, delay)
+            self._ready.notify()
+
+    def settle(self, message: InMemoryMessage, acked: bool) -> None:
+        with self._ready:
+            if self._outstanding.pop(message.message_id, None) is None:
+                return  # already acked or nacked
+            if acked:
+                self.acked += 1
+            else:
+                self.nacked += 1
+                self.redelivered += 1
+                self._push(message, self._bus.redelivery_delay)
+            self._ready.notify()
+
+    def _push(self, message: InMemoryMessage, delay: float) -> None:
+        heapq.heappush(
+            self._queue, (time.monotonic() + delay, next(self._seq), message)
+        )
+
+    def pull(
+        self, max_outstanding: int, stop: threading.Event
+    ) -> Optional[InMemoryMessage]:
+        """Next visible message once fewer than *max_outstanding* are leased."""
+        with self._ready:
+            while not stop.is_set():
+                now = time.monotonic()
+                wait = 0.1
+                if len(self._outstanding) < max_outstanding and self._queue:
+                    visible_at, _, message = self._queue[0]
+                    if visible_at <= now:
+                        heapq.heappop(self._queue)
+                        message.delivery_attempt += 1
+                        self._outstanding[message.message_id] = message
+                        self.delivered += 1
+                        return message
+                    wait = min(wait, visible_at - now)
+                self._ready.wait(wait)
+        return None
+
+    def wake(self) -> None:
+        with self._ready:
+            self._ready.notify_all()
+
+    def counts(self) -> tuple:
+        with self._ready:
+            return len(self._queue), len(self._outstanding)
+
+
+class _StreamingPull(futures.Future):
+    """Stands in for ``StreamingPullFuture``: ``result()`` blocks until
+    ``cancel()``, then returns ``None``."""
+
+    def __init__(self, stop: threading.Event, subscription: _Subscription):
+        super().__init__()
+        self._stop = stop
+        self._subscription = subscription
+
+    def cancel(self) -> bool:
+        self._stop.set()
+        self._subscription.wake()
+        if not self.done():
+            self.set_result(None)
+        return True
+
+
+class _PublisherClient:
+    def __init__(self, bus: "InMemoryMessageBus"):
+        self._bus = bus
+
+    def topic_path(self, project_id: str, topic: str) -> str:
+        return _topic_path(project_id, topic)
+
+    def publish(self, topic: str, data: bytes, ordering_key: str = "", **attrs):
+        return self._bus.publish(topic, data, ordering_key, attrs)
+
+    def resume_publish(self, topic: str, ordering_key: str) -> None:
+        pass
+
+
+class _SubscriberClient:
+    def __init__(self, bus: "InMemoryMessageBus"):
+        self._bus = bus
+
+    def subscription_path(self, project_id: str, subscription: str) -> str:
+        return _subscription_path(project_id, subscription)
+
+    def subscribe(self, subscription: str, callback, flow_control=None, **kwargs):
+        return self._bus.subscribe(subscription, callback, flow_control)
+
+
+class InMemoryMessageBus:
+    """In-process stand-in for Pub/Sub, for running the ingest path offline.
+
+    ``publisher_client()`` and ``subscriber_client()`` return objects with
+    the parts of ``PublisherClient`` / ``SubscriberClient`` the publisher and
+    subscribers use, so they can be given to them in place of the real ones.
+
+    A published message becomes visible to every subscription of its topic
+    after *latency* seconds. A message is delivered again
+    *redelivery_delay* seconds after a nack. As with the real client, whose
+    lease manager keeps extending ack deadlines, a message is never
+    redelivered while a subscriber holds it. Delivery respects the
+    ``max_messages`` of the subscriber's flow control, and callbacks run on
+    *callback_threads* threads per subscriber, as the client's default
+    scheduler does.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        redelivery_delay: float = 0.1,
+        callback_threads: int = 10,
+    ):
+        self.latency = latency
+        self.redelivery_delay = redelivery_delay
+        self._callback_threads = callback_threads
+        self._lock = threading.Lock()
+        self._topics: Dict[str, List[_Subscription]] = {}
+        self._subscriptions: Dict[str, _Subscription] = {}
+        self._ids = itertools.count(1)
+        self._published = 0
+
+    def publisher_client(self) -> _PublisherClient:
+        return _PublisherClient(self)
+
+    def subscriber_client(self) -> _SubscriberClient:
+        return _SubscriberClient(self)
+
+    def create_subscription(
+        self, project_id: str, subscription: str, topic: str
+    ) -> None:
+        sub_path = _subscription_path(project_id, subscription)
+        topic_path = _topic_path(project_id, topic)
+        with self._lock:
+            if sub_path in self._subscriptions:
+                return
+            sub = self._subscriptions[sub_path] = _Subscription(self)
+            self._topics.setdefault(topic_path, []).append(sub)
+
+    def publish(
+        self, topic: str, data: bytes, ordering_key: str = "", attributes=None
+    ) -> futures.Future:
+        with self._lock:
+            message_id = str(next(self._ids))
+            self._published += 1
+            subscriptions = list(self._topics.get(topic, ()))
+        now = time.monotonic()
+        for sub in subscriptions:
+            sub.put(
+                InMemoryMessage(
+                    sub, message_id, data, dict(attributes or {}), ordering_key, now
+                ),
+                self.latency,
+            )
+
+        future = futures.Future()
+        if self.latency > 0:
+            timer = threading.Timer(self.latency, future.set_result, (message_id,))
+            timer.daemon = True
+            timer.start()
+        else:
+            future.set_result(message_id)
+        return future
+
+    def subscribe(
+        self, subscription: str, callback: Callable, flow_control=None
+    ) -> _StreamingPull:
+        with self._lock:
+            sub = self._subscriptions.get(subscription)
+        if sub is None:
+            raise ValueError(f"Subscription {subscription} does not exist")
+
+        max_outstanding = getattr(flow_control, "max_messages", None) or 1000
+        stop = threading.Event()
+        pull = _StreamingPull(stop, sub)
+        pool = futures.ThreadPoolExecutor(
+            max_workers=self._callback_threads, thread_name_prefix="bus-callback"
+        )
+
+        def _deliver():
+            try:
+                while True:
+                    message = sub.pull(max_outstanding, stop)
+                    if message is None:
+                        break
+                    pool.submit(callback, message)
+            finally:
+                pool.shutdown(wait=False)
+
+        threading.Thread(target=_deliver, daemon=True).start()
+        logger.info("Delivering %s (%d outstanding max)", subscription, max_outstanding)
+        return pull
+
+    def stats(self, project_id: str, subscription: str) -> MessageBusStats:
+        sub = self._subscriptions[_subscription_path(project_id, subscription)]
+        backlog, outstanding = sub.counts()
+        return MessageBusStats(
+            published=self._published,
+            delivered=sub.delivered,
+            acked=sub.acked,
+            nacked=sub.nacked,
+            redelivered=sub.redelivered,
+            backlog=backlog,
+            outstanding=outstanding,
+        )
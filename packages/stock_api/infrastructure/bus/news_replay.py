@@ -0,0 +1,99 @@
+import json
+import threading
+import time
+from typing import List, Optional
+
+from stock_api.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def load_messages(path: str) -> List[dict]:
+    """Recorded ``NEW_LATEST_NEWS`` messages: one JSON message body per line,
+    as the scraper publishes it (``eventId``, ``aggregateId``, ``type``,
+    ``payload``...)."""
+    messages = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            message = json.loads(line)
+            if message.get("type") == "NEW_LATEST_NEWS":
+                messages.append(message)
+    return messages
+
+
+class NewsReplayDriver:
+    """Publishes recorded messages to a topic at a target rate.
+
+    Sends are scheduled on a fixed timeline (message *i* at ``i / rate``
+    seconds), so a slow publish is caught up on instead of lowering the
+    rate. With *repeat* above 1 the recording is replayed that many times;
+    each pass after the first gets fresh news ids (``<id>-r<pass>``) so it is
+    scored again rather than found in the read model.
+    """
+
+    def __init__(
+        self,
+        client,
+        topic_path: str,
+        messages: List[dict],
+        rate: float,
+        repeat: int = 1,
+    ):
+        self._client = client
+        self._topic_path = topic_path
+        self._messages = messages
+        self._rate = rate
+        self._repeat = repeat
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.sent = 0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def run(self) -> None:
+        if not self._messages:
+            logger.warning("Nothing to replay to %s", self._topic_path)
+            return
+
+        total = len(self._messages) * self._repeat
+        logger.info(
+            "Replaying %d messages to %s at %.1f/s", total, self._topic_path, self._rate
+        )
+        start = time.monotonic()
+        for i in range(total):
+            delay = start + i / self._rate - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            if self._stop.is_set():
+                break
+
+            message = self._messages[i % len(self._messages)]
+            replay = i // len(self._messages)
+            if replay:
+                message = {
+                    **message,
+                    "aggregateId": f"{message['aggregateId']}-r{replay}",
+                }
+            self._client.publish(
+                self._topic_path,
+                json.dumps(message).encode("utf-8"),
+                type=message["type"],
+            )
+            self.sent += 1
+
+        elapsed = time.monotonic() - start
+        logger.info(
+            "Replayed %d messages in %.1fs (%.1f/s)",
+            self.sent,
+            elapsed,
+            self.sent / elapsed if elapsed > 0 else 0.0,
+        )
@@ -1,8 +1,11 @@
-import joblib
+from typing import Optional
+
 import pandas as pd
 
+from libs.fast_scorer import FastFeelingScorer
 from libs.feature_builder import build_feature_row, row_to_dataframe
 from libs.finbert_analyzer import FinBertAnalyzer
+from libs.model_artefact import load_model, stale_analyzers
 from libs.newspaper_scraper import NewspaperScraper
 from libs.spacy_analyzer import SpacySimilarityAnalyzer
 from libs.textblob_analyzer import TextBlobAnalyzer
@@ -13,13 +16,49 @@ from stock_api.logger import get_logger
 logger = get_logger(__name__)
 
 
+FULL_TIER = "full"
+FAST_TIER = "fast"
+SCORING_TIERS = (FULL_TIER, FAST_TIER)
+
+
 class JoblibPredictionModel(PredictionModel):
-    def __init__(self, model_path: str):
+    """Feeling model with two scoring tiers.
+
+    ``full`` runs TextBlob, FinBERT and spaCy and feeds the booster; ``fast``
+    uses the text-only student trained by ``stock_model.distiller``. The full
+    stack is only loaded when the model starts in the full tier.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        tier: str = FULL_TIER,
+        fast_model_path: Optional[str] = None,
+    ):
+        self._fast: Optional[FastFeelingScorer] = None
+        if fast_model_path:
+            logger.info("Loading fast scorer from %s", fast_model_path)
+            self._fast = FastFeelingScorer(fast_model_path)
+
+        self._full_loaded = tier != FAST_TIER
+        if self._full_loaded:
+            self._load_full(model_path)
+
+        self._scraper = NewspaperScraper()
+        self._tier = FULL_TIER
+        self.use_tier(tier)
+
+    def _load_full(self, model_path: str) -> None:
         logger.info("Loading prediction model from %s", model_path)
-        artefact = joblib.load(model_path)
-        self._booster = artefact["model"]
-        self._scaler = artefact["scaler"]
-        self._columns = artefact["columns"]
+        self._booster, self._scaler, self._columns, manifest = load_model(model_path)
+        if manifest is not None:
+            for name, (trained, current) in stale_analyzers(manifest).items():
+                logger.warning(
+                    "Analyzer %s changed since training (%s -> %s)",
+                    name,
+                    trained,
+                    current,
+                )
         logger.debug(
             "Model loaded: booster=%r, scaler=%r, %d feature columns",
             self._booster,
@@ -30,9 +69,23 @@ class JoblibPredictionModel(PredictionModel):
         self._tb = TextBlobAnalyzer()
         self._fb = FinBertAnalyzer()
         self._sp = SpacySimilarityAnalyzer()
-        self._scraper = NewspaperScraper()
         logger.info("Text analyzers initialized")
 
+    @property
+    def tier(self) -> str:
+        return self._tier
+
+    def use_tier(self, tier: str) -> None:
+        """Switch scoring tier, e.g. to ``fast`` during ingest spikes."""
+        if tier not in SCORING_TIERS:
+            raise ValueError(f"Unknown scoring tier {tier!r}")
+        if tier == FAST_TIER and self._fast is None:
+            raise ValueError("Fast tier requested but no fast scorer was loaded")
+        if tier == FULL_TIER and not self._full_loaded:
+            raise ValueError("Full tier requested but the full model was not loaded")
+        self._tier = tier
+        logger.info("Scoring tier set to '%s'", tier)
+
     def _extract_features(self, text: str, company_name: str) -> pd.DataFrame:
         logger.debug("Extracting features for company '%s'", company_name)
         features = build_feature_row(
@@ -51,6 +104,11 @@ class JoblibPredictionModel(PredictionModel):
 
     def _predict(self, text: str, company_name: str) -> RawFeeling:
         logger.info("Running prediction for company '%s'", company_name)
+        if self._tier == FAST_TIER:
+            raw_feeling = self._fast.predict_one(text)
+            logger.info("Fast scorer raw feeling=%s", raw_feeling)
+            return RawFeeling(raw_feeling)
+
         X = self._extract_features(text, company_name)
         raw_feeling = self._booster.predict(X)[0]
         logger.info("Model output raw feeling=%s", raw_feeling)
@@ -23,9 +23,11 @@ class PubSubCompaniesEventSubscriber:
         command_handler: RegisterCompanyCommandHandler,
         project_id: str,
         subscription: str,
+        client=None,
     ):
+        """*client* replaces the ``SubscriberClient`` (the in-memory bus)."""
         self._command_handler = command_handler
-        self._client = pubsub_v1.SubscriberClient()
+        self._client = client or pubsub_v1.SubscriberClient()
         self._sub_path = self._client.subscription_path(project_id, subscription)
         self._future: Optional[StreamingPullFuture] = None
 
@@ -1,10 +1,13 @@
 import json
 import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
 from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber.futures import StreamingPullFuture
 from google.cloud.pubsub_v1.subscriber.message import Message
 
@@ -13,6 +16,7 @@ from stock_api.application.news.register_news_command_handler import (
     RegisterNewsCommand,
 )
 from stock_api.infrastructure.listeners.pubsub_mapper import PubSubEventMapper
+from stock_api.infrastructure.listeners.subscriber_stats import SubscriberStats
 from stock_api.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,13 +28,83 @@ class PubSubNewsEventSubscriber:
         command_handler: RegisterNewsCommandHandler,
         project_id: str,
         subscription: str,
+        workers: int = 4,
+        max_messages: int = 8,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_lease_seconds: int = 600,
+        min_lease_extension_seconds: int = 60,
+        client=None,
     ):
+        """
+        Messages are handled on a dedicated pool of *workers* threads, sized
+        to the scoring capacity. At most *max_messages* (or *max_bytes*) are
+        leased at a time: the ones being handled plus a bounded queue waiting
+        for a worker. The client keeps extending the ack deadline of leased
+        messages, by at least *min_lease_extension_seconds* at a time, for up
+        to *max_lease_seconds*, so long scoring jobs are not redelivered.
+        *client* replaces the ``SubscriberClient`` (the in-memory bus).
+        """
         self._command_handler = command_handler
-        self._client = pubsub_v1.SubscriberClient()
+        self._client = client or pubsub_v1.SubscriberClient()
         self._sub_path = self._client.subscription_path(project_id, subscription)
         self._future: Optional[StreamingPullFuture] = None
+        self._flow_control = types.FlowControl(
+            max_messages=max_messages,
+            max_bytes=max_bytes,
+            max_lease_duration=max_lease_seconds,
+            min_duration_per_lease_extension=min_lease_extension_seconds,
+        )
+        self._workers = workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="news-handler"
+        )
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = SubscriberStats(
+            workers=workers,
+            queued=0,
+            in_flight=0,
+            received=0,
+            acked=0,
+            nacked=0,
+            handle_seconds=0.0,
+        )
 
-    def _callback(self, message: Message) -> None:
+    def stats(self) -> SubscriberStats:
+        with self._lock:
+            return SubscriberStats(**vars(self._stats))
+
+    def _dispatch(self, message: Message) -> None:
+        # runs on the client's callback threads: only hand the message over
+        if self._stopping.is_set():
+            message.nack()
+            return
+        with self._lock:
+            self._stats.received += 1
+            self._stats.queued += 1
+        self._executor.submit(self._process, message)
+
+    def _process(self, message: Message) -> None:
+        with self._lock:
+            self._stats.queued -= 1
+            self._stats.in_flight += 1
+        start = time.perf_counter()
+        acked = False
+        try:
+            if self._stopping.is_set():
+                message.nack()
+            else:
+                acked = self._callback(message)
+        finally:
+            with self._lock:
+                self._stats.in_flight -= 1
+                self._stats.handle_seconds += time.perf_counter() - start
+                if acked:
+                    self._stats.acked += 1
+                else:
+                    self._stats.nacked += 1
+
+    def _callback(self, message: Message) -> bool:
         try:
             raw = json.loads(message.data.decode("utf-8"))
 
@@ -49,6 +123,7 @@ class PubSubNewsEventSubscriber:
                 self._command_handler.handle(cmd)
 
             message.ack()
+            return True
         except Exception as e:
             logger.exception(
                 "Error handling Pub/Sub message: %s: %s\n%s",
@@ -57,12 +132,14 @@ class PubSubNewsEventSubscriber:
                 traceback.format_exc(),
             )
             message.nack()
+            return False
 
     def listen(self) -> None:
         def _run():
             self._future = self._client.subscribe(
                 self._sub_path,
-                callback=self._callback,
+                callback=self._dispatch,
+                flow_control=self._flow_control,
             )
             self._future.result()
 
@@ -70,5 +147,8 @@ class PubSubNewsEventSubscriber:
         thread.start()
 
     def stop(self) -> None:
+        # queued messages are nacked so another replica picks them up now
+        self._stopping.set()
         if self._future:
             self._future.cancel()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SubscriberStats:
+    workers: int
+    queued: int
+    in_flight: int
+    received: int
+    acked: int
+    nacked: int
+    handle_seconds: float
+
+    @property
+    def mean_handle_seconds(self) -> float:
+        done = self.acked + self.nacked
+        return self.handle_seconds / done if done else 0.0
@@ -0,0 +1,107 @@
+"""Rewrite string dates stored in Mongo as BSON datetimes.
+
+Older documents (CSV imports, earlier releases) hold ``news.date``,
+``events.occurred_at`` and ``events.payload.date`` as ISO strings, which
+never match the datetime bounds of the range queries. Documents are rewritten
+in place in batches; only string-typed fields are selected, so the command is
+idempotent and can be re-run after an interruption.
+
+Usage:
+
+    python -m stock_api.infrastructure.migrations.normalize_dates --dry-run
+    python -m stock_api.infrastructure.migrations.normalize_dates --batch-size 1000
+"""
+
+import argparse
+from typing import Dict, List
+
+from pymongo import MongoClient, UpdateOne
+from pymongo.collection import Collection
+
+from libs.dates import to_utc_datetime
+from stock_api.config import settings
+from stock_api.logger import get_logger
+
+logger = get_logger(__name__)
+
+# collection -> fields that must hold BSON datetimes
+DATE_FIELDS: Dict[str, List[str]] = {
+    "news": ["date"],
+    "events": ["occurred_at", "payload.date"],
+}
+
+
+def _get(doc: dict, path: str):
+    for part in path.split("."):
+        if not isinstance(doc, dict):
+            return None
+        doc = doc.get(part)
+    return doc
+
+
+def normalize_collection(
+    coll: Collection, fields: List[str], batch_size: int = 1000, dry_run: bool = False
+) -> Dict[str, int]:
+    """Convert every string value of *fields* in *coll*; returns counters."""
+    query = {"$or": [{field: {"$type": "string"}} for field in fields]}
+    projection = {field: 1 for field in fields}
+    counts = {"matched": 0, "modified": 0, "failed": 0}
+
+    def flush(ops: List[UpdateOne]) -> None:
+        if ops and not dry_run:
+            counts["modified"] += coll.bulk_write(ops, ordered=False).modified_count
+
+    ops: List[UpdateOne] = []
+    # Batches are applied while iterating; updated documents no longer match
+    # the query, so an interrupted run simply resumes where it stopped.
+    for doc in coll.find(query, projection).batch_size(batch_size):
+        counts["matched"] += 1
+        update = {}
+        for field in fields:
+            value = _get(doc, field)
+            if not isinstance(value, str):
+                continue
+            try:
+                update[field] = to_utc_datetime(value)
+            except ValueError:
+                counts["failed"] += 1
+                logger.warning(
+                    "%s %s: unparsable %s %r", coll.name, doc["_id"], field, value
+                )
+
+        if update:
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": update}))
+        if len(ops) >= batch_size:
+            flush(ops)
+            ops = []
+    flush(ops)
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store Mongo dates as datetimes")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Count documents, write nothing"
+    )
+    args = parser.parse_args()
+
+    if not settings.MONGODB_URI:
+        raise SystemExit("MONGODB_URI is not set")
+
+    db = MongoClient(settings.MONGODB_URI.get_secret_value())[settings.MONGODB_DB]
+    for name, fields in DATE_FIELDS.items():
+        counts = normalize_collection(db[name], fields, args.batch_size, args.dry_run)
+        logger.info(
+            "%s: %d matched, %d modified, %d unparsable%s",
+            name,
+            counts["matched"],
+            counts["modified"],
+            counts["failed"],
+            " (dry run)" if args.dry_run else "",
+        )
+
+
+if __name__ == "__main__":
+    main()
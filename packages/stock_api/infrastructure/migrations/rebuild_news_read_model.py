@@ -0,0 +1,196 @@
+"""Rebuild the ``news`` read model from the event store.
+
+Every ``ASSET_FEELING_DETECTED`` event is projected into ``LatestNews`` the
+way RegisterNewsCommandHandler does it, and upserted in batches into the
+``news_rebuild`` shadow collection while ``news`` keeps serving reads. The
+events are read in (aggregate, version) order from the unique
+``aggregate_version`` index, and the position after each batch is stored in
+``projection_checkpoints``, so an interrupted rebuild resumes where it
+stopped. Once the stream is exhausted the shadow collection gets the read
+model indexes and atomically replaces ``news``.
+
+News registered while the rebuild runs may miss the shadow collection when
+its ticker has already been passed; pause ingestion for the final swap, or
+run the command again to pick those events up.
+
+Usage:
+
+    python -m stock_api.infrastructure.migrations.rebuild_news_read_model
+    python -m stock_api.infrastructure.migrations.rebuild_news_read_model --restart
+"""
+
+import argparse
+import time
+from typing import Dict, Iterable, List, Optional
+
+from pymongo import ASCENDING, MongoClient, UpdateOne
+from pymongo.cursor import Cursor
+from pymongo.database import Database
+
+from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.config import settings
+from stock_api.domain.events import DomainEvent
+from stock_api.domain.prediction_state import PredictionState
+from stock_api.infrastructure.repositories.mongo_news_read_model_repository import (
+    MongoNewsReadModelRepository,
+    news_document,
+)
+from stock_api.logger import get_logger
+
+logger = get_logger(__name__)
+
+TARGET = "news"
+SHADOW = "news_rebuild"
+CHECKPOINTS = "projection_checkpoints"
+
+_EVENT_FIELDS = {"aggregate_id": 1, "version": 1, "type": 1, "payload": 1}
+
+
+def project(docs: Iterable[dict]) -> List[UpdateOne]:
+    """Read-model upserts for a batch of event documents."""
+    ops = []
+    for doc in docs:
+        if doc["type"] != "ASSET_FEELING_DETECTED":
+            continue
+        event = DomainEvent(
+            event_id="",
+            occurred_at=None,
+            aggregate_id=doc["aggregate_id"],
+            version=doc["version"],
+            type=doc["type"],
+            payload=doc["payload"],
+        )
+        state = PredictionState.with_feeling_detected(event)
+        news = LatestNews(
+            id=state.news_id,
+            ticker=state.ticker,
+            date=state.date,
+            title=state.title,
+            url=state.url,
+            feeling=state.feeling,
+        )
+        ops.append(UpdateOne({"_id": news.id}, {"$set": news_document(news)}, True))
+    return ops
+
+
+def _events_after(db: Database, checkpoint: Optional[dict], batch_size: int) -> Cursor:
+    query = {}
+    if checkpoint:
+        aggregate_id, version = checkpoint["aggregate_id"], checkpoint["version"]
+        query = {
+            "$or": [
+                {"aggregate_id": {"$gt": aggregate_id}},
+                {"aggregate_id": aggregate_id, "version": {"$gt": version}},
+            ]
+        }
+    return (
+        db["events"]
+        .find(query, _EVENT_FIELDS)
+        .sort([("aggregate_id", ASCENDING), ("version", ASCENDING)])
+        .batch_size(batch_size)
+    )
+
+
+def rebuild(
+    uri: str,
+    db_name: str,
+    batch_size: int = 5000,
+    restart: bool = False,
+    swap: bool = True,
+) -> Dict[str, float]:
+    """Project the events into the shadow collection and swap it in; returns
+    counters and the events/sec of this run."""
+    db = MongoClient(uri)[db_name]
+    checkpoints = db[CHECKPOINTS]
+    if restart:
+        db.drop_collection(SHADOW)
+        checkpoints.delete_one({"_id": SHADOW})
+    checkpoint = checkpoints.find_one({"_id": SHADOW})
+    if checkpoint:
+        logger.info(
+            "Resuming after %s v%d (%d events done)",
+            checkpoint["aggregate_id"],
+            checkpoint["version"],
+            checkpoint["events"],
+        )
+    counts = {"events": checkpoint["events"] if checkpoint else 0, "upserts": 0}
+
+    shadow = db[SHADOW]
+    started = time.perf_counter()
+    processed = 0
+
+    def flush(batch: List[dict]) -> None:
+        nonlocal processed
+        ops = project(batch)
+        if ops:
+            shadow.bulk_write(ops, ordered=False)
+        last = batch[-1]
+        processed += len(batch)
+        counts["events"] += len(batch)
+        counts["upserts"] += len(ops)
+        checkpoints.replace_one(
+            {"_id": SHADOW},
+            {
+                "aggregate_id": last["aggregate_id"],
+                "version": last["version"],
+                "events": counts["events"],
+            },
+            upsert=True,
+        )
+
+    batch: List[dict] = []
+    for doc in _events_after(db, checkpoint, batch_size):
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+    elapsed = time.perf_counter() - started
+    counts["events_per_s"] = round(processed / elapsed, 2) if elapsed > 0 else 0.0
+    logger.info(
+        "Projected %d events (%d upserts) at %.0f events/s",
+        processed,
+        counts["upserts"],
+        counts["events_per_s"],
+    )
+
+    if swap and SHADOW not in db.list_collection_names():
+        # never replace the live read model with nothing
+        logger.warning("No events projected, %s left as it is", TARGET)
+    elif swap:
+        # the indexes are built once, on the complete collection
+        MongoNewsReadModelRepository(uri, db_name, SHADOW).ensure_indexes()
+        shadow.rename(TARGET, dropTarget=True)
+        checkpoints.delete_one({"_id": SHADOW})
+        logger.info("Swapped %s into %s", SHADOW, TARGET)
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the news read model")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignore the checkpoint, start over"
+    )
+    parser.add_argument(
+        "--no-swap", action="store_true", help=f"Only fill {SHADOW}, keep {TARGET}"
+    )
+    args = parser.parse_args()
+
+    if not settings.MONGODB_URI:
+        raise SystemExit("MONGODB_URI is not set")
+
+    rebuild(
+        settings.MONGODB_URI.get_secret_value(),
+        settings.MONGODB_DB,
+        args.batch_size,
+        args.restart,
+        not args.no_swap,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Renumber event streams that hold duplicate versions.
+
+Before appends were checked against the expected version, concurrent
+handlers could both append version *n* to the same stream. Such streams keep
+the unique ``aggregate_version`` index from being created, and without it the
+event store cannot detect concurrent appends, so startup fails until they are
+repaired. Every affected stream is renumbered 0..n-1 in its current order
+(version, then occurrence time), its snapshot is dropped so the next load
+replays it, and the index is created at the end. Streams without duplicates
+are left untouched, so the command can be re-run after an interruption.
+
+Rebuild the news read model afterwards (``rebuild_news_read_model
+--restart``), as its checkpoint refers to the old versions.
+
+Usage:
+
+    python -m stock_api.infrastructure.migrations.repair_event_versions --dry-run
+    python -m stock_api.infrastructure.migrations.repair_event_versions
+"""
+
+import argparse
+from typing import Dict, List
+
+from pymongo import ASCENDING, MongoClient, UpdateOne
+from pymongo.database import Database
+
+from stock_api.config import settings
+from stock_api.infrastructure.repositories.mongo_event_store_repository import (
+    MongoEventStoreRepository,
+)
+from stock_api.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def duplicated_streams(db: Database) -> List[str]:
+    """Aggregate ids with at least one version appended more than once."""
+    pipeline = [
+        {
+            "$group": {
+                "_id": {"aggregate_id": "$aggregate_id", "version": "$version"},
+                "count": {"$sum": 1},
+            }
+        },
+        {"$match": {"count": {"$gt": 1}}},
+        {"$group": {"_id": "$_id.aggregate_id"}},
+    ]
+    return sorted(
+        doc["_id"] for doc in db["events"].aggregate(pipeline, allowDiskUse=True)
+    )
+
+
+def renumber_stream(
+    db: Database, aggregate_id: str, batch_size: int = 1000, dry_run: bool = False
+) -> int:
+    """Give the events of *aggregate_id* consecutive versions; returns the
+    number of events whose version changed."""
+    cursor = (
+        db["events"]
+        .find({"aggregate_id": aggregate_id}, {"version": 1})
+        .sort([("version", ASCENDING), ("occurred_at", ASCENDING), ("_id", ASCENDING)])
+    )
+    changed = 0
+    ops: List[UpdateOne] = []
+    for version, doc in enumerate(cursor):
+        if doc["version"] == version:
+            continue
+        changed += 1
+        ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"version": version}}))
+        if len(ops) >= batch_size and not dry_run:
+            db["events"].bulk_write(ops, ordered=False)
+            ops = []
+    if ops and not dry_run:
+        db["events"].bulk_write(ops, ordered=False)
+
+    if not dry_run:
+        # folded from the old numbering
+        db["snapshots"].delete_one({"_id": aggregate_id})
+    return changed
+
+
+def repair(
+    uri: str, db_name: str, batch_size: int = 1000, dry_run: bool = False
+) -> Dict[str, int]:
+    db = MongoClient(uri)[db_name]
+    counts = {"streams": 0, "renumbered": 0}
+    for aggregate_id in duplicated_streams(db):
+        changed = renumber_stream(db, aggregate_id, batch_size, dry_run)
+        counts["streams"] += 1
+        counts["renumbered"] += changed
+        logger.info("%s: %d events renumbered", aggregate_id, changed)
+
+    if not dry_run:
+        MongoEventStoreRepository(uri, db_name).ensure_indexes()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Renumber duplicate event versions")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Count events, write nothing"
+    )
+    args = parser.parse_args()
+
+    if not settings.MONGODB_URI:
+        raise SystemExit("MONGODB_URI is not set")
+
+    counts = repair(
+        settings.MONGODB_URI.get_secret_value(),
+        settings.MONGODB_DB,
+        args.batch_size,
+        args.dry_run,
+    )
+    logger.info(
+        "%d streams repaired, %d events renumbered%s",
+        counts["streams"],
+        counts["renumbered"],
+        " (dry run)" if args.dry_run else "",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,19 @@
 import json
+from concurrent import futures
 from datetime import datetime, date
 from typing import List
 
 from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1 import types
 from stock_api.domain.event_publisher import DomainEventPublisher
 from stock_api.domain.events import DomainEvent
 from stock_api.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional: the stdlib encoder is used instead
+    orjson = None
+
 logger = get_logger(__name__)
 
 
@@ -16,47 +23,108 @@ def _serialize_datetime(o):
     raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
 
 
+def _dumps(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(
+        payload,
+        default=_serialize_datetime,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def event_message(event: DomainEvent, asset_id: str) -> bytes:
+    event_payload = {
+        "assetId": asset_id,
+        "url": event.payload["url"],
+        "newsId": event.payload["news_id"],
+        "title": event.payload["title"],
+        "date": event.payload["date"],
+        "feeling": event.payload["feeling"],
+    }
+
+    payload = {
+        "eventId": event.event_id,
+        "occurredAt": event.occurred_at,
+        "aggregateId": event.aggregate_id,
+        "version": event.version,
+        "type": event.type,
+        "payload": event_payload,
+    }
+
+    return _dumps(payload)
+
+
 class PubSubEventPublisher(DomainEventPublisher):
-    def __init__(self, project_id: str | None, topic: str | None):
+    def __init__(
+        self,
+        project_id: str | None,
+        topic: str | None,
+        max_messages: int = 100,
+        max_bytes: int = 1_000_000,
+        max_latency: float = 0.01,
+        max_in_flight: int = 1000,
+        client=None,
+    ):
+        """
+        Messages are batched by the client (up to *max_messages*, *max_bytes*
+        or *max_latency* seconds per batch) and published with the ticker as
+        ordering key, so each ticker's events arrive in version order. At most
+        *max_in_flight* messages are outstanding across all callers; further
+        publishes block until some are acknowledged. *client* replaces the
+        ``PublisherClient`` (a fake in benchmarks).
+        """
         self._enabled = bool(project_id and topic)
         if not self._enabled:
             return
 
-        self._publisher = pubsub_v1.PublisherClient()
+        if client is None:
+            client = pubsub_v1.PublisherClient(
+                batch_settings=types.BatchSettings(
+                    max_messages=max_messages,
+                    max_bytes=max_bytes,
+                    max_latency=max_latency,
+                ),
+                publisher_options=types.PublisherOptions(
+                    enable_message_ordering=True,
+                    flow_control=types.PublishFlowControl(
+                        message_limit=max_in_flight,
+                        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+                    ),
+                ),
+            )
+        self._publisher = client
         self._topic_path = self._publisher.topic_path(project_id, topic)
 
     def publish(self, events: List[DomainEvent], asset_id: str):
         if not self._enabled:
             return
 
-        for event in events:
-            event_payload = {
-                "assetId": asset_id,
-                "url": event.payload["url"],
-                "newsId": event.payload["news_id"],
-                "title": event.payload["title"],
-                "date": event.payload["date"],
-                "feeling": event.payload["feeling"],
-            }
-
-            payload = {
-                "eventId": event.event_id,
-                "occurredAt": event.occurred_at,
-                "aggregateId": event.aggregate_id,
-                "version": event.version,
-                "type": event.type,
-                "payload": event_payload,
-            }
-
-            message_bytes = json.dumps(
-                payload,
-                default=_serialize_datetime,
-                separators=(",", ":"),
-            ).encode("utf-8")
-
-            future = self._publisher.publish(
-                self._topic_path, message_bytes, type=event.type
+        # Hand every event to the batcher first and wait once for all of
+        # them, instead of a broker round trip per event.
+        pending = [
+            self._publisher.publish(
+                self._topic_path,
+                event_message(event, asset_id),
+                ordering_key=event.aggregate_id,
+                type=event.type,
             )
+            for event in events
+        ]
+        futures.wait(pending)
+
+        failed = None
+        for event, future in zip(events, pending):
+            error = future.exception()
+            if error is None:
+                logger.debug(
+                    "Published event %s to %s", event.event_id, self._topic_path
+                )
+                continue
+            logger.error("Could not publish event %s: %s", event.event_id, error)
+            # a failed ordering key rejects further publishes until resumed
+            self._publisher.resume_publish(self._topic_path, event.aggregate_id)
+            failed = failed or error
 
-            future.result()
-            logger.debug("Published event %s to %s", event.event_id, self._topic_path)
+        if failed is not None:
+            raise failed
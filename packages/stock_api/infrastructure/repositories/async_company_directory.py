@@ -0,0 +1,50 @@
+from typing import Dict, List, Optional
+
+from stock_api.domain.async_company_repository import AsyncCompanyRepository
+from stock_api.domain.company import Company
+from stock_api.infrastructure.repositories.company_directory import CompanyDirectory
+
+
+class AsyncCompanyDirectory(AsyncCompanyRepository):
+    """Async view of a CompanyDirectory.
+
+    Directory hits are answered on the event loop; only misses are handed to
+    *fallback* (a threaded view of the same directory), so the common lookup
+    costs neither a thread hop nor a Mongo round trip.
+    """
+
+    def __init__(self, directory: CompanyDirectory, fallback: AsyncCompanyRepository):
+        self.__directory = directory
+        self.__fallback = fallback
+
+    async def exists(self, id: str) -> bool:
+        return await self.find_by_asset_id(id) is not None
+
+    async def get_all(self) -> dict[str, Company]:
+        return self.__directory.get_all()
+
+    async def find_by_ticker(self, ticker: str) -> Optional[Company]:
+        company = self.__directory.cached_by_ticker(ticker)
+        if company is None:
+            company = await self.__fallback.find_by_ticker(ticker)
+        return company
+
+    async def find_by_asset_id(self, asset_id: str) -> Optional[Company]:
+        company = self.__directory.cached_by_asset_id(asset_id)
+        if company is None:
+            company = await self.__fallback.find_by_asset_id(asset_id)
+        return company
+
+    async def find_by_asset_ids(self, asset_ids: List[str]) -> Dict[str, Company]:
+        found = {}
+        missing = []
+        for asset_id in asset_ids:
+            company = self.__directory.cached_by_asset_id(asset_id)
+            if company is None:
+                missing.append(asset_id)
+            else:
+                found[asset_id] = company
+
+        if missing:
+            found.update(await self.__fallback.find_by_asset_ids(missing))
+        return found
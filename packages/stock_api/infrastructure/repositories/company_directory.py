@@ -0,0 +1,116 @@
+import threading
+from typing import Dict, List, Optional
+
+from stock_api.domain.company import Company
+from stock_api.domain.company_repository import CompanyRepository
+from stock_api.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CompanyDirectory(CompanyRepository):
+    """In-process copy of the company table, indexed by asset id and ticker.
+
+    Wraps the persistent repository: ``load`` reads every company once, saves
+    go through to the repository and update both indexes, and lookups are dict
+    hits. A miss falls back to the repository (a company registered through
+    another instance), caching what it finds. ``start_refresh`` reloads the
+    whole table periodically so instances that did not receive an
+    ``ASSET_CREATED`` message converge.
+    """
+
+    def __init__(self, repository: CompanyRepository):
+        self.__repository = repository
+        self.__lock = threading.Lock()
+        self.__by_asset_id: Dict[str, Company] = {}
+        self.__by_ticker: Dict[str, Company] = {}
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def load(self) -> None:
+        companies = self.__repository.get_all().values()
+        by_asset_id = {c.id: c for c in companies}
+        by_ticker = {c.ticker: c for c in companies}
+        with self.__lock:
+            self.__by_asset_id = by_asset_id
+            self.__by_ticker = by_ticker
+        logger.info("Company directory loaded: %d companies", len(by_asset_id))
+
+    def start_refresh(self, interval_seconds: float) -> None:
+        if self.__thread is not None or interval_seconds <= 0:
+            return
+
+        def _run():
+            while not self.__stop.wait(interval_seconds):
+                try:
+                    self.load()
+                except Exception as e:
+                    # keep serving the previous snapshot
+                    logger.warning("Company directory refresh failed: %s", e)
+
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=_run, daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__stop.set()
+        self.__thread = None
+
+    def cached_by_asset_id(self, asset_id: str) -> Optional[Company]:
+        """Directory-only lookup, never a repository round trip."""
+        return self.__by_asset_id.get(asset_id)
+
+    def cached_by_ticker(self, ticker: str) -> Optional[Company]:
+        """Directory-only lookup, never a repository round trip."""
+        return self.__by_ticker.get(ticker)
+
+    def exists(self, id: str) -> bool:
+        return self.find_by_asset_id(id) is not None
+
+    def get_all(self) -> dict[str, Company]:
+        return dict(self.__by_ticker)
+
+    def find_by_ticker(self, ticker: str) -> Optional[Company]:
+        company = self.__by_ticker.get(ticker)
+        if company is None:
+            company = self.__repository.find_by_ticker(ticker)
+            if company is not None:
+                self.__put(company)
+        return company
+
+    def find_by_asset_id(self, asset_id: str) -> Optional[Company]:
+        company = self.__by_asset_id.get(asset_id)
+        if company is None:
+            company = self.__repository.find_by_asset_id(asset_id)
+            if company is not None:
+                self.__put(company)
+        return company
+
+    def find_by_asset_ids(self, asset_ids: List[str]) -> Dict[str, Company]:
+        found = {}
+        missing = []
+        for asset_id in asset_ids:
+            company = self.__by_asset_id.get(asset_id)
+            if company is None:
+                missing.append(asset_id)
+            else:
+                found[asset_id] = company
+
+        if missing:
+            # one repository lookup for every miss
+            for company in self.__repository.find_by_asset_ids(missing).values():
+                self.__put(company)
+                found[company.id] = company
+        return found
+
+    def save(self, company: Company):
+        self.__repository.save(company)
+        self.__put(company)
+
+    def __put(self, company: Company) -> None:
+        with self.__lock:
+            previous = self.__by_asset_id.get(company.id)
+            if previous is not None and previous.ticker != company.ticker:
+                self.__by_ticker.pop(previous.ticker, None)
+            self.__by_asset_id[company.id] = company
+            self.__by_ticker[company.ticker] = company
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from stock_api.domain.company import Company
 from stock_api.domain.company_repository import CompanyRepository
@@ -36,6 +36,10 @@ class InMemoryCompanyRepository(CompanyRepository):
                 return c
         return None
 
+    def find_by_asset_ids(self, asset_ids: List[str]) -> Dict[str, Company]:
+        wanted = set(asset_ids)
+        return {c.id: c for c in self.__companies if c.id in wanted}
+
     def save(self, company: Company):
         for idx, stored in enumerate(self.__companies):
             if stored.ticker == company.ticker:
@@ -1,24 +1,178 @@
-from typing import List
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from libs.dates import to_iso_utc, to_utc_datetime
 from stock_api.domain.event_store_repository import EventStoreRepository
 from stock_api.domain.events import DomainEvent
+from stock_api.domain.exceptions import ConcurrencyException
 from stock_api.domain.prediction_aggregate import PredictionAggregate
+from stock_api.domain.prediction_snapshot import PredictionSnapshot
+from stock_api.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (event_id, occurred_at, type, payload): the aggregate id is the stream key
+# and the version the position in the stream, so neither is stored per event.
+_StoredEvent = Tuple[str, datetime, str, dict]
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return to_iso_utc(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
 
 
 class InMemoryEventStoreRepository(EventStoreRepository):
-    def __init__(self):
-        self.__event_store: List[DomainEvent] = []
+    def __init__(self, path: Optional[str] = None):
+        """
+        Events are kept per aggregate, with the folded state of each stream
+        cached so loads only replay the events appended since the last one.
+
+        With *path*, every append is also written to that JSONL file, and the
+        streams in it are reloaded on start.
+        """
+        self._lock = threading.Lock()
+        self._streams: Dict[str, List[_StoredEvent]] = {}
+        self._snapshots: Dict[str, PredictionSnapshot] = {}
+        self._news_ids: Dict[str, Set[str]] = {}
+        self._file = None
+        if path:
+            complete = self._reload(path)
+            self._file = open(path, "a", encoding="utf-8")
+            if not complete:
+                # start past the torn line rather than extending it
+                self._file.write("\n")
 
     def save(self, prediction: PredictionAggregate):
         events = prediction.get_uncommitted_events()
-        for event in events:
-            self.__event_store.append(event)
+        if not events:
+            return
+
+        ticker = events[0].aggregate_id
+        with self._lock:
+            stream = self._streams.setdefault(ticker, [])
+            if len(stream) != prediction.expected_version:
+                raise ConcurrencyException(ticker, prediction.expected_version)
+
+            news_ids = self._news_ids.setdefault(ticker, set())
+            for event in events:
+                stream.append(
+                    (event.event_id, event.occurred_at, event.type, event.payload)
+                )
+                news_ids.add(event.payload.get("news_id"))
+            if self._file is not None:
+                self._write(events)
 
     def find_by_id(self, ticker: str) -> PredictionAggregate:
-        events_for_aggregate: List[DomainEvent] = [
-            event for event in self.__event_store if event.aggregate_id == ticker
+        with self._lock:
+            stream = self._streams.get(ticker)
+            if not stream:
+                return PredictionAggregate.empty()
+
+            snapshot = self._snapshots.get(ticker)
+            start = snapshot.version if snapshot else 0
+            tail = [
+                self._event(ticker, version, stream[version])
+                for version in range(start, len(stream))
+            ]
+            if snapshot is None:
+                prediction = PredictionAggregate.from_events(tail)
+            else:
+                prediction = PredictionAggregate.from_snapshot(snapshot, tail)
+
+            if tail:
+                self._snapshots[ticker] = prediction.snapshot(ticker)
+            return prediction
+
+    def has_news(self, ticker: str, news_id: str) -> bool:
+        with self._lock:
+            return news_id in self._news_ids.get(ticker, ())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @staticmethod
+    def _event(ticker: str, version: int, stored: _StoredEvent) -> DomainEvent:
+        event_id, occurred_at, event_type, payload = stored
+        return DomainEvent(
+            event_id=event_id,
+            occurred_at=occurred_at,
+            aggregate_id=ticker,
+            version=version,
+            type=event_type,
+            payload=payload,
+        )
+
+    def _write(self, events: List[DomainEvent]) -> None:
+        lines = [
+            json.dumps(
+                {
+                    "event_id": event.event_id,
+                    "occurred_at": event.occurred_at,
+                    "aggregate_id": event.aggregate_id,
+                    "version": event.version,
+                    "type": event.type,
+                    "payload": event.payload,
+                },
+                default=_json_default,
+            )
+            for event in events
         ]
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def _reload(self, path: str) -> bool:
+        """Load the streams in *path*; False if its last line is incomplete."""
+        if not os.path.exists(path):
+            return True
+
+        loaded = 0
+        complete = True
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                complete = line.endswith("\n")
+                if not line.strip():
+                    continue
+                try:
+                    doc = json.loads(line)
+                except ValueError:
+                    # a crash can leave the last line half written
+                    logger.warning("Skipping unreadable event line in %s", path)
+                    continue
+
+                stream = self._streams.setdefault(doc["aggregate_id"], [])
+                if doc["version"] != len(stream):
+                    raise ValueError(
+                        f"Event log {path} has version {doc['version']} for "
+                        f"'{doc['aggregate_id']}', expected {len(stream)}"
+                    )
 
-        if not events_for_aggregate:
-            return PredictionAggregate.empty()
+                payload = doc["payload"]
+                if payload.get("date") is not None:
+                    payload["date"] = to_utc_datetime(payload["date"])
+                self._news_ids.setdefault(doc["aggregate_id"], set()).add(
+                    payload.get("news_id")
+                )
+                stream.append(
+                    (
+                        doc["event_id"],
+                        to_utc_datetime(doc["occurred_at"]),
+                        doc["type"],
+                        payload,
+                    )
+                )
+                loaded += 1
 
-        return PredictionAggregate.from_events(events_for_aggregate)
+        logger.info(
+            "Reloaded %d events in %d streams from %s",
+            loaded,
+            len(self._streams),
+            path,
+        )
+        return complete
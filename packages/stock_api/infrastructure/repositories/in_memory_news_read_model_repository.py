@@ -1,16 +1,39 @@
+from bisect import bisect_left, insort
 from datetime import datetime, timedelta, time, date
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import uuid4
 
+import pandas as pd
+
+from libs.dates import to_utc_datetime
 from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.application.news.news_page_cursor import NewsPageCursor
 from stock_api.application.news.news_read_model_repository import (
     NewsReadModelRepository,
 )
 
 
+# (date, id): the sort key of the per-ticker indexes
+_Key = Tuple[datetime, str]
+
+_CSV_COLUMNS = ["_id", "date", "ticker", "title", "url", "feeling"]
+
+
 class InMemoryNewsReadModelRepository(NewsReadModelRepository):
-    def __init__(self) -> None:
+    """News read model held in process memory.
+
+    Besides the id map, every ticker has a list of ``(date, id)`` keys kept
+    sorted on save, so range and top-k queries bisect to their slice instead
+    of scanning and sorting everything: O(log n + k).
+    """
+
+    def __init__(self, seed: bool = True) -> None:
         self._storage: dict[str, LatestNews] = {}
+        self._index: Dict[str, List[_Key]] = {}
+        self._keys: Dict[str, Tuple[str, _Key]] = {}  # id -> (ticker, key)
+
+        if not seed:
+            return
 
         now = datetime.utcnow().replace(microsecond=0)
         delta = timedelta(days=1)
@@ -69,35 +92,120 @@ class InMemoryNewsReadModelRepository(NewsReadModelRepository):
         return self._storage.get(news_id)
 
     def save(self, latest_news: LatestNews) -> None:
+        key = (to_utc_datetime(latest_news.date), latest_news.id)
+        self._unindex(latest_news.id)
         self._storage[latest_news.id] = latest_news
+        self._keys[latest_news.id] = (latest_news.ticker, key)
+        insort(self._index.setdefault(latest_news.ticker, []), key)
+
+    def bulk_save(self, items: Iterable[LatestNews]) -> int:
+        """Save many items, sorting each touched ticker index once at the end."""
+        touched: Set[str] = set()
+        count = 0
+        for news in items:
+            key = (to_utc_datetime(news.date), news.id)
+            if news.id in self._keys:
+                previous_ticker, previous_key = self._keys[news.id]
+                if previous_ticker in touched:
+                    # not sorted yet, so no bisect
+                    self._index[previous_ticker].remove(previous_key)
+                else:
+                    self._unindex(news.id)
+            self._storage[news.id] = news
+            self._keys[news.id] = (news.ticker, key)
+            self._index.setdefault(news.ticker, []).append(key)
+            touched.add(news.ticker)
+            count += 1
+
+        for ticker in touched:
+            self._index[ticker].sort()
+        return count
+
+    def load_csv(self, path: str, chunksize: int = 200_000) -> int:
+        """Bulk load a pipeline ``news_to_import_*.csv`` file; returns the rows read."""
+        return self.bulk_save(self._read_csv(path, chunksize))
+
+    @staticmethod
+    def _read_csv(path: str, chunksize: int) -> Iterable[LatestNews]:
+        for chunk in pd.read_csv(
+            path, usecols=_CSV_COLUMNS, chunksize=chunksize, keep_default_na=False
+        ):
+            dates = (
+                pd.to_datetime(chunk["date"], utc=True, format="ISO8601")
+                .dt.tz_localize(None)
+                .dt.floor("ms")
+                .dt.to_pydatetime()
+            )
+            for news_id, news_date, ticker, title, url, feeling in zip(
+                chunk["_id"].tolist(),
+                dates,
+                chunk["ticker"].tolist(),
+                chunk["title"].tolist(),
+                chunk["url"].tolist(),
+                chunk["feeling"].tolist(),
+            ):
+                yield LatestNews(
+                    id=str(news_id),
+                    ticker=ticker,
+                    date=news_date,
+                    title=title,
+                    url=url,
+                    feeling=int(feeling),
+                )
 
     def get_by_date_range(
         self, ticker: str, start_date: date, end_date: date
     ) -> List[LatestNews]:
-        results: List[LatestNews] = []
-
-        for news in self._storage.values():
-            if news.ticker != ticker:
-                continue
-
-            ndate = news.date.date() if isinstance(news.date, datetime) else news.date
-            if start_date <= ndate <= end_date:
-                results.append(news)
-
-        results.sort(key=lambda n: n.date)
-        return results
+        keys = self._index.get(ticker, [])
+        lo = bisect_left(keys, (datetime.combine(start_date, time.min),))
+        hi = bisect_left(
+            keys, (datetime.combine(end_date + timedelta(days=1), time.min),)
+        )
+        return [self._storage[news_id] for _, news_id in keys[lo:hi]]
 
     def get_latest_news_for_ticker(self, ticker: str, limit: int) -> List[LatestNews]:
         if limit < 1:
             return []
         limit = min(limit, 50)
 
-        def _to_datetime(d):
-            if isinstance(d, datetime):
-                return d
-            return datetime.combine(d, time.min)
-
-        matches = [news for news in self._storage.values() if news.ticker == ticker]
-        matches.sort(key=lambda n: _to_datetime(n.date), reverse=True)
+        keys = self._index.get(ticker, [])
+        return [self._storage[news_id] for _, news_id in reversed(keys[-limit:])]
+
+    def get_latest_news_for_tickers(
+        self, tickers: List[str], limit: int
+    ) -> Dict[str, List[LatestNews]]:
+        return {
+            ticker: self.get_latest_news_for_ticker(ticker, limit) for ticker in tickers
+        }
+
+    def get_page(
+        self,
+        ticker: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: int,
+        after: Optional[NewsPageCursor] = None,
+    ) -> List[LatestNews]:
+        if limit < 1:
+            return []
 
-        return matches[:limit]
+        keys = self._index.get(ticker, [])
+        lo = 0 if start is None else bisect_left(keys, (to_utc_datetime(start),))
+        hi = len(keys)
+        if end is not None:
+            # every key dated at or before end, whatever its id
+            end_key = (to_utc_datetime(end) + timedelta(microseconds=1),)
+            hi = bisect_left(keys, end_key)
+        if after is not None:
+            hi = min(hi, bisect_left(keys, (after.date, after.id)))
+
+        page = keys[max(lo, hi - limit) : hi]
+        return [self._storage[news_id] for _, news_id in reversed(page)]
+
+    def _unindex(self, news_id: str) -> None:
+        entry = self._keys.pop(news_id, None)
+        if entry is None:
+            return
+        ticker, key = entry
+        keys = self._index[ticker]
+        del keys[bisect_left(keys, key)]
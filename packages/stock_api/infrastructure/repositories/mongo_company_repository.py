@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
-from pymongo import MongoClient
+from pymongo import ASCENDING, MongoClient
 
 from stock_api.domain.company import Company
 from stock_api.domain.company_repository import CompanyRepository
@@ -21,6 +21,13 @@ class MongoCompanyRepository(CompanyRepository):
         client = MongoClient(uri)
         self._coll = client[db_name]["companies"]
 
+    def ensure_indexes(self) -> None:
+        """Create the ticker index used by news ingestion lookups."""
+        if not self._enabled:
+            return
+
+        self._coll.create_index([("ticker", ASCENDING)], name="ticker")
+
     def exists(self, id: str) -> bool:
         if not self._enabled:
             return False
@@ -61,6 +68,18 @@ class MongoCompanyRepository(CompanyRepository):
 
         return Company(id=doc["_id"], ticker=doc["ticker"], name=doc["name"])
 
+    def find_by_asset_ids(self, asset_ids: List[str]) -> Dict[str, Company]:
+        if not self._enabled or not asset_ids:
+            return {}
+
+        cursor = self._coll.find(
+            {"_id": {"$in": list(asset_ids)}}, {"_id": 1, "ticker": 1, "name": 1}
+        )
+        return {
+            doc["_id"]: Company(id=doc["_id"], ticker=doc["ticker"], name=doc["name"])
+            for doc in cursor
+        }
+
     def save(self, company: Company):
         if not self._enabled:
             return
@@ -1,16 +1,36 @@
-from typing import List
+from dataclasses import asdict
+from typing import List, Optional
 
-from pymongo import MongoClient
+from pymongo import ASCENDING, MongoClient
+from pymongo.cursor import Cursor
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+
+from libs.dates import to_utc_datetime
 from stock_api.domain.event_store_repository import EventStoreRepository
 from stock_api.domain.events import DomainEvent
+from stock_api.domain.exceptions import ConcurrencyException
 from stock_api.domain.prediction_aggregate import PredictionAggregate
+from stock_api.domain.prediction_snapshot import PredictionSnapshot
+from stock_api.domain.prediction_state import PredictionState
 from stock_api.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _normalize_payload(payload: dict) -> dict:
+    if payload.get("date") is None:
+        return payload
+    return {**payload, "date": to_utc_datetime(payload["date"])}
+
+
 class MongoEventStoreRepository(EventStoreRepository):
-    def __init__(self, uri: str | None, db_name: str):
+    def __init__(self, uri: str | None, db_name: str, snapshot_interval: int = 100):
+        """
+        Every *snapshot_interval* events the aggregate state is stored in the
+        ``snapshots`` collection, and loads replay only the events after the
+        latest snapshot. 0 disables snapshots.
+        """
+        self._snapshot_interval = snapshot_interval
         self._enabled = bool(uri)
         if not self._enabled:
             logger.warning(
@@ -20,6 +40,35 @@ class MongoEventStoreRepository(EventStoreRepository):
 
         client = MongoClient(uri)
         self._coll = client[db_name]["events"]
+        # one document per aggregate: its latest snapshot
+        self._snapshots = client[db_name]["snapshots"]
+
+    def ensure_indexes(self) -> None:
+        """Create the unique per-aggregate version index used to load streams,
+        and the news id index behind ``has_news``.
+
+        ``save`` relies on the former to detect concurrent appends, so failing
+        to create it (streams already holding duplicate versions) is fatal.
+        """
+        if not self._enabled:
+            return
+
+        try:
+            self._coll.create_index(
+                [("aggregate_id", ASCENDING), ("version", ASCENDING)],
+                name="aggregate_version",
+                unique=True,
+            )
+        except OperationFailure as e:
+            raise RuntimeError(
+                f"Could not create the unique aggregate_version index on events "
+                f"({e}); run stock_api.infrastructure.migrations."
+                f"repair_event_versions to renumber duplicate versions first"
+            ) from e
+        self._coll.create_index(
+            [("aggregate_id", ASCENDING), ("payload.news_id", ASCENDING)],
+            name="aggregate_news_id",
+        )
 
     def save(self, prediction: PredictionAggregate):
         if not self._enabled:
@@ -32,20 +81,37 @@ class MongoEventStoreRepository(EventStoreRepository):
             docs.append(
                 {
                     "event_id": event.event_id,
-                    "occurred_at": event.occurred_at,
+                    "occurred_at": to_utc_datetime(event.occurred_at),
                     "aggregate_id": event.aggregate_id,
                     "version": event.version,
                     "type": event.type,
-                    "payload": event.payload,
+                    "payload": _normalize_payload(event.payload),
                 }
             )
-        self._coll.insert_many(docs)
+        if not docs:
+            return
+
+        try:
+            # the unique aggregate_version index rejects a taken version
+            self._coll.insert_many(docs, ordered=True)
+        except BulkWriteError as e:
+            if any(
+                err.get("code") == 11000 for err in e.details.get("writeErrors", [])
+            ):
+                raise ConcurrencyException(
+                    events[0].aggregate_id, prediction.expected_version
+                ) from e
+            raise
+
+        if self._crossed_snapshot_interval(prediction.version, len(events)):
+            self._save_snapshot(prediction.snapshot(events[-1].aggregate_id))
 
     def find_by_id(self, ticker: str) -> PredictionAggregate:
         if not self._enabled:
             return PredictionAggregate.empty()
 
-        cursor = self._coll.find({"aggregate_id": ticker}).sort("version", 1)
+        snapshot = self._load_snapshot(ticker) if self._snapshot_interval else None
+        cursor = self._stream_cursor(ticker, snapshot.version if snapshot else 0)
 
         events_for_aggregate: List[DomainEvent] = []
         for doc in cursor:
@@ -59,7 +125,53 @@ class MongoEventStoreRepository(EventStoreRepository):
             )
             events_for_aggregate.append(event)
 
-        if not events_for_aggregate:
-            PredictionAggregate.empty()
+        if snapshot is not None:
+            return PredictionAggregate.from_snapshot(snapshot, events_for_aggregate)
 
         return PredictionAggregate.from_events(events_for_aggregate)
+
+    def has_news(self, ticker: str, news_id: str) -> bool:
+        if not self._enabled:
+            return False
+        return (
+            self._coll.find_one(
+                {"aggregate_id": ticker, "payload.news_id": news_id}, {"_id": 1}
+            )
+            is not None
+        )
+
+    def _crossed_snapshot_interval(self, version: int, appended: int) -> bool:
+        if not self._snapshot_interval or not appended:
+            return False
+        interval = self._snapshot_interval
+        return version // interval > (version - appended) // interval
+
+    def _save_snapshot(self, snapshot: PredictionSnapshot) -> None:
+        state = asdict(snapshot.state)
+        if state["date"] is not None:
+            state["date"] = to_utc_datetime(state["date"])
+        try:
+            # never replace a snapshot with an older one
+            self._snapshots.update_one(
+                {"_id": snapshot.aggregate_id, "version": {"$lt": snapshot.version}},
+                {"$set": {"version": snapshot.version, "state": state}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            pass
+
+    def _load_snapshot(self, ticker: str) -> Optional[PredictionSnapshot]:
+        doc = self._snapshots.find_one({"_id": ticker})
+        if not doc:
+            return None
+        return PredictionSnapshot(
+            aggregate_id=ticker,
+            version=doc["version"],
+            state=PredictionState(**doc["state"]),
+        )
+
+    def _stream_cursor(self, ticker: str, from_version: int = 0) -> Cursor:
+        query = {"aggregate_id": ticker}
+        if from_version:
+            query["version"] = {"$gte": from_version}
+        return self._coll.find(query).sort("version", ASCENDING)
@@ -1,9 +1,12 @@
 from datetime import datetime, date, time
-from typing import List
+from typing import Dict, List, Optional
 
 from pymongo import MongoClient, ASCENDING, DESCENDING
+from pymongo.cursor import Cursor
 
+from libs.dates import to_utc_datetime
 from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.application.news.news_page_cursor import NewsPageCursor
 from stock_api.application.news.news_read_model_repository import (
     NewsReadModelRepository,
 )
@@ -11,9 +14,24 @@ from stock_api.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Only the fields LatestNews is built from
+_PROJECTION = {"ticker": 1, "date": 1, "title": 1, "url": 1, "feeling": 1}
+
+
+def news_document(news: LatestNews) -> dict:
+    """The stored form of *news*."""
+    return {
+        "_id": news.id,
+        "ticker": news.ticker,
+        "date": to_utc_datetime(news.date),
+        "title": news.title,
+        "url": news.url,
+        "feeling": news.feeling,
+    }
+
 
 class MongoNewsReadModelRepository(NewsReadModelRepository):
-    def __init__(self, uri: str | None, db_name: str):
+    def __init__(self, uri: str | None, db_name: str, collection: str = "news"):
         """
         If uri is empty or None, this repository becomes a no-op stub:
           - get() always returns empty
@@ -27,14 +45,28 @@ class MongoNewsReadModelRepository(NewsReadModelRepository):
             return
 
         client = MongoClient(uri)
-        self._coll = client[db_name]["news"]
+        self._coll = client[db_name][collection]
+
+    def ensure_indexes(self) -> None:
+        """Create the indexes backing the per-ticker date queries."""
+        if not self._enabled:
+            return
+
+        # _id breaks date ties, so keyset pages are read in index order
+        self._coll.create_index(
+            [("ticker", ASCENDING), ("date", DESCENDING), ("_id", DESCENDING)],
+            name="ticker_date_id",
+        )
+        # superseded by its ticker_date_id prefix
+        if "ticker_date" in self._coll.index_information():
+            self._coll.drop_index("ticker_date")
 
     def get(self, news_id: str) -> LatestNews | None:
         if not self._enabled:
             # dummy: no data available
             return None
 
-        doc = self._coll.find_one({"_id": news_id})
+        doc = self._coll.find_one({"_id": news_id}, _PROJECTION)
         if not doc:
             return None
         return LatestNews(
@@ -51,17 +83,9 @@ class MongoNewsReadModelRepository(NewsReadModelRepository):
             # dummy: do nothing
             return
 
-        doc = {
-            "_id": news.id,
-            "ticker": news.ticker,
-            "date": news.date,
-            "title": news.title,
-            "url": news.url,
-            "feeling": news.feeling,
-        }
         self._coll.update_one(
             {"_id": news.id},
-            {"$set": doc},
+            {"$set": news_document(news)},
             upsert=True,
         )
 
@@ -71,15 +95,13 @@ class MongoNewsReadModelRepository(NewsReadModelRepository):
         if not self._enabled:
             return []
 
-        start_iso = datetime.combine(start_date, time.min).isoformat()
-        end_iso = datetime.combine(end_date, time.max).isoformat()
-
-        cursor = self._coll.find(
-            {
-                "ticker": ticker,
-                "date": {"$gte": start_iso, "$lte": end_iso},
-            }
-        ).sort("date", ASCENDING)
+        # Dates are stored as BSON datetimes (see libs.dates), so bound the
+        # range with datetimes too; ISO strings would never match them.
+        cursor = self._date_range_cursor(
+            ticker,
+            to_utc_datetime(datetime.combine(start_date, time.min)),
+            to_utc_datetime(datetime.combine(end_date, time.max)),
+        )
 
         results: List[LatestNews] = []
         for doc in cursor:
@@ -104,11 +126,7 @@ class MongoNewsReadModelRepository(NewsReadModelRepository):
             return []
         limit = min(limit, 50)
 
-        cursor = (
-            self._coll.find({"ticker": ticker})
-            .sort("date", DESCENDING)  # newest → oldest
-            .limit(limit)
-        )
+        cursor = self._latest_cursor(ticker, limit)
 
         results: List[LatestNews] = []
         for doc in cursor:
@@ -124,3 +142,122 @@ class MongoNewsReadModelRepository(NewsReadModelRepository):
             )
 
         return results
+
+    def get_latest_news_for_tickers(
+        self, tickers: List[str], limit: int
+    ) -> Dict[str, List[LatestNews]]:
+        results: Dict[str, List[LatestNews]] = {ticker: [] for ticker in tickers}
+        if not self._enabled or limit < 1 or not tickers:
+            return results
+        limit = min(limit, 50)
+
+        for doc in self._coll.aggregate(self._latest_pipeline(list(results), limit)):
+            results[doc["ticker"]].append(
+                LatestNews(
+                    id=doc["_id"],
+                    ticker=doc["ticker"],
+                    date=doc["date"],
+                    title=doc["title"],
+                    url=doc["url"],
+                    feeling=doc["feeling"],
+                )
+            )
+        return results
+
+    def _latest_pipeline(self, tickers: List[str], limit: int) -> List[dict]:
+        """One round trip for every ticker's top-*limit* news.
+
+        Each ticker gets its own ``$match``/``$sort``/``$limit`` branch, joined
+        with ``$unionWith``, so every branch reads just *limit* keys of the
+        ticker_date_id index. A single ``$in`` + ``$group`` would read every
+        news item of every ticker instead.
+        """
+
+        def branch(ticker: str) -> List[dict]:
+            return [
+                {"$match": {"ticker": ticker}},
+                {"$sort": {"date": -1, "_id": -1}},
+                {"$limit": limit},
+                {"$project": _PROJECTION},
+            ]
+
+        pipeline = branch(tickers[0])
+        for ticker in tickers[1:]:
+            pipeline.append(
+                {"$unionWith": {"coll": self._coll.name, "pipeline": branch(ticker)}}
+            )
+        return pipeline
+
+    def get_page(
+        self,
+        ticker: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: int,
+        after: Optional[NewsPageCursor] = None,
+    ) -> List[LatestNews]:
+        if not self._enabled or limit < 1:
+            return []
+
+        cursor = self._page_cursor(ticker, start, end, limit, after)
+
+        return [
+            LatestNews(
+                id=doc["_id"],
+                ticker=doc["ticker"],
+                date=doc["date"],
+                title=doc["title"],
+                url=doc["url"],
+                feeling=doc["feeling"],
+            )
+            for doc in cursor
+        ]
+
+    def _page_cursor(
+        self,
+        ticker: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: int,
+        after: Optional[NewsPageCursor],
+    ) -> Cursor:
+        date_bounds = {}
+        if start is not None:
+            date_bounds["$gte"] = to_utc_datetime(start)
+        if end is not None:
+            date_bounds["$lte"] = to_utc_datetime(end)
+
+        query = {"ticker": ticker}
+        if after is not None:
+            # Capping the date bound keeps this a single index range; the $or
+            # only filters out the already-returned ties on after.date.
+            if "$lte" not in date_bounds or after.date < date_bounds["$lte"]:
+                date_bounds["$lte"] = after.date
+            query["$or"] = [
+                {"date": {"$lt": after.date}},
+                {"_id": {"$lt": after.id}},
+            ]
+        if date_bounds:
+            query["date"] = date_bounds
+
+        return (
+            self._coll.find(query, _PROJECTION)
+            .sort([("date", DESCENDING), ("_id", DESCENDING)])
+            .limit(limit)
+        )
+
+    def _date_range_cursor(self, ticker: str, start: datetime, end: datetime) -> Cursor:
+        return self._coll.find(
+            {
+                "ticker": ticker,
+                "date": {"$gte": start, "$lte": end},
+            },
+            _PROJECTION,
+        ).sort("date", ASCENDING)
+
+    def _latest_cursor(self, ticker: str, limit: int) -> Cursor:
+        return (
+            self._coll.find({"ticker": ticker}, _PROJECTION)
+            .sort("date", DESCENDING)  # newest → oldest
+            .limit(limit)
+        )
@@ -0,0 +1,44 @@
+from typing import Dict, List, Optional
+
+from anyio import CapacityLimiter, to_thread
+
+from stock_api.domain.async_company_repository import AsyncCompanyRepository
+from stock_api.domain.company import Company
+from stock_api.domain.company_repository import CompanyRepository
+
+
+class ThreadedAsyncCompanyRepository(AsyncCompanyRepository):
+    """Async view of a blocking CompanyRepository.
+
+    Each call runs in a worker thread bounded by *limiter*, so pymongo round
+    trips never block the event loop.
+    """
+
+    def __init__(self, repository: CompanyRepository, limiter: CapacityLimiter):
+        self.__repository = repository
+        self.__limiter = limiter
+
+    async def exists(self, id: str) -> bool:
+        return await to_thread.run_sync(
+            self.__repository.exists, id, limiter=self.__limiter
+        )
+
+    async def get_all(self) -> dict[str, Company]:
+        return await to_thread.run_sync(
+            self.__repository.get_all, limiter=self.__limiter
+        )
+
+    async def find_by_ticker(self, ticker: str) -> Optional[Company]:
+        return await to_thread.run_sync(
+            self.__repository.find_by_ticker, ticker, limiter=self.__limiter
+        )
+
+    async def find_by_asset_id(self, asset_id: str) -> Optional[Company]:
+        return await to_thread.run_sync(
+            self.__repository.find_by_asset_id, asset_id, limiter=self.__limiter
+        )
+
+    async def find_by_asset_ids(self, asset_ids: List[str]) -> Dict[str, Company]:
+        return await to_thread.run_sync(
+            self.__repository.find_by_asset_ids, asset_ids, limiter=self.__limiter
+        )
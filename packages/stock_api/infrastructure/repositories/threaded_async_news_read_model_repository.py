@@ -0,0 +1,79 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from anyio import CapacityLimiter, to_thread
+
+from stock_api.application.news.async_news_read_model_repository import (
+    AsyncNewsReadModelRepository,
+)
+from stock_api.application.news.latest_news_dto import LatestNews
+from stock_api.application.news.news_page_cursor import NewsPageCursor
+from stock_api.application.news.news_read_model_repository import (
+    NewsReadModelRepository,
+)
+
+
+class ThreadedAsyncNewsReadModelRepository(AsyncNewsReadModelRepository):
+    """Async view of a blocking NewsReadModelRepository.
+
+    Each call runs in a worker thread bounded by *limiter*, so pymongo round
+    trips never block the event loop.
+    """
+
+    def __init__(self, repository: NewsReadModelRepository, limiter: CapacityLimiter):
+        self.__repository = repository
+        self.__limiter = limiter
+
+    async def get(self, news_id: str) -> Optional[LatestNews]:
+        return await to_thread.run_sync(
+            self.__repository.get, news_id, limiter=self.__limiter
+        )
+
+    async def get_by_date_range(
+        self, ticker: str, start_date: date, end_date: date
+    ) -> List[LatestNews]:
+        return await to_thread.run_sync(
+            self.__repository.get_by_date_range,
+            ticker,
+            start_date,
+            end_date,
+            limiter=self.__limiter,
+        )
+
+    async def get_latest_news_for_ticker(
+        self, ticker: str, limit: int
+    ) -> List[LatestNews]:
+        return await to_thread.run_sync(
+            self.__repository.get_latest_news_for_ticker,
+            ticker,
+            limit,
+            limiter=self.__limiter,
+        )
+
+    async def get_latest_news_for_tickers(
+        self, tickers: List[str], limit: int
+    ) -> Dict[str, List[LatestNews]]:
+        return await to_thread.run_sync(
+            self.__repository.get_latest_news_for_tickers,
+            tickers,
+            limit,
+            limiter=self.__limiter,
+        )
+
+    async def get_page(
+        self,
+        ticker: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: int,
+        after: Optional[NewsPageCursor] = None,
+    ) -> List[LatestNews]:
+        return await to_thread.run_sync(
+            self.__repository.get_page,
+            ticker,
+            start,
+            end,
+            limit,
+            after,
+            limiter=self.__limiter,
+        )
@@ -1,19 +1,35 @@
 import uvicorn
+from anyio import CapacityLimiter
 from fastapi import FastAPI
 
 from stock_api.application.companies.register_company_command_handler import (
     RegisterCompanyCommandHandler,
 )
+from stock_api.application.news.get_news_batch_query_handler import (
+    GetNewsBatchQueryHandler,
+)
+from stock_api.application.news.get_news_history_query_handler import (
+    GetNewsHistoryQueryHandler,
+)
 from stock_api.application.news.get_news_query_handler import GetNewsQueryHandler
+from stock_api.application.news.live_feeling_hub import LiveFeelingHub
+from stock_api.application.news.news_query_cache import NewsQueryCache
+from stock_api.application.news.single_flight import SingleFlight
 from stock_api.config import settings
 from stock_api.logger import get_logger
 from stock_api.infrastructure.http_exception_handler import HttpExceptionHandler
+from stock_api.infrastructure.bus.in_memory_message_bus import InMemoryMessageBus
+from stock_api.infrastructure.bus.news_replay import NewsReplayDriver, load_messages
 
 from stock_api.application.news.register_news_command_handler import (
     RegisterNewsCommandHandler,
 )
 from stock_api.infrastructure.joblib_prediction_model import JoblibPredictionModel
 
+from stock_api.infrastructure.repositories.async_company_directory import (
+    AsyncCompanyDirectory,
+)
+from stock_api.infrastructure.repositories.company_directory import CompanyDirectory
 from stock_api.infrastructure.repositories.in_memory_company_repository import (
     InMemoryCompanyRepository,
 )
@@ -35,6 +51,12 @@ from stock_api.infrastructure.repositories.mongo_event_store_repository import (
 from stock_api.infrastructure.repositories.mongo_news_read_model_repository import (
     MongoNewsReadModelRepository,
 )
+from stock_api.infrastructure.repositories.threaded_async_company_repository import (
+    ThreadedAsyncCompanyRepository,
+)
+from stock_api.infrastructure.repositories.threaded_async_news_read_model_repository import (
+    ThreadedAsyncNewsReadModelRepository,
+)
 from stock_api.infrastructure.publishers.pubsub_event_publisher import (
     PubSubEventPublisher,
 )
@@ -46,7 +68,18 @@ from stock_api.infrastructure.listeners.news.pubsub_news_event_subscriber import
 )
 
 # Presentation
+from stock_api.presentation.get_news_batch_controller import GetNewsBatchController
 from stock_api.presentation.get_news_controller import GetNewsController
+from stock_api.presentation.get_news_history_controller import (
+    GetNewsHistoryController,
+)
+from stock_api.presentation.live_feeling_controller import LiveFeelingController
+from stock_api.presentation.news_cache_metrics_controller import (
+    NewsCacheMetricsController,
+)
+from stock_api.presentation.news_subscriber_metrics_controller import (
+    NewsSubscriberMetricsController,
+)
 
 app = FastAPI()
 logger = get_logger(__name__)
@@ -54,57 +87,171 @@ logger.info("Starting up in %s mode", settings.ENVIRONMENT)
 
 HttpExceptionHandler(app)
 
-prediction_model = JoblibPredictionModel("models/stock_model.joblib")
+prediction_model = JoblibPredictionModel(
+    settings.MODEL_PATH,
+    tier=settings.SCORING_TIER,
+    fast_model_path=settings.FAST_MODEL_PATH,
+)
 
 if settings.ENVIRONMENT.lower() == "testing":
-    event_store = InMemoryEventStoreRepository()
+    event_store = InMemoryEventStoreRepository(settings.EVENT_STORE_FILE)
     read_model = InMemoryNewsReadModelRepository()
+    if settings.NEWS_IMPORT_CSV:
+        loaded = read_model.load_csv(settings.NEWS_IMPORT_CSV)
+        logger.info("Loaded %d news from %s", loaded, settings.NEWS_IMPORT_CSV)
     publisher = InMemoryDomainEventPublisher()
-    company_repo = InMemoryCompanyRepository()
+    company_source = InMemoryCompanyRepository()
 else:
     event_store = MongoEventStoreRepository(
-        settings.MONGODB_URI.get_secret_value(), settings.MONGODB_DB
+        settings.MONGODB_URI.get_secret_value(),
+        settings.MONGODB_DB,
+        snapshot_interval=settings.EVENT_SNAPSHOT_INTERVAL,
     )
     read_model = MongoNewsReadModelRepository(
         settings.MONGODB_URI.get_secret_value(), settings.MONGODB_DB
     )
-    publisher = PubSubEventPublisher(settings.GCP_PROJECT, settings.PUBSUB_TOPIC)
-    company_repo = MongoCompanyRepository(
+    publisher = PubSubEventPublisher(
+        settings.GCP_PROJECT,
+        settings.PUBSUB_TOPIC,
+        max_messages=settings.PUBSUB_BATCH_MAX_MESSAGES,
+        max_bytes=settings.PUBSUB_BATCH_MAX_BYTES,
+        max_latency=settings.PUBSUB_BATCH_MAX_LATENCY_SECONDS,
+        max_in_flight=settings.PUBSUB_PUBLISH_MAX_IN_FLIGHT,
+    )
+    company_source = MongoCompanyRepository(
         settings.MONGODB_URI.get_secret_value(), settings.MONGODB_DB
     )
 
+    # Idempotent: existing indexes are left untouched
+    for repository in (event_store, read_model, company_source):
+        repository.ensure_indexes()
+
+# Offline load testing: Pub/Sub replaced by an in-process bus, each
+# subscription reading the topic of the same name
+if settings.MESSAGE_BUS.lower() == "in-memory":
+    message_bus = InMemoryMessageBus(latency=settings.MESSAGE_BUS_LATENCY_SECONDS)
+    pubsub_project = settings.GCP_PROJECT or "local"
+    core_subscription = settings.PUBSUB_SUBSCRIPTION_CORE or "core"
+    news_subscription = settings.PUBSUB_SUBSCRIPTION_NEWS_SCRAPER or "news-scraper"
+    for name in (core_subscription, news_subscription):
+        message_bus.create_subscription(pubsub_project, name, topic=name)
+    publisher = PubSubEventPublisher(
+        pubsub_project,
+        settings.PUBSUB_TOPIC or "market-feeling",
+        client=message_bus.publisher_client(),
+    )
+else:
+    message_bus = None
+    pubsub_project = settings.GCP_PROJECT
+    core_subscription = settings.PUBSUB_SUBSCRIPTION_CORE
+    news_subscription = settings.PUBSUB_SUBSCRIPTION_NEWS_SCRAPER
+
+# Company lookups are dict hits; saves write through to the source repository
+company_repo = CompanyDirectory(company_source)
+company_repo.load()
+
+# Async views for the HTTP read path: blocking lookups run in worker threads
+read_limiter = CapacityLimiter(settings.MONGODB_READ_CONCURRENCY)
+async_read_model = ThreadedAsyncNewsReadModelRepository(read_model, read_limiter)
+async_company_repo = AsyncCompanyDirectory(
+    company_repo, ThreadedAsyncCompanyRepository(company_repo, read_limiter)
+)
+
+# Query cache, invalidated per ticker by the news command handler
+news_query_cache = NewsQueryCache(
+    ttl_seconds=settings.NEWS_CACHE_TTL_SECONDS,
+    max_entries=settings.NEWS_CACHE_MAX_ENTRIES,
+)
+
+# Live feelings pushed to SSE subscribers by the news command handler
+live_hub = LiveFeelingHub(buffer_size=settings.LIVE_STREAM_BUFFER_SIZE)
+
 # Application command handlers
-get_news_handler = GetNewsQueryHandler(read_model, company_repo)
+get_news_handler = GetNewsQueryHandler(
+    async_read_model, async_company_repo, news_query_cache
+)
+get_news_batch_handler = GetNewsBatchQueryHandler(
+    async_read_model, async_company_repo, news_query_cache
+)
+get_news_history_handler = GetNewsHistoryQueryHandler(
+    async_read_model, async_company_repo
+)
 
 # Presentation controllers
 app.include_router(GetNewsController(get_news_handler).router)
+app.include_router(GetNewsBatchController(get_news_batch_handler).router)
+app.include_router(GetNewsHistoryController(get_news_history_handler).router)
+app.include_router(NewsCacheMetricsController(news_query_cache).router)
+app.include_router(
+    LiveFeelingController(
+        live_hub, async_company_repo, settings.LIVE_STREAM_HEARTBEAT_SECONDS
+    ).router
+)
 
-# Pub/Sub subscriber wiring (only in production)
-if settings.ENVIRONMENT.lower() != "testing":
+# Pub/Sub subscriber wiring (in production, or on the in-memory bus)
+if settings.ENVIRONMENT.lower() != "testing" or message_bus is not None:
+    subscriber_client = message_bus.subscriber_client() if message_bus else None
     company_register_handler = RegisterCompanyCommandHandler(company_repo)
     companies_subscriber = PubSubCompaniesEventSubscriber(
         command_handler=company_register_handler,
-        project_id=settings.GCP_PROJECT,
-        subscription=settings.PUBSUB_SUBSCRIPTION_CORE,
+        project_id=pubsub_project,
+        subscription=core_subscription,
+        client=subscriber_client,
     )
     news_register_handler = RegisterNewsCommandHandler(
-        company_repo, prediction_model, event_store, read_model, publisher
+        company_repo,
+        prediction_model,
+        event_store,
+        read_model,
+        publisher,
+        news_query_cache,
+        live_hub,
+        max_append_retries=settings.EVENT_APPEND_MAX_RETRIES,
+        single_flight=SingleFlight(
+            settings.NEWS_DEDUP_TTL_SECONDS,
+            settings.NEWS_DEDUP_ERROR_TTL_SECONDS,
+            wait_timeout_seconds=settings.NEWS_DEDUP_WAIT_TIMEOUT_SECONDS,
+        ),
     )
     news_subscriber = PubSubNewsEventSubscriber(
         command_handler=news_register_handler,
-        project_id=settings.GCP_PROJECT,
-        subscription=settings.PUBSUB_SUBSCRIPTION_NEWS_SCRAPER,
+        project_id=pubsub_project,
+        subscription=news_subscription,
+        client=subscriber_client,
+        workers=settings.NEWS_SUBSCRIBER_WORKERS,
+        max_messages=settings.NEWS_SUBSCRIBER_MAX_MESSAGES,
+        max_bytes=settings.NEWS_SUBSCRIBER_MAX_BYTES,
+        max_lease_seconds=settings.NEWS_SUBSCRIBER_MAX_LEASE_SECONDS,
+        min_lease_extension_seconds=settings.NEWS_SUBSCRIBER_MIN_LEASE_EXTENSION_SECONDS,
     )
+    app.include_router(NewsSubscriberMetricsController(news_subscriber.stats).router)
+
+    replay_driver = None
+    if message_bus is not None and settings.NEWS_REPLAY_FILE:
+        replay_client = message_bus.publisher_client()
+        replay_driver = NewsReplayDriver(
+            replay_client,
+            replay_client.topic_path(pubsub_project, news_subscription),
+            load_messages(settings.NEWS_REPLAY_FILE),
+            settings.NEWS_REPLAY_RATE,
+            settings.NEWS_REPLAY_REPEAT,
+        )
 
     @app.on_event("startup")
     def start_subscriber():
         companies_subscriber.listen()
         news_subscriber.listen()
+        company_repo.start_refresh(settings.COMPANY_DIRECTORY_REFRESH_SECONDS)
+        if replay_driver is not None:
+            replay_driver.start()
 
     @app.on_event("shutdown")
     def stop_subscriber():
+        if replay_driver is not None:
+            replay_driver.stop()
         companies_subscriber.stop()
         news_subscriber.stop()
+        company_repo.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+import json
+from datetime import date, datetime
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib encoder is used instead
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode plain dicts/lists to JSON bytes, orjson when it is installed.
+
+    Datetimes are written as ``isoformat()``, as FastAPI's own encoder does,
+    so responses look the same whichever encoder is used.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response for content that is already plain rows.
+
+    Returning it from an endpoint bypasses the ``response_model`` validation
+    and ``jsonable_encoder`` pass; the model is then only used for the docs.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
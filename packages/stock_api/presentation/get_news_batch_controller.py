@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+from fastapi import APIRouter, Query
+
+from stock_api.application.exceptions import BadRequestException
+from stock_api.application.news.get_news_batch_query_handler import (
+    MAX_BATCH_ASSETS,
+    GetNewsBatchQuery,
+    GetNewsBatchQueryHandler,
+)
+from stock_api.presentation.fast_json_response import FastJSONResponse
+from stock_api.presentation.get_news_controller import NewsItemDTO, news_item_row
+
+
+@dataclass
+class NewsBatchDTO:
+    items: Dict[str, List[NewsItemDTO]]
+    notFound: List[str]
+
+
+class GetNewsBatchController:
+    def __init__(self, query_handler: GetNewsBatchQueryHandler):
+        self.__query_handler = query_handler
+        self.__router = APIRouter()
+        self.__router.add_api_route(
+            "/news/batch",
+            self.handle,
+            methods=["GET"],
+            response_model=NewsBatchDTO,
+            response_class=FastJSONResponse,
+        )
+
+    @property
+    def router(self):
+        return self.__router
+
+    async def handle(
+        self,
+        asset_ids: List[str] = Query(
+            ...,
+            alias="assetIds",
+            description=f"Asset ids, repeated or comma-separated (at most {MAX_BATCH_ASSETS})",
+        ),
+        limit: int = Query(
+            20,
+            alias="limit",
+            description="News items per asset (default 20, range 1-50)",
+        ),
+    ) -> FastJSONResponse:
+        ids = [a.strip() for value in asset_ids for a in value.split(",") if a.strip()]
+        if not ids:
+            raise BadRequestException("assetIds must not be empty")
+        if len(ids) > MAX_BATCH_ASSETS:
+            raise BadRequestException(
+                f"At most {MAX_BATCH_ASSETS} assetIds per request, got {len(ids)}"
+            )
+
+        batch = await self.__query_handler.handle(GetNewsBatchQuery(ids, limit))
+
+        return FastJSONResponse(
+            {
+                "items": {
+                    asset_id: [news_item_row(item) for item in news_items[:limit]]
+                    for asset_id, news_items in batch.items.items()
+                },
+                "notFound": batch.not_found,
+            }
+        )
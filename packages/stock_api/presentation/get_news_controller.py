@@ -7,7 +7,9 @@ from stock_api.application.exceptions import BadRequestException
 from stock_api.application.news.get_news_query_handler import (
     GetNewsQueryHandler,
     GetNewsQuery,
+    NewsItem,
 )
+from stock_api.presentation.fast_json_response import FastJSONResponse
 
 
 @dataclass
@@ -18,6 +20,16 @@ class NewsItemDTO:
     assetId: str
 
 
+def news_item_row(item: NewsItem) -> dict:
+    """The NewsItemDTO wire shape as a plain dict, ready for FastJSONResponse."""
+    return {
+        "title": item.title,
+        "date": item.date,
+        "url": item.url,
+        "assetId": item.asset_id,
+    }
+
+
 class GetNewsController:
     def __init__(self, query_handler: GetNewsQueryHandler):
         self.__query_handler = query_handler
@@ -27,6 +39,7 @@ class GetNewsController:
             self.handle,
             methods=["GET"],
             response_model=List[NewsItemDTO],
+            response_class=FastJSONResponse,
         )
 
     @property
@@ -51,21 +64,14 @@ class GetNewsController:
             alias="endDate",
             description="ISO‑8601 end date filter (inclusive)",
         ),
-    ) -> List[NewsItemDTO]:
+    ) -> FastJSONResponse:
         if start_date and end_date and start_date > end_date:
             raise BadRequestException(
                 "startDate must be earlier than or equal to endDate"
             )
 
         query = GetNewsQuery(asset_id, limit, start_date, end_date)
-        news_items = self.__query_handler.handle(query)
+        news_items = await self.__query_handler.handle(query)
 
-        return [
-            NewsItemDTO(
-                title=item.title,
-                date=item.date,
-                url=item.url,
-                assetId=item.asset_id,
-            )
-            for item in news_items[:limit]
-        ]
+        # Rows go straight to JSON; NewsItemDTO only documents the schema
+        return FastJSONResponse([news_item_row(item) for item in news_items[:limit]])
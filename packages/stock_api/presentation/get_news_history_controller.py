@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from stock_api.application.exceptions import BadRequestException
+from stock_api.application.news.get_news_history_query_handler import (
+    GetNewsHistoryQuery,
+    GetNewsHistoryQueryHandler,
+)
+from stock_api.application.news.get_news_query_handler import NewsItem
+from stock_api.presentation.fast_json_response import FastJSONResponse, dumps
+from stock_api.presentation.get_news_controller import NewsItemDTO, news_item_row
+
+# NDJSON lines sent per chunk of the export response
+EXPORT_LINES_PER_CHUNK = 256
+
+
+@dataclass
+class NewsHistoryPageDTO:
+    items: List[NewsItemDTO]
+    nextCursor: Optional[str]
+
+
+class GetNewsHistoryController:
+    def __init__(self, query_handler: GetNewsHistoryQueryHandler):
+        self.__query_handler = query_handler
+        self.__router = APIRouter()
+        self.__router.add_api_route(
+            "/news/history",
+            self.handle,
+            methods=["GET"],
+            response_model=NewsHistoryPageDTO,
+            response_class=FastJSONResponse,
+        )
+        self.__router.add_api_route(
+            "/news/history/export",
+            self.export,
+            methods=["GET"],
+            response_class=StreamingResponse,
+        )
+
+    @property
+    def router(self):
+        return self.__router
+
+    async def handle(
+        self,
+        asset_id: str = Query(..., alias="assetId", min_length=1),
+        limit: int = Query(
+            50,
+            alias="limit",
+            description="Page size (default 50, range 1-500)",
+        ),
+        start_date: Optional[datetime] = Query(
+            None,
+            alias="startDate",
+            description="ISO‑8601 start date filter (inclusive)",
+        ),
+        end_date: Optional[datetime] = Query(
+            None,
+            alias="endDate",
+            description="ISO‑8601 end date filter (inclusive)",
+        ),
+        cursor: Optional[str] = Query(
+            None,
+            alias="cursor",
+            description="nextCursor of the previous page",
+        ),
+    ) -> FastJSONResponse:
+        query = self.__query(asset_id, limit, start_date, end_date, cursor)
+        page = await self.__query_handler.handle(query)
+
+        return FastJSONResponse(
+            {
+                "items": [news_item_row(item) for item in page.items],
+                "nextCursor": page.next_cursor,
+            }
+        )
+
+    async def export(
+        self,
+        asset_id: str = Query(..., alias="assetId", min_length=1),
+        start_date: Optional[datetime] = Query(
+            None,
+            alias="startDate",
+            description="ISO‑8601 start date filter (inclusive)",
+        ),
+        end_date: Optional[datetime] = Query(
+            None,
+            alias="endDate",
+            description="ISO‑8601 end date filter (inclusive)",
+        ),
+        cursor: Optional[str] = Query(
+            None,
+            alias="cursor",
+            description="Resume an export after this position",
+        ),
+    ) -> StreamingResponse:
+        query = self.__query(asset_id, 0, start_date, end_date, cursor)
+        items = await self.__query_handler.stream(query)
+
+        return StreamingResponse(
+            self.__ndjson(items), media_type="application/x-ndjson"
+        )
+
+    @staticmethod
+    def __query(asset_id, limit, start_date, end_date, cursor) -> GetNewsHistoryQuery:
+        if start_date and end_date and start_date > end_date:
+            raise BadRequestException(
+                "startDate must be earlier than or equal to endDate"
+            )
+        return GetNewsHistoryQuery(asset_id, limit, start_date, end_date, cursor)
+
+    @staticmethod
+    async def __ndjson(items: AsyncIterator[NewsItem]) -> AsyncIterator[bytes]:
+        lines: List[bytes] = []
+        async for item in items:
+            lines.append(dumps(news_item_row(item)))
+            if len(lines) >= EXPORT_LINES_PER_CHUNK:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
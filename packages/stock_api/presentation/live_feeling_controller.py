@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, List
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from stock_api.application.exceptions import BadRequestException, NotFoundException
+from stock_api.application.news.get_news_batch_query_handler import MAX_BATCH_ASSETS
+from stock_api.application.news.live_feeling_hub import LiveFeeling, LiveFeelingHub
+from stock_api.domain.async_company_repository import AsyncCompanyRepository
+from stock_api.presentation.fast_json_response import dumps
+
+
+@dataclass
+class LiveStreamMetricsDTO:
+    subscribers: int
+    published: int
+    buffered: int
+    dropped: int
+
+
+def _event(item: LiveFeeling) -> bytes:
+    data = dumps(
+        {
+            "assetId": item.asset_id,
+            "newsId": item.news_id,
+            "title": item.title,
+            "url": item.url,
+            "date": item.date,
+            "feeling": item.feeling,
+        }
+    )
+    return (
+        b"id: " + item.news_id.encode() + b"\nevent: feeling\ndata: " + data + b"\n\n"
+    )
+
+
+class LiveFeelingController:
+    """Server-Sent Events stream of new feelings for a set of assets.
+
+    Each message is an ``event: feeling`` with the news item and its feeling.
+    When the client reads too slowly and its buffer overflows, an
+    ``event: lagged`` with the number of dropped items is sent instead, so it
+    can re-sync through ``/news``. Comments are sent while idle to keep
+    proxies from closing the connection.
+    """
+
+    def __init__(
+        self,
+        hub: LiveFeelingHub,
+        company_repository: AsyncCompanyRepository,
+        heartbeat_seconds: float = 15.0,
+    ):
+        self.__hub = hub
+        self.__company_repository = company_repository
+        self.__heartbeat_seconds = heartbeat_seconds
+        self.__router = APIRouter()
+        self.__router.add_api_route(
+            "/news/stream",
+            self.handle,
+            methods=["GET"],
+            response_class=StreamingResponse,
+        )
+        self.__router.add_api_route(
+            "/metrics/live-stream",
+            self.metrics,
+            methods=["GET"],
+            response_model=LiveStreamMetricsDTO,
+        )
+
+    @property
+    def router(self):
+        return self.__router
+
+    async def handle(
+        self,
+        asset_ids: List[str] = Query(
+            ...,
+            alias="assetIds",
+            description=f"Asset ids, repeated or comma-separated (at most {MAX_BATCH_ASSETS})",
+        ),
+    ) -> StreamingResponse:
+        ids = [a.strip() for value in asset_ids for a in value.split(",") if a.strip()]
+        if not ids:
+            raise BadRequestException("assetIds must not be empty")
+        if len(ids) > MAX_BATCH_ASSETS:
+            raise BadRequestException(
+                f"At most {MAX_BATCH_ASSETS} assetIds per request, got {len(ids)}"
+            )
+
+        companies = await self.__company_repository.find_by_asset_ids(ids)
+        missing = [asset_id for asset_id in ids if asset_id not in companies]
+        if missing:
+            raise NotFoundException(f"Unknown assetIds: {', '.join(missing)}")
+
+        return StreamingResponse(
+            self.__events(ids),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def metrics(self) -> LiveStreamMetricsDTO:
+        stats = self.__hub.stats()
+        return LiveStreamMetricsDTO(
+            subscribers=stats.subscribers,
+            published=stats.published,
+            buffered=stats.buffered,
+            dropped=stats.dropped,
+        )
+
+    async def __events(self, asset_ids: List[str]) -> AsyncIterator[bytes]:
+        # subscribed here, not in handle: a response that is never streamed
+        # (client gone before the first send) then never holds a subscription
+        subscription = self.__hub.subscribe(asset_ids)
+        try:
+            # flushes the headers so the client knows it is subscribed
+            yield b": subscribed\n\n"
+            while True:
+                items, dropped = await subscription.next_batch(self.__heartbeat_seconds)
+                if dropped:
+                    yield b'event: lagged\ndata: {"dropped":%d}\n\n' % dropped
+                if items:
+                    yield b"".join(_event(item) for item in items)
+                elif not dropped:
+                    yield b": keep-alive\n\n"
+        finally:
+            # runs when the client disconnects and the stream is cancelled
+            self.__hub.unsubscribe(subscription)
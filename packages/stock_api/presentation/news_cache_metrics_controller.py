@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+from fastapi import APIRouter
+
+from stock_api.application.news.news_query_cache import NewsQueryCache
+
+
+@dataclass
+class NewsCacheMetricsDTO:
+    hits: int
+    misses: int
+    hitRate: float
+    evictions: int
+    invalidations: int
+    size: int
+
+
+class NewsCacheMetricsController:
+    def __init__(self, cache: NewsQueryCache):
+        self.__cache = cache
+        self.__router = APIRouter()
+        self.__router.add_api_route(
+            "/metrics/news-cache",
+            self.handle,
+            methods=["GET"],
+            response_model=NewsCacheMetricsDTO,
+        )
+
+    @property
+    def router(self):
+        return self.__router
+
+    async def handle(self) -> NewsCacheMetricsDTO:
+        stats = self.__cache.stats()
+        return NewsCacheMetricsDTO(
+            hits=stats.hits,
+            misses=stats.misses,
+            hitRate=stats.hit_rate,
+            evictions=stats.evictions,
+            invalidations=stats.invalidations,
+            size=stats.size,
+        )
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from fastapi import APIRouter
+
+from stock_api.infrastructure.listeners.subscriber_stats import SubscriberStats
+
+
+@dataclass
+class NewsSubscriberMetricsDTO:
+    workers: int
+    queued: int
+    inFlight: int
+    received: int
+    acked: int
+    nacked: int
+    meanHandleSeconds: float
+
+
+class NewsSubscriberMetricsController:
+    def __init__(self, stats: Callable[[], SubscriberStats]):
+        self.__stats = stats
+        self.__router = APIRouter()
+        self.__router.add_api_route(
+            "/metrics/news-subscriber",
+            self.handle,
+            methods=["GET"],
+            response_model=NewsSubscriberMetricsDTO,
+        )
+
+    @property
+    def router(self):
+        return self.__router
+
+    async def handle(self) -> NewsSubscriberMetricsDTO:
+        stats = self.__stats()
+        return NewsSubscriberMetricsDTO(
+            workers=stats.workers,
+            queued=stats.queued,
+            inFlight=stats.in_flight,
+            received=stats.received,
+            acked=stats.acked,
+            nacked=stats.nacked,
+            meanHandleSeconds=stats.mean_handle_seconds,
+        )
@@ -0,0 +1,9 @@
+from libs.model_artefact import convert_joblib
+from stock_model.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    out_dir = convert_joblib("models/stock_model.joblib", "models/stock_model")
+    logger.info(f"Native model artefact written to {out_dir}")
@@ -0,0 +1,10 @@
+from stock_model.distiller import distill
+
+
+def main():
+    distill(
+        "data/historical_news_merged.csv",
+        "models/stock_model",
+        "models/fast_scorer.joblib",
+        "data/fast_scorer_report.json",
+    )
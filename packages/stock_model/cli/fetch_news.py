@@ -1,16 +1,22 @@
 from stock_model.data_manager import load_from_csv
+from stock_model.feature_store import FeatureStore
 from stock_model.pipeline import analyze_and_save, merge_historical_news
 
 
 def main():
     COMPANIES_CSV = "data/companies.csv"
     OUTDIR = "data"
+    FEATURE_STORE = "data/feature_store.sqlite"
     START_DATE = "2024-01-01"
     END_DATE = "2025-05-03"
 
     companies = load_from_csv(COMPANIES_CSV).to_dict("records")
 
-    for c in companies:
-        analyze_and_save(c, START_DATE, END_DATE, OUTDIR)
+    store = FeatureStore(FEATURE_STORE)
+    try:
+        for c in companies:
+            analyze_and_save(c, START_DATE, END_DATE, OUTDIR, store=store)
+    finally:
+        store.close()
 
     merge_historical_news(OUTDIR, "historical_news_*.csv", "historical_news_merged.csv")
@@ -0,0 +1,59 @@
+import os
+
+from pymongo import MongoClient
+
+from stock_api.config import settings
+from stock_api.infrastructure.repositories.mongo_event_store_repository import (
+    MongoEventStoreRepository,
+)
+from stock_api.infrastructure.repositories.mongo_news_read_model_repository import (
+    MongoNewsReadModelRepository,
+)
+from stock_model.importer import (
+    EVENT_COLUMNS,
+    NEWS_COLUMNS,
+    bulk_insert,
+    event_documents,
+    news_documents,
+    read_documents,
+)
+from stock_model.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    EVENTS_CSV = "data/events_to_import_merged.csv"
+    NEWS_CSV = "data/news_to_import_merged.csv"
+    BATCH_SIZE = 10_000
+    WORKERS = 4
+
+    if not settings.MONGODB_URI:
+        raise SystemExit("MONGODB_URI is not set")
+    uri = settings.MONGODB_URI.get_secret_value()
+    db = MongoClient(uri)[settings.MONGODB_DB]
+
+    conflicts = 0
+    for path, coll, columns, to_documents in (
+        (EVENTS_CSV, db["events"], EVENT_COLUMNS, event_documents),
+        (NEWS_CSV, db["news"], NEWS_COLUMNS, news_documents),
+    ):
+        if not os.path.exists(path):
+            logger.warning("Skipping %s: file not found", path)
+            continue
+        logger.info("Importing %s into %s", path, coll.name)
+        batches = read_documents(path, columns, to_documents, BATCH_SIZE)
+        conflicts += bulk_insert(coll, batches, WORKERS)["conflicts"]
+
+    if conflicts:
+        # e.g. CSV versions numbered from 0 imported over live streams
+        raise SystemExit(
+            f"{conflicts} documents conflict with stored ones (event versions "
+            f"already taken); they were not imported"
+        )
+
+    # Building the indexes once the data is in is much cheaper than keeping
+    # them up to date on every insert; existing indexes are left as they are.
+    logger.info("Building indexes")
+    MongoEventStoreRepository(uri, settings.MONGODB_DB).ensure_indexes()
+    MongoNewsReadModelRepository(uri, settings.MONGODB_DB).ensure_indexes()
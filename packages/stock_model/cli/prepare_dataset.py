@@ -1,7 +1,19 @@
-from stock_model.feature_engineer import engineer
+import os
+
+from stock_model.feature_engineer import engineer, engineer_from_store
+
+FEATURE_STORE = "data/feature_store.sqlite"
 
 
 def main():
+    if os.path.exists(FEATURE_STORE):
+        engineer_from_store(
+            FEATURE_STORE,
+            "data/historical_prices.csv",
+            "data/final_training_data.csv",
+        )
+        return
+
     engineer(
         "data/historical_news_merged.csv",
         "data/historical_prices.csv",
@@ -0,0 +1,17 @@
+from libs.analyzer_versions import analyzer_versions
+from libs.finbert_analyzer import FinBertAnalyzer
+from libs.spacy_analyzer import SpacySimilarityAnalyzer
+from libs.textblob_analyzer import TextBlobAnalyzer
+from stock_model.feature_store import FeatureStore, refresh_features
+from stock_model.pipeline import store_analyzers
+
+
+def main():
+    store = FeatureStore("data/feature_store.sqlite")
+    try:
+        analyzers = store_analyzers(
+            TextBlobAnalyzer(), FinBertAnalyzer(), SpacySimilarityAnalyzer()
+        )
+        refresh_features(store, analyzers, analyzer_versions())
+    finally:
+        store.close()
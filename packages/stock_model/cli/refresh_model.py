@@ -0,0 +1,5 @@
+from stock_model.trainer import refresh
+
+
+def main():
+    refresh("data/new_training_data.csv", "models/stock_model")
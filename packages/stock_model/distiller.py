@@ -0,0 +1,97 @@
+import json
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import train_test_split
+
+from libs.fast_scorer import FastFeelingScorer, make_vectorizer, to_feeling
+from libs.feature_builder import batch_transform
+from libs.model_artefact import load_model
+from stock_model.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def teacher_scores(df_news: pd.DataFrame, model_path: str) -> np.ndarray:
+    """Raw full-stack scores for news rows that already carry analyzer columns."""
+    booster, scaler, columns, _ = load_model(model_path)
+    X = batch_transform(df_news)[columns]
+    return booster.predict(pd.DataFrame(scaler.transform(X), columns=columns))
+
+
+def agreement_report(teacher_raw: np.ndarray, student_raw: np.ndarray) -> dict:
+    teacher = to_feeling(teacher_raw)
+    student = to_feeling(student_raw)
+    diff = np.abs(teacher - student)
+    return {
+        "rows": int(len(teacher)),
+        "exact_agreement": float(np.mean(diff == 0)),
+        "within_1_agreement": float(np.mean(diff <= 1)),
+        "feeling_mae": float(np.mean(diff)),
+        "raw_mae": float(np.mean(np.abs(teacher_raw - student_raw))),
+        "raw_correlation": float(np.corrcoef(teacher_raw, student_raw)[0, 1]),
+    }
+
+
+def distill(
+    news_csv: str,
+    model_path: str,
+    student_path: str,
+    report_path: str,
+    holdout_size: float = 0.2,
+    alpha: float = 1.0,
+) -> dict:
+    """Train the fast text-only scorer to mimic the full model.
+
+    *news_csv* needs the article ``text`` and the raw analyzer columns (as in
+    ``historical_news_merged.csv``); the full model scores those rows without
+    re-running any analyzer. Writes the student to *student_path* and an
+    agreement report on a holdout split to *report_path*.
+    """
+    logger.info("Distilling fast scorer from %s ...", model_path)
+    df = pd.read_csv(news_csv).dropna(subset=["text"]).reset_index(drop=True)
+    df["finbert_label"] = df["finbert_label"].fillna("Neutral")
+    df = df.fillna(
+        {
+            "textblob_polarity": 0.0,
+            "textblob_subjectivity": 0.0,
+            "finbert_score": 0.0,
+            "spacy_similarity": 0.0,
+        }
+    )
+
+    target = teacher_scores(df, model_path)
+    texts_tr, texts_val, y_tr, y_val = train_test_split(
+        df["text"].tolist(), target, test_size=holdout_size, random_state=42
+    )
+
+    vectorizer = make_vectorizer()
+    student = Ridge(alpha=alpha, random_state=42)
+    student.fit(vectorizer.transform(texts_tr), y_tr)
+
+    Path(student_path).parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump({"model": student}, student_path)
+
+    scorer = FastFeelingScorer(student_path)
+    start = time.perf_counter()
+    predicted = scorer.predict(texts_val)
+    elapsed = time.perf_counter() - start
+
+    report = agreement_report(y_val, predicted)
+    report["student_articles_per_s"] = (
+        round(len(texts_val) / elapsed, 2) if elapsed > 0 else None
+    )
+    with open(report_path, "w") as fh:
+        json.dump(report, fh, indent=2)
+
+    logger.info(
+        "Fast scorer saved → %s (exact %.1f%%, ±1 %.1f%% agreement)",
+        student_path,
+        100 * report["exact_agreement"],
+        100 * report["within_1_agreement"],
+    )
+    return report
@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 from libs.feature_builder import batch_transform
+from stock_model.feature_store import FeatureStore
 from stock_model.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,6 +16,34 @@ def engineer(news_csv: str, prices_csv: str, output_csv: str) -> None:
     df_news = pd.read_csv(news_csv, parse_dates=["date"])
     df_prices = pd.read_csv(prices_csv, parse_dates=["date"])
 
+    _save(engineer_frame(df_news, df_prices), output_csv)
+
+
+def engineer_from_store(store_path: str, prices_csv: str, output_csv: str) -> None:
+    """Same as :func:`engineer`, reading analyzer outputs from the feature store."""
+    logger.info(f"Starting feature engineering from {store_path} …")
+
+    store = FeatureStore(store_path)
+    try:
+        df_news = store.to_frame()
+    finally:
+        store.close()
+    df_prices = pd.read_csv(prices_csv, parse_dates=["date"])
+
+    _save(engineer_frame(df_news, df_prices), output_csv)
+
+
+def _save(feat_df: pd.DataFrame, output_csv: str) -> None:
+    feat_df.to_csv(output_csv, index=False)
+    logger.info(
+        f"Feature-engineered CSV written to {output_csv}  ({len(feat_df)} rows)"
+    )
+
+
+def engineer_frame(df_news: pd.DataFrame, df_prices: pd.DataFrame) -> pd.DataFrame:
+    """Label news rows with next-day returns and build the training matrix."""
+    df_prices = df_prices.copy()
+
     # 1. One-day forward return
     df_prices.sort_values(["ticker", "date"], inplace=True)
     df_prices["return_1d"] = (
@@ -56,8 +85,4 @@ def engineer(news_csv: str, prices_csv: str, output_csv: str) -> None:
         thresholds, merged["return_1d"].values, side="right"
     )
 
-    # 7. Save to disk
-    feat_df.to_csv(output_csv, index=False)
-    logger.info(
-        f"Feature-engineered CSV written to {output_csv}  ({len(feat_df)} rows)"
-    )
+    return feat_df
@@ -0,0 +1,218 @@
+import sqlite3
+from typing import Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from stock_model.data_manager import ensure_dir_exists
+from stock_model.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Raw outputs kept per analyzer; each analyzer gets its own table so that a
+# version bump only invalidates that analyzer's rows.
+ANALYZER_COLUMNS: Dict[str, List[str]] = {
+    "textblob": ["textblob_polarity", "textblob_subjectivity"],
+    "finbert": [
+        "finbert_label",
+        "finbert_score",
+        "finbert_prob_negative",
+        "finbert_prob_neutral",
+        "finbert_prob_positive",
+    ],
+    "spacy": ["spacy_similarity"],
+}
+NEWS_COLUMNS = ["news_id", "ticker", "company_name", "date", "title", "url", "text"]
+
+# (text, company_name) -> dict with the analyzer's ANALYZER_COLUMNS
+Analyzer = Callable[[str, str], dict]
+
+_SQLITE_MAX_PARAMS = 900
+
+
+def _failed(result: Optional[dict]) -> bool:
+    # the analyzers report failures as None outputs (e.g. FinBERT on errors)
+    return not result or any(value is None for value in result.values())
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class FeatureStore:
+    """Local SQLite store of raw analyzer outputs keyed by news id.
+
+    Rows are tagged with the version of the analyzer that produced them (see
+    ``libs.analyzer_versions``), so only stale rows need to be recomputed and
+    training matrices can be rebuilt without scraping or re-running inference.
+    """
+
+    def __init__(self, path: str):
+        ensure_dir_exists(path)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS news ("
+            "news_id TEXT PRIMARY KEY, ticker TEXT, company_name TEXT, "
+            "date TEXT, title TEXT, url TEXT, text TEXT)"
+        )
+        for analyzer, columns in ANALYZER_COLUMNS.items():
+            cols = ", ".join(columns)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {analyzer} ("
+                f"news_id TEXT PRIMARY KEY, version TEXT NOT NULL, {cols})"
+            )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def upsert_news(self, df: pd.DataFrame) -> None:
+        """Insert or update article rows; *df* must contain ``NEWS_COLUMNS``."""
+        rows = df[NEWS_COLUMNS].astype(object).where(df[NEWS_COLUMNS].notna(), None)
+        placeholders = ", ".join("?" * len(NEWS_COLUMNS))
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO news ({', '.join(NEWS_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            rows.itertuples(index=False, name=None),
+        )
+        self._conn.commit()
+
+    def put(self, analyzer: str, version: str, news_ids: List[str], results) -> int:
+        """Store one analyzer's *results* (dicts) for *news_ids* under *version*.
+
+        Failed results (``None``, or any output ``None``) are not stored, so
+        the rows stay stale and are recomputed on the next refresh. Returns
+        the number of rows stored.
+        """
+        columns = ANALYZER_COLUMNS[analyzer]
+        placeholders = ", ".join("?" * (len(columns) + 2))
+        rows = [
+            (news_id, version, *(res.get(c) for c in columns))
+            for news_id, res in zip(news_ids, results)
+            if not _failed(res)
+        ]
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO {analyzer} (news_id, version, "
+            f"{', '.join(columns)}) VALUES ({placeholders})",
+            rows,
+        )
+        self._conn.commit()
+        return len(rows)
+
+    def stale_ids(
+        self, analyzer: str, version: str, news_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """News ids with no output from *analyzer* at *version*."""
+        sql = (
+            f"SELECT n.news_id FROM news n LEFT JOIN {analyzer} a "
+            f"ON a.news_id = n.news_id "
+            f"WHERE (a.version IS NULL OR a.version != ?)"
+        )
+        if news_ids is None:
+            return [r[0] for r in self._conn.execute(sql, (version,))]
+
+        stale: List[str] = []
+        for chunk in _chunks(news_ids, _SQLITE_MAX_PARAMS):
+            in_clause = ", ".join("?" * len(chunk))
+            stale.extend(
+                r[0]
+                for r in self._conn.execute(
+                    f"{sql} AND n.news_id IN ({in_clause})", (version, *chunk)
+                )
+            )
+        return stale
+
+    def texts(self, news_ids: List[str]) -> pd.DataFrame:
+        frames = [
+            pd.read_sql_query(
+                "SELECT news_id, company_name, text FROM news "
+                f"WHERE news_id IN ({', '.join('?' * len(chunk))})",
+                self._conn,
+                params=chunk,
+            )
+            for chunk in _chunks(news_ids, _SQLITE_MAX_PARAMS)
+        ]
+        if not frames:
+            return pd.DataFrame(columns=["news_id", "company_name", "text"])
+        return pd.concat(frames, ignore_index=True)
+
+    def to_frame(self, news_ids: Optional[List[str]] = None) -> pd.DataFrame:
+        """Articles joined with every analyzer's outputs, one row per news id.
+
+        The result has the columns of ``historical_news_merged.csv`` (plus the
+        news id and FinBERT class probabilities), so it can be passed straight
+        to ``libs.feature_builder.batch_transform`` or ``engineer_frame``.
+        Articles missing any analyzer output are left out.
+        """
+        select = ["n.news_id", "n.ticker", "n.date", "n.text"]
+        joins = []
+        for analyzer, columns in ANALYZER_COLUMNS.items():
+            select.extend(f"{analyzer}.{c}" for c in columns)
+            joins.append(f"JOIN {analyzer} ON {analyzer}.news_id = n.news_id")
+        sql = f"SELECT {', '.join(select)} FROM news n {' '.join(joins)}"
+
+        if not news_ids:
+            # No filter, or an empty one: the query still yields the columns
+            df = pd.read_sql_query(
+                sql if news_ids is None else f"{sql} WHERE 0", self._conn
+            )
+        else:
+            frames = [
+                pd.read_sql_query(
+                    f"{sql} WHERE n.news_id IN ({', '.join('?' * len(chunk))})",
+                    self._conn,
+                    params=chunk,
+                )
+                for chunk in _chunks(news_ids, _SQLITE_MAX_PARAMS)
+            ]
+            df = pd.concat(frames, ignore_index=True)
+
+        df["date"] = pd.to_datetime(df["date"])
+        return df
+
+
+def refresh_features(
+    store: FeatureStore,
+    analyzers: Dict[str, Analyzer],
+    versions: Dict[str, str],
+    news_ids: Optional[List[str]] = None,
+    batch_size: int = 256,
+) -> Dict[str, int]:
+    """Run each analyzer over its stale rows only and store the results.
+
+    Rows the analyzer fails on are not stored and stay stale for the next run.
+    Returns the number of recomputed rows per analyzer.
+    """
+    recomputed: Dict[str, int] = {}
+    for name, analyze in analyzers.items():
+        stale = store.stale_ids(name, versions[name], news_ids)
+        stored = 0
+        for batch in _chunks(stale, batch_size):
+            texts = store.texts(batch)
+            stored += store.put(
+                name,
+                versions[name],
+                texts["news_id"].tolist(),
+                [
+                    _analyze(analyze, text or "", company_name or "")
+                    for text, company_name in zip(texts["text"], texts["company_name"])
+                ],
+            )
+        recomputed[name] = stored
+        if stale:
+            logger.info(f"Recomputed {stored} {name} rows ({versions[name]})")
+        if stored < len(stale):
+            logger.warning(
+                f"{name} failed on {len(stale) - stored} rows; left stale for a retry"
+            )
+    return recomputed
+
+
+def _analyze(analyze: Analyzer, text: str, company_name: str) -> Optional[dict]:
+    try:
+        return analyze(text, company_name)
+    except Exception as e:
+        logger.warning(f"Analyzer failed: {type(e).__name__}: {e}")
+        return None
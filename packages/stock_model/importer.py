@@ -0,0 +1,203 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Set
+
+import pandas as pd
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+
+from stock_model.logger import get_logger
+
+logger = get_logger(__name__)
+
+_DUPLICATE_KEY = 11000
+
+EVENT_COLUMNS = [
+    "event_id",
+    "occurred_at",
+    "aggregate_id",
+    "version",
+    "type",
+    "url",
+    "news_id",
+    "title",
+    "date",
+    "feeling",
+]
+NEWS_COLUMNS = ["_id", "date", "ticker", "title", "url", "feeling"]
+
+
+def _utc(series: pd.Series) -> list:
+    """ISO-8601 strings as naive UTC datetimes in milliseconds (BSON precision)."""
+    parsed = pd.to_datetime(series, utc=True, format="ISO8601")
+    return parsed.dt.tz_localize(None).dt.floor("ms").dt.to_pydatetime().tolist()
+
+
+def _with_ints(df: pd.DataFrame, columns: List[str], id_column: str) -> pd.DataFrame:
+    """*df* with *columns* as ints; rows where any is empty or not an integer
+    are logged and dropped."""
+    values = {c: pd.to_numeric(df[c], errors="coerce") for c in columns}
+    valid = pd.Series(True, index=df.index)
+    for v in values.values():
+        valid &= v.notna() & (v % 1 == 0)
+    if not valid.all():
+        bad = df.loc[~valid, id_column].tolist()
+        logger.warning(
+            "Skipping %d rows with an invalid %s: %s%s",
+            len(bad),
+            "/".join(columns),
+            ", ".join(map(str, bad[:5])),
+            ", ..." if len(bad) > 5 else "",
+        )
+    return df[valid].assign(**{c: v[valid].astype(int) for c, v in values.items()})
+
+
+def news_documents(df: pd.DataFrame) -> List[dict]:
+    """Read-model documents for a chunk of ``news_to_import_*.csv``."""
+    df = _with_ints(df.drop_duplicates("_id"), ["feeling"], "_id")
+    return [
+        {
+            "_id": news_id,
+            "date": date,
+            "ticker": ticker,
+            "title": title,
+            "url": url,
+            "feeling": feeling,
+        }
+        for news_id, date, ticker, title, url, feeling in zip(
+            df["_id"].tolist(),
+            _utc(df["date"]),
+            df["ticker"].tolist(),
+            df["title"].tolist(),
+            df["url"].tolist(),
+            df["feeling"].tolist(),
+        )
+    ]
+
+
+def event_documents(df: pd.DataFrame) -> List[dict]:
+    """Event store documents for a chunk of ``events_to_import_*.csv``.
+
+    The event id doubles as ``_id``, so re-imported events are rejected by
+    the always-present ``_id`` index instead of needing one of their own.
+    """
+    df = _with_ints(df.drop_duplicates("event_id"), ["version", "feeling"], "event_id")
+    return [
+        {
+            "_id": event_id,
+            "event_id": event_id,
+            "occurred_at": occurred_at,
+            "aggregate_id": aggregate_id,
+            "version": version,
+            "type": event_type,
+            "payload": {
+                "url": url,
+                "news_id": news_id,
+                "title": title,
+                "date": date,
+                "feeling": feeling,
+            },
+        }
+        for (
+            event_id,
+            occurred_at,
+            aggregate_id,
+            version,
+            event_type,
+            url,
+            news_id,
+            title,
+            date,
+            feeling,
+        ) in zip(
+            df["event_id"].tolist(),
+            _utc(df["occurred_at"]),
+            df["aggregate_id"].tolist(),
+            df["version"].tolist(),
+            df["type"].tolist(),
+            df["url"].tolist(),
+            df["news_id"].tolist(),
+            df["title"].tolist(),
+            _utc(df["date"]),
+            df["feeling"].tolist(),
+        )
+    ]
+
+
+def read_documents(
+    path: str,
+    columns: List[str],
+    to_documents: Callable[[pd.DataFrame], List[dict]],
+    chunksize: int,
+) -> Iterator[List[dict]]:
+    """Stream *path* as lists of at most *chunksize* documents."""
+    for chunk in pd.read_csv(
+        path, usecols=columns, chunksize=chunksize, keep_default_na=False
+    ):
+        yield to_documents(chunk)
+
+
+def _is_id_collision(error: dict) -> bool:
+    key_pattern = error.get("keyPattern")
+    if key_pattern is not None:
+        return list(key_pattern) == ["_id"]
+    return "index: _id_ " in error.get("errmsg", "")
+
+
+def _insert(coll: Collection, docs: List[dict]) -> Dict[str, int]:
+    try:
+        inserted = len(coll.insert_many(docs, ordered=False).inserted_ids)
+        return {"inserted": inserted, "duplicates": 0, "conflicts": 0}
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors", [])
+        if any(err.get("code") != _DUPLICATE_KEY for err in errors):
+            raise
+        # an already imported document collides on _id; any other unique key
+        # (aggregate_version) means a different document holds its place
+        conflicts = [err for err in errors if not _is_id_collision(err)]
+        for err in conflicts[:5]:
+            logger.error("%s: conflicting document: %s", coll.name, err.get("errmsg"))
+        return {
+            "inserted": e.details["nInserted"],
+            "duplicates": len(errors) - len(conflicts),
+            "conflicts": len(conflicts),
+        }
+
+
+def bulk_insert(
+    coll: Collection, batches: Iterable[List[dict]], workers: int = 4
+) -> Dict[str, int]:
+    """Insert *batches* with unordered ``insert_many`` calls on *workers* threads.
+
+    Documents whose ``_id`` is already stored are counted as duplicates and
+    skipped, so an interrupted import can simply be run again. Documents
+    rejected by another unique index (an event version already taken by a
+    different event) are counted as conflicts; the caller must treat those
+    as a failed import. At most ``2 * workers`` batches are held in memory at
+    a time.
+    """
+    counts = {"inserted": 0, "duplicates": 0, "conflicts": 0}
+    pending: Set[Future] = set()
+
+    def collect(done: Set[Future]) -> None:
+        for future in done:
+            for key, value in future.result().items():
+                counts[key] += value
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for docs in batches:
+            if not docs:
+                continue
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(pool.submit(_insert, coll, docs))
+        collect(wait(pending).done)
+
+    logger.info(
+        "%s: %d inserted, %d duplicates skipped, %d conflicts",
+        coll.name,
+        counts["inserted"],
+        counts["duplicates"],
+        counts["conflicts"],
+    )
+    return counts
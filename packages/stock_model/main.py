@@ -1,11 +1,16 @@
 import argparse
 import sys
 from stock_model.logger import get_logger
+from stock_model.cli.convert_model import main as convert_model
+from stock_model.cli.distill_model import main as distill_model
 from stock_model.cli.fetch_companies import main as fetch_companies
 from stock_model.cli.fetch_events import main as fetch_events
 from stock_model.cli.fetch_news import main as fetch_news
 from stock_model.cli.fetch_prices import main as fetch_prices
+from stock_model.cli.import_events import main as import_events
 from stock_model.cli.prepare_dataset import main as prepare_dataset
+from stock_model.cli.refresh_features import main as refresh_features
+from stock_model.cli.refresh_model import main as refresh_model
 from stock_model.cli.train_model import main as train_model
 
 logger = get_logger(__name__)
@@ -17,6 +22,14 @@ ALL_STEPS = [
     "prepare_dataset",
     "train_model",
 ]
+# Steps that can be requested explicitly but are not part of the default run
+EXTRA_STEPS = [
+    "refresh_model",
+    "convert_model",
+    "refresh_features",
+    "distill_model",
+    "import_events",
+]
 
 
 def main():
@@ -27,7 +40,7 @@ def main():
     args = parser.parse_args()
     steps = args.steps.split(",")
     for s in steps:
-        if s not in ALL_STEPS:
+        if s not in ALL_STEPS + EXTRA_STEPS:
             logger.error(f"Unknown step: {s}")
             sys.exit(1)
     if "fetch_companies" in steps:
@@ -42,6 +55,16 @@ def main():
         prepare_dataset()
     if "train_model" in steps:
         train_model()
+    if "refresh_model" in steps:
+        refresh_model()
+    if "convert_model" in steps:
+        convert_model()
+    if "refresh_features" in steps:
+        refresh_features()
+    if "distill_model" in steps:
+        distill_model()
+    if "import_events" in steps:
+        import_events()
 
 
 if __name__ == "__main__":
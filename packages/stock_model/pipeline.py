@@ -1,4 +1,3 @@
-import joblib
 import glob
 import numpy as np
 import uuid
@@ -7,9 +6,13 @@ import pandas as pd
 import requests
 
 from datetime import timedelta, datetime
+from libs.analyzer_versions import analyzer_versions
+from libs.dates import to_iso_utc
 from libs.feature_builder import build_feature_row, row_to_dataframe
+from libs.model_artefact import load_model
 from stock_model.logger import get_logger
 from stock_model.data_manager import ensure_dir_exists
+from stock_model.feature_store import FeatureStore, refresh_features
 from stock_model.fetchers.yfinance_fetcher import YFinanceFetcher
 from stock_model.fetchers.gdelt_fetcher import GdeltFetcher
 from libs.textblob_analyzer import TextBlobAnalyzer
@@ -33,10 +36,7 @@ NASDAQ100 = [
 
 class JoblibPredictionModel:
     def __init__(self, model_path: str):
-        artefact = joblib.load(model_path)
-        self._booster = artefact["model"]
-        self._scaler = artefact["scaler"]
-        self._columns = artefact["columns"]
+        self._booster, self._scaler, self._columns, _ = load_model(model_path)
 
         self._tb = TextBlobAnalyzer()
         self._fb = FinBertAnalyzer()
@@ -122,7 +122,7 @@ def export_events_and_news_to_csv(
     # 2) Initialise helpers
     # ------------------------------------------------------------------ #
     session = requests.Session()
-    model = JoblibPredictionModel("models/stock_model.joblib")
+    model = JoblibPredictionModel("models/stock_model")
     gd = GdeltFetcher(session=session)
     news_scraper = NewspaperScraper()
 
@@ -163,6 +163,8 @@ def export_events_and_news_to_csv(
             ),
             axis=1,
         )
+        # canonical ISO-8601 UTC, the same instant the API stores as a datetime
+        df["date"] = df["date"].map(to_iso_utc)
 
         # -------------------------------------------------------------- #
         # 3c)  save NEWS slice
@@ -180,7 +182,7 @@ def export_events_and_news_to_csv(
         # 3d)  build & save EVENTS slice
         # -------------------------------------------------------------- #
         n_rows = len(df)
-        now_iso = datetime.utcnow().isoformat(timespec="seconds")
+        now_iso = to_iso_utc(datetime.utcnow())
         versions = np.arange(version_counter, version_counter + n_rows)
         version_counter += n_rows
 
@@ -211,7 +213,26 @@ def export_events_and_news_to_csv(
     logger.info("Saved events CSV: %s", events_path)
 
 
-def analyze_and_save(company: dict, start: str, end: str, outdir: str):
+def store_analyzers(
+    tb: TextBlobAnalyzer, fb: FinBertAnalyzer, sp: SpacySimilarityAnalyzer
+) -> dict:
+    """Analyzer callables in the shape expected by ``refresh_features``."""
+    return {
+        "textblob": lambda text, _: tb.analyze(text),
+        "finbert": lambda text, _: fb.analyze_probabilities(text),
+        "spacy": lambda text, name: {
+            "spacy_similarity": sp.compute_similarity(text, name)
+        },
+    }
+
+
+def analyze_and_save(
+    company: dict,
+    start: str,
+    end: str,
+    outdir: str,
+    store: FeatureStore | None = None,
+):
     ensure_dir_exists(outdir)
 
     outfile = os.path.join(outdir, f"historical_news_{company['ticker']}.csv")
@@ -243,6 +264,31 @@ def analyze_and_save(company: dict, start: str, end: str, outdir: str):
             return text or row.get("title", "") or ""
 
         df["text"] = df.apply(get_text, axis=1)
+
+        if store is not None:
+            # Raw outputs go through the feature store; only articles without a
+            # current-version output are analyzed.
+            df["news_id"] = df.apply(
+                lambda r: make_deterministic_id(
+                    company["ticker"], r["date"], r["title"], r["url"]
+                ),
+                axis=1,
+            )
+            df["company_name"] = company["name"]
+            store.upsert_news(df)
+            news_ids = df["news_id"].drop_duplicates().tolist()
+            refresh_features(
+                store, store_analyzers(tb, fb, sp), analyzer_versions(), news_ids
+            )
+            store.to_frame(news_ids).to_csv(
+                outfile,
+                index=False,
+                mode="w" if first_chunk else "a",
+                header=first_chunk,
+            )
+            first_chunk = False
+            continue
+
         df.drop(columns=["url", "title"], inplace=True)
 
         # TextBlob
@@ -0,0 +1,107 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from stock_model.data_manager import ensure_dir_exists
+from stock_model.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Article bodies are drawn from this pool so that very large frames share the
+# same string objects instead of allocating one per row.
+TEXT_POOL = [
+    "Shares rallied after the company beat quarterly earnings expectations.",
+    "The stock slipped as analysts cut their price targets for next year.",
+    "Management reaffirmed guidance and announced a new buyback programme.",
+    "Regulators opened an investigation into the company's pricing practices.",
+    "The firm unveiled a new product line at its annual developer event.",
+    "Revenue growth slowed compared with the same quarter last year.",
+    "Investors cheered a surprise dividend increase.",
+    "Supply chain issues are expected to weigh on margins.",
+    # Yahoo placeholders removed by feature_engineer.engineer
+    "We're unable to load stories right now.",
+    "Sign in to access your portfolio",
+]
+
+FINBERT_LABELS = np.array(["Positive", "Negative", "Neutral"])
+
+
+def _tickers(n_tickers: int) -> list[str]:
+    return [f"T{i:04d}" for i in range(n_tickers)]
+
+
+def make_prices(
+    n_tickers: int = 50, n_days: int = 500, seed: int = 42, start: str = "2024-01-01"
+) -> pd.DataFrame:
+    """Daily random-walk prices with columns: date, open, close, ticker."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start=start, periods=n_days)
+
+    returns = rng.normal(0.0, 0.015, size=(n_tickers, n_days))
+    close = 100.0 * np.exp(np.cumsum(returns, axis=1))
+    open_ = close * (1 + rng.normal(0.0, 0.005, size=close.shape))
+
+    return pd.DataFrame(
+        {
+            "date": np.tile(dates.values, n_tickers),
+            "open": open_.ravel(),
+            "close": close.ravel(),
+            "ticker": np.repeat(_tickers(n_tickers), n_days),
+        }
+    )
+
+
+def make_news(
+    n_rows: int,
+    n_tickers: int = 50,
+    n_days: int = 500,
+    seed: int = 42,
+    start: str = "2024-01-01",
+) -> pd.DataFrame:
+    """News rows shaped like ``historical_news_merged.csv``.
+
+    Columns: ticker, date, text, textblob_polarity, textblob_subjectivity,
+    finbert_label, finbert_score, spacy_similarity. Dates fall on the trading
+    days produced by :func:`make_prices` with the same arguments, so both
+    frames join in ``feature_engineer.engineer``.
+    """
+    rng = np.random.default_rng(seed + 1)
+    dates = pd.bdate_range(start=start, periods=n_days)
+
+    # Leave the last day out: it has no next-day close to label against
+    day_idx = rng.integers(0, max(1, n_days - 1), size=n_rows)
+    ticker_idx = rng.integers(0, n_tickers, size=n_rows)
+    text_idx = rng.choice(
+        len(TEXT_POOL),
+        size=n_rows,
+        p=[0.12] * 8 + [0.02] * 2,
+    )
+
+    return pd.DataFrame(
+        {
+            "ticker": np.asarray(_tickers(n_tickers), dtype=object)[ticker_idx],
+            "date": dates.values[day_idx],
+            "text": np.asarray(TEXT_POOL, dtype=object)[text_idx],
+            "textblob_polarity": rng.uniform(-1.0, 1.0, size=n_rows),
+            "textblob_subjectivity": rng.uniform(0.0, 1.0, size=n_rows),
+            "finbert_label": FINBERT_LABELS[rng.integers(0, 3, size=n_rows)],
+            "finbert_score": rng.uniform(0.34, 1.0, size=n_rows),
+            "spacy_similarity": rng.uniform(0.0, 1.0, size=n_rows),
+        }
+    )
+
+
+def write_dataset(
+    outdir: str, n_rows: int, n_tickers: int = 50, n_days: int = 500, seed: int = 42
+) -> tuple[str, str]:
+    """Write synthetic news and price CSVs and return their paths."""
+    news_path = os.path.join(outdir, "synthetic_news.csv")
+    prices_path = os.path.join(outdir, "synthetic_prices.csv")
+    ensure_dir_exists(news_path)
+
+    make_prices(n_tickers, n_days, seed).to_csv(prices_path, index=False)
+    make_news(n_rows, n_tickers, n_days, seed).to_csv(news_path, index=False)
+
+    logger.info(f"Synthetic dataset written to {outdir} ({n_rows} news rows)")
+    return news_path, prices_path
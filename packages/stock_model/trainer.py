@@ -1,12 +1,21 @@
-from pathlib import Path
+import copy
+import os
+from typing import Optional
 
-import joblib
 import lightgbm as lgb
 import numpy as np
 import optuna
 import pandas as pd
-from sklearn.model_selection import StratifiedKFold
+from sklearn.model_selection import StratifiedKFold, train_test_split
 from sklearn.preprocessing import StandardScaler
+
+from libs.analyzer_versions import analyzer_versions
+from libs.model_artefact import (
+    ArrayScaler,
+    is_artefact_dir,
+    load_model,
+    save_artefact,
+)
 from stock_model.logger import get_logger
 
 logger = get_logger(__name__)
@@ -105,8 +114,141 @@ def train(data_csv: str, model_path: str, n_trials: int = 50):
         callbacks=[lgb.log_evaluation(period=100)],
     )
 
-    Path(model_path).parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(
-        {"model": booster, "scaler": scaler, "columns": X.columns.tolist()}, model_path
-    )
+    save_artefact(model_path, booster, scaler, X.columns.tolist())
     logger.info(f"Model saved → {model_path}")
+
+
+# Parameters that would override ``num_boost_round`` when continuing a booster.
+_ROUND_ALIASES = (
+    "num_iterations",
+    "num_iteration",
+    "n_iter",
+    "num_tree",
+    "num_trees",
+    "num_round",
+    "num_rounds",
+    "nrounds",
+    "num_boost_round",
+    "n_estimators",
+    "max_iter",
+)
+
+
+def refresh(
+    data_csv: str,
+    model_path: str,
+    num_boost_round: int = 200,
+    holdout_size: float = 0.2,
+    update_scaler: bool = False,
+    tolerance: float = 0.0,
+    out_dir: Optional[str] = None,
+    min_gate_rows: int = 100,
+) -> bool:
+    """Continue boosting the saved model on newly labelled rows.
+
+    Loads the model at *model_path* (an artefact directory or a legacy joblib
+    file), keeps its scaler (or updates it
+    with ``partial_fit`` when *update_scaler* is set) and adds at most
+    *num_boost_round* trees trained on *data_csv*. A holdout split of the new
+    rows is halved: one half drives early stopping, the other gates the
+    result, so the gate is scored on rows the refresh never saw. The
+    refreshed model is only written back when its wMAPE there is not worse
+    than the current model's (with its original scaler) by more than
+    *tolerance* percentage points. Batches too small for a gate of
+    *min_gate_rows* rows are skipped, as a few rows would pass or fail the
+    model at random. It is written as an artefact directory,
+    to *out_dir* or in place (next to a joblib file, without its suffix).
+    Returns ``True`` if the model was written.
+    """
+    logger.info(f"Refreshing model {model_path} with {data_csv} ...")
+    booster, scaler, columns, manifest = load_model(model_path)
+    if out_dir is None:
+        out_dir = (
+            model_path
+            if is_artefact_dir(model_path)
+            else os.path.splitext(model_path)[0]
+        )
+
+    df = pd.read_csv(data_csv)
+    X = df[columns]
+    y = df["target"].astype(int)
+
+    gate_rows = int(len(df) * holdout_size / 2)
+    if gate_rows < min_gate_rows:
+        logger.warning(
+            f"Only {len(df)} new rows: a {holdout_size:.0%} holdout leaves "
+            f"{gate_rows} gate rows (< {min_gate_rows}); keeping current model"
+        )
+        return False
+
+    X_tr, X_val, y_tr, y_val = train_test_split(
+        X, y, test_size=holdout_size, random_state=42
+    )
+    X_val, X_gate, y_val, y_gate = train_test_split(
+        X_val, y_val, test_size=0.5, random_state=42
+    )
+
+    # The current model is scored as deployed, with the scaler it was saved with
+    baseline = wmape(
+        y_gate.to_numpy(),
+        np.rint(
+            booster.predict(pd.DataFrame(scaler.transform(X_gate), columns=columns))
+        ),
+    )
+
+    if update_scaler:
+        # Trees already in the booster were fitted on the old scaling, so only
+        # enable this when the new data is expected to drift slowly.
+        if isinstance(scaler, ArrayScaler):
+            scaler = scaler.to_standard_scaler(columns)
+        else:
+            scaler = copy.deepcopy(scaler)
+        scaler.partial_fit(X_tr)
+
+    X_tr_scaled = pd.DataFrame(scaler.transform(X_tr), columns=columns)
+    X_val_scaled = pd.DataFrame(scaler.transform(X_val), columns=columns)
+    X_gate_scaled = pd.DataFrame(scaler.transform(X_gate), columns=columns)
+
+    params = {
+        **{k: v for k, v in booster.params.items() if k not in _ROUND_ALIASES},
+        "metric": "None",  # early stopping on the custom wMAPE only
+    }
+    refreshed = lgb.train(
+        params,
+        lgb.Dataset(X_tr_scaled, y_tr, weight=_weights(y_tr)),
+        num_boost_round=num_boost_round,
+        init_model=booster,
+        valid_sets=[
+            lgb.Dataset(X_val_scaled, y_val, weight=_weights(y_val)),
+        ],
+        callbacks=[
+            lgb.early_stopping(50, verbose=False),
+            lgb.log_evaluation(period=0),
+        ],
+        feval=lgbm_wmape,
+    )
+    if refreshed.best_iteration > 0:
+        refreshed = refreshed.model_from_string(
+            refreshed.model_to_string(num_iteration=refreshed.best_iteration)
+        )
+
+    score = wmape(y_gate.to_numpy(), np.rint(refreshed.predict(X_gate_scaled)))
+    logger.info(
+        f"Holdout wMAPE: current {baseline:.3f}% → refreshed {score:.3f}% "
+        f"({refreshed.current_iteration() - booster.current_iteration()} new trees)"
+    )
+
+    if score > baseline + tolerance:
+        logger.warning("Refreshed model is worse on the holdout; keeping current one")
+        return False
+
+    # New trees do not change which analyzer versions the model depends on;
+    # a legacy pickle's are unknown
+    versions = (
+        manifest["analyzer_versions"]
+        if manifest is not None
+        else {name: None for name in analyzer_versions()}
+    )
+    save_artefact(out_dir, refreshed, scaler, columns, versions)
+    logger.info(f"Model refreshed → {out_dir}")
+    return True